@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark constructing a Plasma: legacy vs. vectorized ``set_data``.
+
+Reports wall time and peak traced memory for conforming the raw data, i.e.
+selecting the plasma columns, calculating the scalar thermal speed, and sorting
+the columns. Run with ``python benchmarks/plasma_set_data.py [n_rows ...]``.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from solarwindpy import plasma  # noqa: E402
+
+SPECIES = ("a", "p1", "p2")
+
+
+def make_data(n_rows, species=SPECIES, seed=42):
+    """Synthetic raw plasma data with unsorted columns and extra quantities."""
+    rng = np.random.default_rng(seed)
+    columns = [("b", c, "") for c in "xyz"]
+    for s in species:
+        columns.append(("n", "", s))
+        columns.extend(("v", c, s) for c in "xyz")
+        columns.extend(("w", c, s) for c in ("par", "per"))
+        # Not kept by the plasma.
+        columns.append(("chisq", "", s))
+    columns = [columns[i] for i in rng.permutation(len(columns))]
+
+    epoch = pd.date_range("2000-01-01", periods=n_rows, freq="s", name="epoch")
+    values = rng.uniform(1.0, 100.0, size=(n_rows, len(columns)))
+    data = pd.DataFrame(values, index=epoch)
+    data.columns = pd.MultiIndex.from_tuples(columns, names=["M", "C", "S"])
+    return data
+
+
+def legacy_conform(new, species):
+    """``Plasma.set_data`` column handling prior to the vectorized rewrite."""
+    new = new.reorder_levels(["M", "C", "S"], axis=1).sort_index(axis=1)
+    tk_plasma = pd.IndexSlice[
+        ["b", "n", "v", "w"],
+        ["", "x", "y", "z", "per", "par"],
+        list(species) + [""],
+    ]
+    data = new.loc[:, tk_plasma].sort_index(axis=1)
+    data = data.loc[:, ~data.columns.duplicated()]
+
+    coeff = pd.Series({"per": 2.0, "par": 1.0}) / 3.0
+    w = (
+        data.loc[:, pd.IndexSlice["w", ["par", "per"]]]
+        .pow(2)
+        .multiply(coeff, axis=1, level="C")
+    )
+    w = w.T.groupby("S").sum().T.pow(0.5)
+    w.columns = w.columns.to_series().apply(lambda x: ("w", "scalar", x))
+    w.columns = pd.MultiIndex.from_tuples(w.columns, names=["M", "C", "S"])
+
+    data = pd.concat([data, w], axis=1, sort=False).sort_index(axis=1)
+    data.columns = pd.MultiIndex.from_tuples(data.columns, names=["M", "C", "S"])
+    return data.sort_index(axis=1)
+
+
+def vectorized_conform(new, species):
+    """The current ``Plasma._conform_data``."""
+    plas = plasma.Plasma.__new__(plasma.Plasma)
+    plas._species = tuple(species)
+    return plas._conform_data(new)[0]
+
+
+def measure(func, *args):
+    """Wall time [s] and peak traced memory [MiB] of ``func(*args)``."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    out = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, elapsed, peak / 2**20
+
+
+def benchmark(n_rows):
+    """Compare both implementations on ``n_rows`` rows."""
+    data = make_data(n_rows)
+    print(f"\n{n_rows:,} rows, input {data.memory_usage().sum() / 2**20:.1f} MiB")
+
+    legacy, t_legacy, m_legacy = measure(legacy_conform, data, SPECIES)
+    fast, t_fast, m_fast = measure(vectorized_conform, data, SPECIES)
+
+    pd.testing.assert_frame_equal(legacy, fast)
+    print(f"  {'':<12}{'time [s]':>10}{'peak [MiB]':>12}")
+    print(f"  {'legacy':<12}{t_legacy:>10.3f}{m_legacy:>12.1f}")
+    print(f"  {'vectorized':<12}{t_fast:>10.3f}{m_fast:>12.1f}")
+    print(f"  speedup {t_legacy / t_fast:.1f}x, memory {m_legacy / m_fast:.1f}x lower")
+    return t_legacy, t_fast, m_legacy, m_fast
+
+
+if __name__ == "__main__":
+    sizes = [int(x) for x in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for n in sizes:
+        benchmark(n)
@@ -4,10 +4,14 @@ from .base import Base, Core
 from .vector import Vector
 from .tensor import Tensor
 from .ions import Ion
+from .storage import ColumnarStorage
+from .quantity_cache import QuantityCache
+from .shared import SharedPlasmaHandle
 from .plasma import Plasma
+from .dask_plasma import DaskPlasma
 from .spacecraft import Spacecraft
 from .units_constants import Units, Constants
-from .alfvenic_turbulence import AlfvenicTurbulence
+from .alfvenic_turbulence import AlfvenicTurbulence, StreamingAlfvenicTurbulence
 from .abundances import ReferenceAbundances, Abundance
 
 __all__ = [
@@ -16,11 +20,16 @@ __all__ = [
     "Vector",
     "Tensor",
     "Ion",
+    "ColumnarStorage",
+    "QuantityCache",
+    "SharedPlasmaHandle",
     "Plasma",
+    "DaskPlasma",
     "Spacecraft",
     "Units",
     "Constants",
     "AlfvenicTurbulence",
+    "StreamingAlfvenicTurbulence",
     "ReferenceAbundances",
     "Abundance",
 ]
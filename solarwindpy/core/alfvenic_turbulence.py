@@ -18,19 +18,26 @@ References
     *Astrophys. J.*, 856, 49.
 """
 
-
 import numpy as np
 import pandas as pd
 
-from collections import namedtuple
+from collections import deque, namedtuple
 
 # We rely on views via DataFrame.xs to reduce memory size and do not
 # `.copy(deep=True)`, so we want to make sure that this doesn't
 # accidentally cause a problem.
 
 from . import base
+from . import frames
+from . import multiscale
+from . import spectra
+from . import structure_functions
 
 AlvenicTurbAveraging = namedtuple("AlvenicTurbAveraging", "window,min_periods")
+AlfvenicTurbState = namedtuple(
+    "AlfvenicTurbState",
+    "time,e_plus,e_minus,kinetic_energy,magnetic_energy,sigma_c,sigma_r,rE,rA",
+)
 
 
 class AlfvenicTurbulence(base.Core):
@@ -292,6 +299,147 @@ class AlfvenicTurbulence(base.Core):
         r"""Shortcut to :py:attr:`elsasser_ratio`."""
         return self.elsasser_ratio
 
+    def scales(self, windows, min_periods=None, n_jobs=1):
+        r"""Turbulence diagnostics for several averaging windows at once.
+
+        Fluctuations are taken about rolling means of :py:attr:`measurements`
+        computed from one set of cumulative sums, so each window costs
+        :math:`O(N)` and reuses the Alfv\'en unit conversion done here.
+
+        Parameters
+        ----------
+        windows : iterable of int, str, or pd.Timedelta
+            Averaging windows, e.g. ``["5min", "15min", "1h", "6h"]``.
+        min_periods : int, optional
+            Minimum number of measurements in each average. Defaults to the
+            value in :py:attr:`averaging_info`.
+        n_jobs : int
+            Number of threads processing windows. -1 uses all CPUs.
+
+        Returns
+        -------
+        panel : pd.DataFrame
+            :py:attr:`sigma_c`, :py:attr:`sigma_r`, :py:attr:`rE`, and
+            :py:attr:`rA` for each window, with ``("window", "M")`` columns.
+
+        See Also
+        --------
+        solarwindpy.core.multiscale.alfvenic_scales
+        """
+        if min_periods is None:
+            min_periods = self.averaging_info.min_periods
+
+        xyz = ["x", "y", "z"]
+        data = self.measurements
+        polarity = self.polarity
+        if polarity is not None:
+            polarity = polarity.to_numpy(dtype=float)
+
+        return multiscale.alfvenic_scales(
+            data.loc[:, "v"].loc[:, xyz].to_numpy(dtype=float),
+            data.loc[:, "b"].loc[:, xyz].to_numpy(dtype=float),
+            data.index,
+            windows,
+            min_periods=min_periods,
+            polarity=polarity,
+            n_jobs=n_jobs,
+        )
+
+    def spectra(self, nperseg, method="welch", n_jobs=1, **kwargs):
+        r"""Power spectra of :math:`z^\pm`, :math:`v`, and :math:`b`.
+
+        Spectra are calculated from :py:attr:`measurements`, which are
+        detrended per segment, rather than the rolling-mean subtracted
+        :py:attr:`data`.
+
+        Parameters
+        ----------
+        nperseg : int
+            Samples per segment.
+        method : {"welch", "wavelet"}
+            Welch-averaged periodograms or time-averaged Morlet scalograms.
+        n_jobs : int
+            Number of threads processing segments. -1 uses all CPUs.
+        kwargs :
+            Passed to :py:func:`solarwindpy.core.spectra.elsasser_spectra`,
+            e.g. `cadence`, `max_gap`, `noverlap`, or `frequencies`.
+
+        Returns
+        -------
+        spectra : pd.DataFrame
+            Energy spectral densities with :math:`\sigma_c(f)` and
+            :math:`\sigma_r(f)`, indexed by frequency.
+
+        See Also
+        --------
+        solarwindpy.core.spectra.elsasser_spectra
+        """
+        xyz = ["x", "y", "z"]
+        data = self.measurements
+        polarity = self.polarity
+        if polarity is not None:
+            polarity = polarity.to_numpy(dtype=float)
+
+        return spectra.elsasser_spectra(
+            data.loc[:, "v"].loc[:, xyz].to_numpy(dtype=float),
+            data.loc[:, "b"].loc[:, xyz].to_numpy(dtype=float),
+            data.index,
+            nperseg,
+            method=method,
+            polarity=polarity,
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+
+    def structure_functions(self, lags, orders=None, chunksize=65536, n_jobs=1):
+        r"""Structure functions of :math:`z^\pm`, :math:`v`, and :math:`b`.
+
+        Increments are taken from :py:attr:`measurements`, with the magnetic
+        field rectified by :py:attr:`polarity`, rather than the rolling-mean
+        subtracted :py:attr:`data`.
+
+        Parameters
+        ----------
+        lags : iterable of int
+            Lags in rows of :py:attr:`measurements`.
+        orders : iterable of number, optional
+            Orders of the structure functions. Defaults to 2 through 6.
+        chunksize : int
+            Increments calculated at once for each lag.
+        n_jobs : int
+            Number of threads processing lags. -1 uses all CPUs.
+
+        Returns
+        -------
+        sf : pd.DataFrame
+            Structure functions, kurtosis, and number of increments indexed
+            by lag with ``("M", "order")`` columns for "zp", "zm", "v", and
+            "b".
+
+        See Also
+        --------
+        solarwindpy.core.structure_functions.structure_functions
+        solarwindpy.core.structure_functions.scaling_exponents
+        """
+        if orders is None:
+            orders = structure_functions.ORDERS
+
+        xyz = ["x", "y", "z"]
+        data = self.measurements
+        v = data.loc[:, "v"].loc[:, xyz].to_numpy(dtype=float)
+        b = data.loc[:, "b"].loc[:, xyz].to_numpy(dtype=float)
+        polarity = self.polarity
+        if polarity is not None:
+            b = b * polarity.to_numpy(dtype=float)[:, None]
+
+        return structure_functions.structure_functions(
+            {"zp": v + b, "zm": v - b, "v": v, "b": b},
+            lags,
+            orders=orders,
+            chunksize=chunksize,
+            n_jobs=n_jobs,
+        )
+
     def set_data(
         self,
         v_in,
@@ -379,35 +527,30 @@ unexpected."""
             #             # Drop normal component
             #             data = data.drop("z", axis=1, level="C").copy(deep=True)
 
-            # Convert GSE -> RTN
-            data = data.multiply(
-                pd.Series({"x": -1, "y": -1, "z": 1}), axis=1, level="C"
-            )
+            # Rotate the spacecraft frame into RTN at the spacecraft.
+            pos = sc_vector.position.data.reindex(data.index)
+            pos = pos.to_numpy(dtype=float)
+            epoch = data.index
+            for m in ("v", "b"):
+                cols = [(m, c) for c in ("x", "y", "z")]
+                data.loc[:, cols] = frames.transform(
+                    data.loc[:, cols].to_numpy(dtype=float),
+                    sc_vector.frame,
+                    "RTN",
+                    epoch,
+                    position=pos,
+                    position_frame=sc_vector.frame,
+                )
 
             # Project along nominal Parker Spiral
             omega = 2.865e-6  # rad/s
-            pos = sc_vector.data.pos.copy(deep=True)
-            r_rtn = (
-                pos.loc[:, ["x", "y", "z"]]
-                .pow(2)
-                .sum(axis=1, skipna=False)
-                .pipe(np.sqrt)
-            )
-            rho_rtn = (
-                pos.loc[:, ["x", "y"]].pow(2).sum(axis=1, skipna=False).pipe(np.sqrt)
-            )
-            cos_colat = rho_rtn.divide(r_rtn)
-            #             cos_colat = 1
-
-            r = sc_vector.distance2sun * sc_vector.units.distance2sun * 1e-3  # [km]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cos_colat = np.hypot(pos[:, 0], pos[:, 1]) / np.linalg.norm(pos, axis=1)
+            r = sc_vector.distance2sun.reindex(data.index).to_numpy()
+            r = r * sc_vector.units.distance2sun * 1e-3  # [km]
 
-            correction = r.multiply(cos_colat, axis=0).multiply(
-                omega
-            )  # [arc length speed] = [km/s]
-            vt = data.loc[:, ("v", "y")].subtract(correction)
-            data.loc[:, ("v", "y")] = vt
-            #             vy = data.loc[:, ("v", "y")].add(correction)
-            #             data.loc[:, ("v", "y")] = vy
+            # [arc length speed] = [km/s]
+            data.loc[:, ("v", "y")] -= r * cos_colat * omega
 
             polarity = (
                 data.loc[:, "v"]
@@ -424,6 +567,11 @@ unexpected."""
         agged = rolled.agg("mean")
         deltas = data.subtract(agged, axis=1)
 
+        self._set_measurements(data, deltas, species, window, min_periods, polarity)
+
+    def _set_measurements(
+        self, data, deltas, species, window, min_periods, polarity=None
+    ):
         data.name = "measurements"
         deltas.name = "deltas"
 
@@ -433,6 +581,105 @@ unexpected."""
         self._species = species
         self._averaging_info = AlvenicTurbAveraging(window, min_periods)
 
+    @classmethod
+    def batch(cls, bfield, velocities, densities, species, panel=False, **kwargs):
+        r"""Build :py:class:`AlfvenicTurbulence` for many species at once.
+
+        The magnetic field is converted to Alfv\'en units and averaged once
+        per mass density, and each velocity is averaged once, regardless of
+        the number of species sharing them. Each result equals the instance
+        built from the same inputs by :py:meth:`set_data`.
+
+        Parameters
+        ----------
+        bfield : pd.DataFrame
+            Vector magnetic field measurements.
+        velocities : dict
+            Maps keys to vector velocity measurements.
+        densities : dict
+            Maps keys to mass density measurements.
+        species : dict
+            Maps species strings to their ``(velocity key, density key)``.
+        panel : bool
+            If True, return :py:attr:`sigma_c`, :py:attr:`sigma_r`,
+            :py:attr:`rE`, and :py:attr:`rA` for every species in one
+            pd.DataFrame with ``("S", "M")`` columns.
+        kwargs :
+            Passed to `rolling`, as in :py:meth:`set_data`. The
+            `raffaella_version` polarity correction is not supported, so
+            `raffaella_version` and `sc_vector` raise a ValueError.
+
+        Returns
+        -------
+        turbulence : dict or pd.DataFrame
+            :py:class:`AlfvenicTurbulence` instances keyed by species, or the
+            combined panel.
+        """
+        unsupported = sorted({"raffaella_version", "sc_vector"}.intersection(kwargs))
+        if unsupported:
+            msg = "Batches do not support %s. Use `set_data` for each species."
+            raise ValueError(msg % ", ".join(unsupported))
+        if not isinstance(bfield.index, pd.DatetimeIndex):
+            raise TypeError
+        for x in (*velocities.values(), *densities.values()):
+            if not bfield.index.equals(x.index):
+                raise ValueError("Batches require identically indexed inputs.")
+
+        window = kwargs.pop("window", "15min")
+        min_periods = kwargs.pop("min_periods", 5)
+
+        def average(frame):
+            rolled = frame.rolling(window, min_periods=min_periods, **kwargs)
+            return rolled.agg("mean")
+
+        b_alfven = {}
+        v_averaged = {}
+        out = {}
+        for label, (vkey, rkey) in species.items():
+            turb = cls.__new__(cls)
+            base.Core.__init__(turb)
+            cleaned = turb._clean_species_for_setting(label)
+
+            if rkey not in b_alfven:
+                coef = turb.units.b / (  # Convert b -> Alfven units.
+                    np.sqrt(turb.units.rho * turb.constants.misc.mu0) * turb.units.v
+                )
+                b = bfield.divide(densities[rkey].pipe(np.sqrt), axis=0)
+                b = b.multiply(coef)
+                b_alfven[rkey] = (b, average(b))
+            if vkey not in v_averaged:
+                v = velocities[vkey]
+                v_averaged[vkey] = (v, average(v))
+
+            b, b_avg = b_alfven[rkey]
+            v, v_avg = v_averaged[vkey]
+            data = (
+                pd.concat({"v": v, "b": b}, axis=1, names=["M"], sort=True)
+                .sort_index(axis=1)
+                .copy(deep=True)
+            )
+            agged = pd.concat(
+                {"v": v_avg, "b": b_avg}, axis=1, names=["M"], sort=True
+            ).sort_index(axis=1)
+            deltas = data.subtract(agged, axis=1)
+
+            turb._set_measurements(data, deltas, cleaned, window, min_periods)
+            out[label] = turb
+
+        if not panel:
+            return out
+
+        return pd.concat(
+            {
+                label: pd.concat(
+                    {m: getattr(turb, m) for m in multiscale.QUANTITIES}, axis=1
+                )
+                for label, turb in out.items()
+            },
+            axis=1,
+            names=["S", "M"],
+        )
+
     def _clean_species_for_setting(self, species):
         if not isinstance(species, str):
             msg = "%s.species must be a single species w/ an optional `+` or `,`"
@@ -447,6 +694,157 @@ unexpected."""
         return species
 
 
+class StreamingAlfvenicTurbulence(base.Core):
+    r"""Alfv\'enic turbulence diagnostics updated one measurement at a time.
+
+    Keeps the measurements inside the trailing averaging window in a deque
+    with running sums, so each :py:meth:`update` costs :math:`O(1)` amortized.
+    Results match :py:class:`AlfvenicTurbulence` built from the same
+    measurements, row by row, to floating point precision.
+
+    Parameters
+    ----------
+    species : str
+        Species string, as for :py:class:`AlfvenicTurbulence`.
+    window : int, str, or pd.Timedelta
+        Averaging window. Time offsets cover :math:`(t - w, t]` and integers
+        the last `window` measurements.
+    min_periods : int
+        Minimum number of measurements in each average.
+
+    Notes
+    -----
+    Raffaella's version isn't available because the polarity requires the
+    spacecraft position.
+    """
+
+    def __init__(self, species, window="15min", min_periods=5):
+        super(StreamingAlfvenicTurbulence, self).__init__()
+        self._species = self._clean_species_for_setting(species)
+        if isinstance(window, (int, np.integer)):
+            if window < 1:
+                raise ValueError(f"`window` must be positive, not {window}")
+            self._span = None
+        else:
+            offset = pd.tseries.frequencies.to_offset(window)
+            self._span = pd.Timedelta(offset).value
+        self._averaging_info = AlvenicTurbAveraging(window, min_periods)
+        # Converts b -> Alfven units, see `AlfvenicTurbulence.set_data`.
+        self._coef = self.units.b / (
+            np.sqrt(self.units.rho * self.constants.misc.mu0) * self.units.v
+        )
+        self.reset()
+
+    @property
+    def species(self):
+        r"""Species defining the mass density in Alfv\'en units."""
+        return self._species
+
+    @property
+    def averaging_info(self):
+        r"""Averaging window and minimum number of measurements / average."""
+        return self._averaging_info
+
+    _clean_species_for_setting = AlfvenicTurbulence._clean_species_for_setting
+
+    @property
+    def state(self):
+        r"""The latest :py:class:`AlfvenicTurbState` or None."""
+        return self._state
+
+    def __len__(self):
+        r"""Number of measurements in the current window."""
+        return len(self._buffer)
+
+    def reset(self):
+        r"""Drop all measurements."""
+        self._buffer = deque()
+        self._sums = np.zeros(6)
+        self._counts = np.zeros(6, dtype=np.int64)
+        self._evicted = 0
+        self._last = None
+        self._state = None
+
+    def _evict(self, t):
+        buffer = self._buffer
+        window = self.averaging_info.window
+        while buffer and (
+            len(buffer) > window
+            if self._span is None
+            else buffer[0][0] <= t - self._span
+        ):
+            _, values, valid = buffer.popleft()
+            self._sums -= values
+            self._counts -= valid
+            self._evicted += 1
+
+        if self._evicted >= len(buffer):
+            # Re-sum the window to keep round-off from accumulating.
+            self._evicted = 0
+            if buffer:
+                self._sums = np.sum([x[1] for x in buffer], axis=0)
+            else:
+                self._sums[:] = 0.0
+
+    def update(self, v, b, rho, t):
+        r"""Add one measurement and return the diagnostics at time `t`.
+
+        Parameters
+        ----------
+        v, b : array-like
+            Velocity and magnetic field vectors, in the units of
+            :py:class:`AlfvenicTurbulence`.
+        rho : float
+            Mass density.
+        t : pd.Timestamp, datetime, or np.datetime64
+            Time of the measurement. Times can't decrease.
+
+        Returns
+        -------
+        state : :py:class:`AlfvenicTurbState`
+        """
+        t_ns = pd.Timestamp(t).value
+        if self._last is not None and t_ns < self._last:
+            raise ValueError("Times must be sorted. %s is before the last update." % t)
+        self._last = t_ns
+
+        b = np.asarray(b, dtype=float) * (self._coef / np.sqrt(rho))
+        x = np.concatenate([np.asarray(v, dtype=float), b])
+        valid = np.isfinite(x)
+        values = np.where(valid, x, 0.0)
+
+        self._buffer.append((t_ns, values, valid))
+        self._sums += values
+        self._counts += valid
+        self._evict(t_ns)
+
+        counts = self._counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self._sums / counts
+        mean[counts < max(int(self.averaging_info.min_periods), 1)] = np.nan
+        delta = x - mean
+        dv, db = delta[:3], delta[3:]
+
+        ev = 0.5 * np.nansum(dv**2)
+        eb = 0.5 * np.nansum(db**2)
+        ep = 0.5 * np.nansum((dv + db) ** 2)
+        em = 0.5 * np.nansum((dv - db) ** 2)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            state = AlfvenicTurbState(
+                pd.Timestamp(t),
+                ep,
+                em,
+                ev,
+                eb,
+                np.float64(ep - em) / (ep + em),
+                np.float64(ev - eb) / (ev + eb),
+                np.float64(em) / ep,
+                np.float64(ev) / eb,
+            )
+        self._state = state
+        return state
+
+
 # lass AlfvenicTurbulenceDAmicis(base.Core):
 #     r"""Handle and calculate Alfvenic turbulence quantities using the Elsasser
 #     variables following R D'Amicis' email (20240214).
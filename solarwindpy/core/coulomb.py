@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+r"""Vectorized Coulomb collision rates between all pairs of ion species.
+
+:py:meth:`~solarwindpy.core.plasma.Plasma.lnlambda`,
+:py:meth:`~solarwindpy.core.plasma.Plasma.nuc`, and
+:py:meth:`~solarwindpy.core.plasma.Plasma.nc` calculate a single species pair.
+The functions here broadcast over ``(time, species, species)`` arrays so that
+every pair is calculated at once from a single gather of the number densities,
+thermal speeds, and velocities. Rows are processed in chunks, optionally in
+parallel threads, so that the ``(chunk, species, species, 3)`` drift velocity
+temporaries stay small. NumPy and SciPy release the GIL inside these kernels.
+
+All inputs and outputs are in SI units.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from scipy.special import erf
+
+from . import parallel
+
+CoulombArrays = namedtuple("CoulombArrays", "lnlambda,nuc")
+
+
+def lnlambda(n, T, z, a):
+    r"""Coulomb logarithm between all species pairs.
+
+        :math:`\ln\Lambda_{ij} = 29.9 - \ln(\frac{z_i z_j (a_i + a_j)}{a_i T_j + a_j T_i} \sqrt{\frac{n_i z_i^2}{T_i} + \frac{n_j z_j^2}{T_j}})`
+
+    Parameters
+    ----------
+    n, T: np.ndarray
+        ``(time, species)`` number densities and scalar temperatures in eV.
+    z, a: np.ndarray
+        ``(species,)`` charge states and masses in amu.
+
+    Returns
+    -------
+    lnlambda: np.ndarray
+        ``(time, species, species)``.
+    """
+    ni, nj = n[:, :, None], n[:, None, :]
+    Ti, Tj = T[:, :, None], T[:, None, :]
+    zi, zj = z[:, None], z[None, :]
+    ai, aj = a[:, None], a[None, :]
+
+    left = zi * zj * (ai + aj) / (ai * Tj + aj * Ti)
+    right = np.sqrt(ni * zi**2 / Ti + nj * zj**2 / Tj)
+    return 29.9 - np.log(left * right)
+
+
+def nuc(n, rho, w, v, lnl, q, m, e0, both_species=True):
+    r"""Momentum collision rate between all species pairs following [1].
+
+    Parameters
+    ----------
+    n, rho: np.ndarray
+        ``(time, species)`` number and mass densities.
+    w: np.ndarray
+        ``(time, species)`` parallel thermal speeds.
+    v: np.ndarray
+        ``(time, species, 3)`` velocities.
+    lnl: np.ndarray
+        ``(time, species, species)`` Coulomb logarithm.
+    q, m: np.ndarray
+        ``(species,)`` charges and masses.
+    e0: float
+        Vacuum permittivity.
+    both_species: bool
+        If True, the effective two-species rate :math:`\nu_{ij} + \nu_{ji}` of
+        Eq. (23). Otherwise, the test particle rate of Eq. (18).
+
+    Returns
+    -------
+    nuc: np.ndarray
+        ``(time, species, species)`` with test species `i` along axis 1 and
+        field species `j` along axis 2. The diagonal is NaN.
+
+    References
+    ----------
+    [1] Hernández, R., & Marsch, E. (1985). Collisional time scales for
+        temperature and velocity exchange between drifting Maxwellians.
+        Journal of Geophysical Research, 90(A11), 11062.
+        <https://doi.org/10.1029/JA090iA11p11062>.
+    """
+    mi, mj = m[:, None], m[None, :]
+    mu = mi * mj / (mi + mj)
+    coeff = (q[:, None] * q[None, :]) ** 2.0 / (4.0 * np.pi * e0**2.0 * mi * mu)
+
+    wab = np.sqrt(w[:, :, None] ** 2.0 + w[:, None, :] ** 2.0)
+    dv = v[:, :, None, :] - v[:, None, :, :]
+    dv = np.sqrt(np.einsum("tijc,tijc->tij", dv, dv))
+    dvw = dv / wab
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ldr = dvw**-3.0 * (
+            erf(dvw) - dvw * (2.0 / np.sqrt(np.pi)) * np.exp(-(dvw**2.0))
+        )
+        nu = coeff * n[:, None, :] * lnl * ldr * wab**-3.0
+
+    if both_species:
+        nu = nu * (1.0 + rho[:, :, None] / rho[:, None, :])
+
+    diag = np.arange(n.shape[1])
+    nu[:, diag, diag] = np.nan
+    return nu
+
+
+def pair_rates(
+    n,
+    rho,
+    w_par,
+    w_scalar,
+    v,
+    z,
+    a,
+    q,
+    m,
+    e0,
+    kb,
+    both_species=True,
+    chunksize=100_000,
+    n_jobs=1,
+):
+    r"""Coulomb logarithm and collision rate between all species pairs.
+
+    Parameters
+    ----------
+    n, rho: np.ndarray
+        ``(time, species)`` number and mass densities.
+    w_par, w_scalar: np.ndarray
+        ``(time, species)`` parallel and scalar thermal speeds.
+    v: np.ndarray
+        ``(time, species, 3)`` velocities.
+    z, a, q, m: np.ndarray
+        ``(species,)`` charge states, masses in amu, charges, and masses.
+    e0: float
+        Vacuum permittivity.
+    kb: float
+        Boltzmann constant in J/eV, converting :math:`m w^2 / 2` to eV.
+    both_species: bool
+        See :py:func:`nuc`.
+    chunksize: int
+        Number of rows processed at once.
+    n_jobs: int
+        Number of threads processing chunks. Negative values count back from
+        the number of CPUs, so -1 uses all of them.
+
+    Returns
+    -------
+    rates: :py:class:`CoulombArrays`
+        ``(time, species, species)`` Coulomb logarithms and collision rates.
+    """
+    chunksize = int(chunksize)
+    if chunksize < 1:
+        raise ValueError(f"`chunksize` must be positive, not {chunksize}")
+
+    ntime, nspecies = n.shape
+    out_lnl = np.empty((ntime, nspecies, nspecies))
+    out_nu = np.empty((ntime, nspecies, nspecies))
+
+    def work(sl):
+        T = 0.5 * m * w_scalar[sl] ** 2.0 / kb
+        lnl = lnlambda(n[sl], T, z, a)
+        out_lnl[sl] = lnl
+        out_nu[sl] = nuc(
+            n[sl], rho[sl], w_par[sl], v[sl], lnl, q, m, e0, both_species=both_species
+        )
+
+    chunks = [slice(i, i + chunksize) for i in range(0, ntime, chunksize)]
+    parallel.map_threads(work, chunks, n_jobs)
+
+    return CoulombArrays(out_lnl, out_nu)
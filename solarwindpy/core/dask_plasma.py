@@ -0,0 +1,422 @@
+#!/usr/bin/env python
+r"""Lazy, partitioned :py:class:`~solarwindpy.core.plasma.Plasma` backed by dask.
+
+:py:class:`DaskPlasma` holds the plasma, spacecraft, and auxiliary data as
+time-partitioned :py:class:`dask.dataframe.DataFrame` objects with row-aligned
+partitions. Each derived method of :py:class:`Plasma` listed in
+:py:attr:`Plasma._computable`, e.g. :py:meth:`Plasma.beta` or
+:py:meth:`Plasma.nc`, is available with the same signature and returns a lazy
+dask object. Vectors, e.g. from :py:meth:`Plasma.velocity`, are returned as
+their component DataFrame. The method runs on a :py:class:`Plasma` built
+around each partition, which is exact because every derived quantity is local
+in time. Call ``.compute()`` on the result, or :py:func:`dask.compute` on several
+results to share the reads, to evaluate them with dask's threaded scheduler or
+``scheduler="processes"``.
+
+Data are only read when computed, so a :py:class:`DaskPlasma` read with
+:py:meth:`DaskPlasma.read_parquet` can span more data than fits in memory.
+"""
+
+import functools
+
+import pandas as pd
+
+try:
+    import dask
+    import dask.dataframe as dd
+
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+from . import plasma as _plasma
+from . import spacecraft as _spacecraft
+from . import parquet_io
+
+
+def _require_dask():
+    if not DASK_AVAILABLE:
+        raise ImportError(
+            "dask is required for DaskPlasma. "
+            "Install with 'pip install \"dask[dataframe]\"'."
+        )
+
+
+def _conform_partition(frame, species):
+    r"""Select the plasma columns of `frame` as :py:meth:`Plasma.set_data` does."""
+    plasma = _plasma.Plasma.__new__(_plasma.Plasma)
+    plasma._init_logger()
+    plasma._set_species(*species)
+    return plasma._conform_data(frame)[0]
+
+
+def _partition_plasma(data, sc, aux, species, sc_name, sc_frame, storage):
+    r"""A :py:class:`Plasma` wrapping one partition without copying it."""
+    if sc is not None:
+        if not sc.index.equals(data.index):
+            sc = sc.loc[data.index]
+        sc = _spacecraft.Spacecraft._from_validated(sc, sc_name, sc_frame)
+    if aux is not None and not aux.index.equals(data.index):
+        aux = aux.loc[data.index]
+    return _plasma.Plasma._from_validated(
+        data,
+        *species,
+        spacecraft=sc,
+        auxiliary_data=aux,
+        storage=storage,
+    )
+
+
+def _read_period(period, path, **kwargs):
+    return parquet_io.read_frame(path, period=period, **kwargs)
+
+
+def _apply(
+    data, sc, aux, name, args, kwargs, species, sc_name, sc_frame, storage, empty
+):
+    if data.empty:
+        # Plasmas can't be empty, e.g. partitions outside a time range.
+        return empty
+    plasma = _partition_plasma(data, sc, aux, species, sc_name, sc_frame, storage)
+    return _unwrap(getattr(plasma, name)(*args, **kwargs))
+
+
+def _unwrap(result):
+    r"""The DataFrame behind :py:class:`~solarwindpy.core.vector.Vector` results."""
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return result
+    data = getattr(result, "data", None)
+    if isinstance(data, pd.DataFrame):
+        return data
+    raise TypeError("%s results can't be partitioned." % type(result))
+
+
+class DaskPlasma(object):
+    r"""Partitioned plasma whose derived quantities are lazy dask objects.
+
+    Parameters
+    ----------
+    data : :py:class:`dask.dataframe.DataFrame`
+        Plasma data with ("M", "C", "S") columns, indexed by time. Columns are
+        selected and scalar thermal speeds calculated lazily in each partition
+        as in :py:meth:`Plasma.set_data`.
+    *species : str
+        Species contained in `data`.
+    spacecraft, auxiliary_data : :py:class:`dask.dataframe.DataFrame`, optional
+        Partitioned like `data`, i.e. with the same number of partitions and
+        the same rows in each.
+    sc_name, sc_frame : str
+        Spacecraft name and frame. Required with `spacecraft`.
+    storage : {"pandas", "columnar"}
+        Storage engine of the plasma built around each partition.
+
+    Examples
+    --------
+    >>> dplasma = plasma.to_dask(npartitions=8)  # doctest: +SKIP
+    >>> beta = dplasma.beta("p1")  # doctest: +SKIP
+    >>> beta.compute()  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        data,
+        *species,
+        spacecraft=None,
+        auxiliary_data=None,
+        sc_name=None,
+        sc_frame=None,
+        storage="pandas",
+    ):
+        _require_dask()
+        if not species:
+            raise ValueError("You must specify species.")
+        if spacecraft is not None and (sc_name is None or sc_frame is None):
+            raise ValueError(
+                "Must specify spacecraft name and frame\nname : %s\nframe: %s"
+                % (sc_name, sc_frame)
+            )
+        for other in (spacecraft, auxiliary_data):
+            if other is None:
+                continue
+            if other.npartitions != data.npartitions:
+                raise ValueError(
+                    "Spacecraft and auxiliary data must be partitioned like data."
+                )
+            if data.known_divisions and other.known_divisions:
+                if tuple(data.divisions) != tuple(other.divisions):
+                    raise ValueError(
+                        "Spacecraft and auxiliary data must be partitioned like data."
+                    )
+
+        self._species = tuple(species)
+        meta = _conform_partition(data._meta_nonempty, self._species).iloc[:0]
+        self._data = data.map_partitions(_conform_partition, self._species, meta=meta)
+        self._spacecraft = spacecraft
+        self._auxiliary_data = auxiliary_data
+        self._sc_name = None if sc_name is None else str(sc_name).upper()
+        self._sc_frame = None if sc_frame is None else str(sc_frame).upper()
+        self._storage = storage
+
+    @classmethod
+    def _from_validated(
+        cls, data, species, spacecraft, auxiliary_data, sc_name, sc_frame, storage
+    ):
+        r"""Wrap dask frames that are already conformed."""
+        new = cls.__new__(cls)
+        new._data = data
+        new._species = tuple(species)
+        new._spacecraft = spacecraft
+        new._auxiliary_data = auxiliary_data
+        new._sc_name = sc_name
+        new._sc_frame = sc_frame
+        new._storage = storage
+        return new
+
+    @classmethod
+    def from_plasma(cls, plasma, npartitions=None, chunksize=None):
+        r"""Partition an in-memory `plasma` by time.
+
+        Parameters
+        ----------
+        plasma : :py:class:`Plasma`
+        npartitions, chunksize : int, optional
+            Number of partitions or rows per partition. See
+            :py:func:`dask.dataframe.from_pandas`. Defaults to one partition
+            per CPU.
+        """
+        _require_dask()
+        if npartitions is None and chunksize is None:
+            npartitions = dask.system.CPU_COUNT
+
+        def partition(frame):
+            if frame is None:
+                return None
+            return dd.from_pandas(
+                frame, npartitions=npartitions, chunksize=chunksize, sort=True
+            )
+
+        sc = plasma.spacecraft
+        return cls._from_validated(
+            partition(plasma.data),
+            plasma.species,
+            partition(None if sc is None else sc.data),
+            partition(plasma.auxiliary_data),
+            None if sc is None else sc.name,
+            None if sc is None else sc.frame,
+            plasma.storage_engine,
+        )
+
+    @classmethod
+    def read_parquet(
+        cls,
+        path,
+        *species,
+        measurements=None,
+        start=None,
+        stop=None,
+        spacecraft_data=True,
+        auxiliary_data=True,
+        sc_name=None,
+        sc_frame=None,
+        storage="pandas",
+    ):
+        r"""Lazily read a plasma saved by :py:meth:`Plasma.save_parquet`.
+
+        Each time partition of the saved datasets becomes one dask partition,
+        so data are only read when computed. Arguments are as for
+        :py:meth:`Plasma.load_parquet`.
+        """
+        _require_dask()
+        from pathlib import Path
+
+        path = Path(path)
+        meta = parquet_io.read_metadata(path / "data")
+        if not species:
+            species = meta["species"]
+        if measurements is not None:
+            measurements = set(measurements).union(("n", "v", "w", "b"))
+
+        periods = parquet_io.periods(path / "data")
+        fmt = parquet_io._PARTITION_FORMATS.get(meta["partition"])
+        if fmt is not None:
+            # Skip partitions outside the time range.
+            if start is not None:
+                first = pd.to_datetime(start).strftime(fmt)
+                periods = [p for p in periods if p >= first]
+            if stop is not None:
+                last = pd.to_datetime(stop).strftime(fmt)
+                periods = [p for p in periods if p <= last]
+        if not periods:
+            raise ValueError("No data between %s and %s" % (start, stop))
+
+        def read(name, **kwargs):
+            return dd.from_map(
+                _read_period,
+                periods,
+                path=path / name,
+                start=start,
+                stop=stop,
+                **kwargs,
+            )
+
+        data = read("data", species=species, measurements=measurements)
+
+        sc = None
+        if spacecraft_data and parquet_io.exists(path / "spacecraft"):
+            sc = read("spacecraft")
+            sc_name = meta["sc_name"] if sc_name is None else sc_name
+            sc_frame = meta["sc_frame"] if sc_frame is None else sc_frame
+
+        aux = None
+        if auxiliary_data and parquet_io.exists(path / "auxiliary_data"):
+            aux = read("auxiliary_data", species=species)
+
+        return cls(
+            data,
+            *species,
+            spacecraft=sc,
+            auxiliary_data=aux,
+            sc_name=sc_name,
+            sc_frame=sc_frame,
+            storage=storage,
+        )
+
+    @property
+    def data(self):
+        r"""Lazy plasma data."""
+        return self._data
+
+    @property
+    def spacecraft(self):
+        r"""Lazy spacecraft data or None."""
+        return self._spacecraft
+
+    @property
+    def sc(self):
+        r"""Shortcut to :py:attr:`spacecraft`."""
+        return self.spacecraft
+
+    @property
+    def auxiliary_data(self):
+        r"""Lazy auxiliary data or None."""
+        return self._auxiliary_data
+
+    @property
+    def aux(self):
+        r"""Shortcut to :py:attr:`auxiliary_data`."""
+        return self.auxiliary_data
+
+    @property
+    def species(self):
+        r"""Tuple of species contained in the plasma."""
+        return self._species
+
+    @property
+    def npartitions(self):
+        r"""Number of time partitions."""
+        return self.data.npartitions
+
+    def _meta_plasma(self):
+        r"""A plasma on dask's non-empty metadata, used to infer result types."""
+
+        def meta(frame):
+            return None if frame is None else frame._meta_nonempty
+
+        data = meta(self.data)
+        sc, aux = meta(self.spacecraft), meta(self.auxiliary_data)
+        if sc is not None:
+            sc.index = data.index
+        if aux is not None:
+            aux.index = data.index
+        return _partition_plasma(
+            data,
+            sc,
+            aux,
+            self.species,
+            self._sc_name,
+            self._sc_frame,
+            self._storage,
+        )
+
+    def _map(self, name, *args, **kwargs):
+        r"""Lazily call :py:class:`Plasma` method `name` on every partition."""
+        meta = _unwrap(getattr(self._meta_plasma(), name)(*args, **kwargs))
+        meta = meta.iloc[:0]
+
+        return dd.map_partitions(
+            _apply,
+            self.data,
+            self.spacecraft,
+            self.auxiliary_data,
+            name,
+            args,
+            kwargs,
+            self.species,
+            self._sc_name,
+            self._sc_frame,
+            self._storage,
+            meta,
+            meta=meta,
+            align_dataframes=False,
+            enforce_metadata=False,
+        )
+
+    def __getattr__(self, attr):
+        if attr in _plasma.Plasma._computable:
+            return functools.partial(self._map, attr)
+        raise AttributeError(
+            "%r object has no attribute %r" % (self.__class__.__name__, attr)
+        )
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()).union(_plasma.Plasma._computable))
+
+    def persist(self, **kwargs):
+        r"""Load the partitions into memory, keeping them distributed.
+
+        `kwargs` are passed to :py:func:`dask.persist`.
+        """
+        data, sc, aux = dask.persist(
+            self.data, self.spacecraft, self.auxiliary_data, **kwargs
+        )
+        return self._from_validated(
+            data,
+            self.species,
+            sc,
+            aux,
+            self._sc_name,
+            self._sc_frame,
+            self._storage,
+        )
+
+    def compute(self, quantities=None, **kwargs):
+        r"""Evaluate the plasma or several quantities.
+
+        Parameters
+        ----------
+        quantities : dict, optional
+            If None, compute the data and return an in-memory
+            :py:class:`Plasma`. Otherwise, run :py:meth:`Plasma.compute` on
+            every partition and return the concatenated pd.DataFrame.
+        kwargs :
+            Passed to :py:func:`dask.compute`, e.g. ``scheduler="processes"``.
+
+        Returns
+        -------
+        plasma_or_quantities : :py:class:`Plasma` or pd.DataFrame
+        """
+        if quantities is not None:
+            return self._map("compute", quantities).compute(**kwargs)
+
+        data, sc, aux = dask.compute(
+            self.data, self.spacecraft, self.auxiliary_data, **kwargs
+        )
+        if sc is not None:
+            sc = _spacecraft.Spacecraft(sc, self._sc_name, self._sc_frame)
+        return _plasma.Plasma._from_validated(
+            data,
+            *self.species,
+            spacecraft=sc,
+            auxiliary_data=aux,
+            storage=self._storage,
+        )
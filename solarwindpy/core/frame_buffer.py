@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+r"""Growable, time-ordered buffers backing :py:meth:`Plasma.append`.
+
+Appending rows to a :py:class:`pandas.DataFrame` with :py:func:`pandas.concat`
+copies the whole frame. :py:class:`FrameBuffer` instead preallocates
+column-major arrays with spare capacity, writes new rows into the free space,
+and doubles the capacity when it runs out, so appending `k` rows costs
+amortized :math:`O(k)`. Dropping old rows only advances the start of the
+occupied region, which makes the buffer a ring buffer when combined with
+retention. Reallocations compact the retained rows to the front.
+
+:py:meth:`FrameBuffer.frame` wraps the occupied region in a DataFrame without
+copying. Rows that have been written are never overwritten, so frames returned
+before an append remain valid.
+"""
+
+import numpy as np
+import pandas as pd
+
+_MIN_CAPACITY = 16
+
+
+class FrameBuffer(object):
+    r"""Time-ordered DataFrame with amortized :math:`O(k)` appends.
+
+    Parameters
+    ----------
+    frame : :py:class:`pandas.DataFrame`
+        Initial contents. Its index must be a sorted
+        :py:class:`pandas.DatetimeIndex` without duplicates.
+    capacity : int, optional
+        Initial number of rows allocated. Defaults to twice the rows in
+        `frame`.
+    """
+
+    def __init__(self, frame, capacity=None):
+        self._chk_index(frame.index)
+
+        dtypes = frame.dtypes.tolist()
+        runs = []
+        start = 0
+        for stop in range(1, len(dtypes) + 1):
+            if stop == len(dtypes) or dtypes[stop] != dtypes[start]:
+                runs.append((slice(start, stop), np.dtype(dtypes[start])))
+                start = stop
+
+        self._columns = frame.columns
+        self._runs = runs
+        self._index_name = frame.index.name
+        self._tz = frame.index.tz
+        self._unit = frame.index.unit
+        self._start = 0
+        self._stop = 0
+
+        if capacity is None:
+            capacity = 2 * len(frame)
+        self._allocate(max(int(capacity), len(frame), _MIN_CAPACITY))
+        self._write(frame)
+
+    def __len__(self):
+        return self._stop - self._start
+
+    @property
+    def capacity(self):
+        r"""Number of rows that fit in the allocated arrays."""
+        return self._index.shape[0]
+
+    @property
+    def columns(self):
+        r"""Column labels of the buffered frame."""
+        return self._columns
+
+    @staticmethod
+    def _chk_index(index):
+        if not isinstance(index, pd.DatetimeIndex):
+            raise TypeError("FrameBuffer requires a DatetimeIndex.")
+        if not (index.is_monotonic_increasing and index.is_unique):
+            raise ValueError("Index must be sorted in time without duplicates.")
+
+    def _allocate(self, capacity):
+        n = len(self)
+        start, stop = self._start, self._stop
+
+        index = np.empty(capacity, dtype=np.int64)
+        blocks = [
+            np.empty((cols.stop - cols.start, capacity), dtype=dt)
+            for cols, dt in self._runs
+        ]
+
+        if n:
+            index[:n] = self._index[start:stop]
+            for new, old in zip(blocks, self._blocks):
+                new[:, :n] = old[:, start:stop]
+
+        self._index = index
+        self._blocks = blocks
+        self._start = 0
+        self._stop = n
+
+    def _write(self, frame):
+        k = len(frame)
+        if self._stop + k > self.capacity:
+            self._allocate(max(2 * (len(self) + k), _MIN_CAPACITY))
+
+        rows = slice(self._stop, self._stop + k)
+        self._index[rows] = frame.index.as_unit(self._unit).asi8
+
+        for (cols, dt), block in zip(self._runs, self._blocks):
+            values = frame.iloc[:, cols].to_numpy()
+            if not np.can_cast(values.dtype, dt, casting="same_kind"):
+                raise TypeError(
+                    f"Can't append {values.dtype} values to {dt} columns "
+                    f"{self.columns[cols].tolist()}"
+                )
+            block[:, rows] = values.T
+
+        self._stop += k
+
+    def append(self, frame):
+        r"""Append the rows of `frame`.
+
+        `frame` must have the same columns as the buffer and start after the
+        last buffered time.
+        """
+        if not frame.columns.equals(self.columns):
+            raise ValueError(
+                "Appended columns don't match buffer.\nmissing: %s\nextra: %s"
+                % (
+                    self.columns.difference(frame.columns).tolist(),
+                    frame.columns.difference(self.columns).tolist(),
+                )
+            )
+        self._chk_index(frame.index)
+        if (frame.index.tz is None) != (self._tz is None):
+            raise ValueError("Can't mix timezone aware and naive times.")
+        first = frame.index[:1].as_unit(self._unit).asi8
+        if len(self) and first[0] <= self._index[self._stop - 1]:
+            raise ValueError(
+                "Appended rows must start after the last time.\nlast: %s\nfirst: %s"
+                % (self.last, frame.index[0])
+            )
+        self._write(frame)
+
+    @property
+    def last(self):
+        r"""Last buffered time."""
+        return self._wrap_index(self._index[self._stop - 1 : self._stop])[0]
+
+    def drop_before(self, time, inclusive=False):
+        r"""Drop rows before `time`, or at `time` if `inclusive`.
+
+        Costs :math:`O(\log n)`.
+        """
+        time = pd.Timestamp(time)
+        if self._tz is not None:
+            time = time.tz_convert(self._tz) if time.tz else time.tz_localize(self._tz)
+        i = np.searchsorted(
+            self._index[self._start : self._stop],
+            time.as_unit(self._unit).value,
+            side="right" if inclusive else "left",
+        )
+        self._start += int(i)
+
+    def keep_last(self, n):
+        r"""Keep only the last `n` rows."""
+        n = int(n)
+        if n < 1:
+            raise ValueError(f"Must keep at least one row, not {n}")
+        self._start = max(self._start, self._stop - n)
+
+    def _wrap_index(self, values):
+        index = pd.DatetimeIndex(
+            values.view(f"M8[{self._unit}]"), name=self._index_name
+        )
+        if self._tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self._tz)
+        return index
+
+    def frame(self):
+        r"""DataFrame viewing the buffered rows without copying them."""
+        rows = slice(self._start, self._stop)
+        index = self._wrap_index(self._index[rows])
+
+        frames = [
+            pd.DataFrame(
+                block[:, rows].T, index=index, columns=self.columns[cols], copy=False
+            )
+            for (cols, _), block in zip(self._runs, self._blocks)
+        ]
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, axis=1, copy=False)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+r"""Time-dependent transformations between geocentric and heliocentric frames.
+
+Supported frames are
+
+``GSE``
+    Geocentric Solar Ecliptic. X points from the Earth to the Sun, Z to the
+    ecliptic north pole.
+``GSM``
+    Geocentric Solar Magnetospheric. X as GSE, with the geomagnetic dipole in
+    the XZ plane.
+``HAE``
+    Heliocentric Aries Ecliptic. X points to the vernal equinox, Z to the
+    ecliptic north pole.
+``HCI``
+    Heliocentric Inertial. Z is the solar rotation axis and X the ascending
+    node of the solar equator on the J2000 ecliptic.
+``HEEQ``
+    Heliocentric Earth Equatorial. Z is the solar rotation axis and X the
+    intersection of the solar equator and the central meridian seen from
+    Earth.
+``RTN``
+    Radial-Tangential-Normal, centered on a spacecraft. R points from the Sun
+    to the spacecraft, T is parallel to :math:`\Omega_\odot \times R`, and N
+    completes the right-handed system. Transforming to or from RTN requires
+    the spacecraft position.
+
+Rotations follow Hapgood (1992) and Fränz & Harper (2002), with the solar
+ephemeris and geomagnetic dipole at the accuracy given there, about
+:math:`0.01^\circ`. HAE is referred to the mean equinox of date. Every transformation
+composes rotations into and out of HAE as a stack of ``(N, 3, 3)`` matrices,
+one per epoch, and applies them to ``(N, 3)`` arrays with
+:py:func:`numpy.einsum`. Matrices are calculated once per unique epoch and
+the most recent results are cached, so transforming several vectors measured
+at the same times builds the matrices once.
+
+Positions are translated as well as rotated. Geocentric positions are in Earth
+radii and heliocentric positions in solar radii, matching
+:py:attr:`Spacecraft.distance2sun`.
+
+References
+----------
+Hapgood, M. A. (1992). Space physics coordinate transformations: A user
+guide. Planetary and Space Science, 40(5), 711–717.
+<https://doi.org/10.1016/0032-0633(92)90012-D>
+
+Fränz, M., & Harper, D. (2002). Heliospheric coordinate systems. Planetary
+and Space Science, 50(2), 217–233.
+<https://doi.org/10.1016/S0032-0633(01)00119-2>
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from . import units_constants
+
+FRAMES = ("GSE", "GSM", "HAE", "HCI", "HEEQ", "RTN")
+GEOCENTRIC = ("GSE", "GSM")
+HELIOCENTRIC = ("HAE", "HCI", "HEEQ")
+
+_MISC = units_constants.Constants().misc
+_RE = _MISC.loc["Re [m]"]
+_RS = _MISC.loc["Rs [m]"]
+_AU = _MISC.loc["1AU [m]"]
+
+_MJD_UNIX = 40587.0  # MJD of 1970-01-01
+_MJD_J2000 = 51544.5
+_INCLINATION = 7.25  # Solar equator to ecliptic [deg]
+
+_CACHE_SIZE = 16
+_cache = OrderedDict()
+
+
+def conform_frame(frame):
+    r"""Upper case `frame`, checking that it is supported."""
+    frame = str(frame).upper()
+    if frame not in FRAMES:
+        raise NotImplementedError(f"Unrecognized frame: {frame}")
+    return frame
+
+
+def clear_cache():
+    r"""Drop cached rotation matrices."""
+    _cache.clear()
+
+
+def _rotation(angle, axis):
+    r"""Hapgood's :math:`\langle \zeta, axis \rangle`, ``(N, 3, 3)`` from degrees."""
+    angle = np.deg2rad(angle)
+    c, s = np.cos(angle), np.sin(angle)
+    out = np.zeros(angle.shape + (3, 3))
+    i, j = {"x": (1, 2), "y": (2, 0), "z": (0, 1)}[axis]
+    k = 3 - i - j
+    out[..., k, k] = 1.0
+    out[..., i, i] = c
+    out[..., j, j] = c
+    out[..., i, j] = s
+    out[..., j, i] = -s
+    return out
+
+
+def _mjd(epoch):
+    r"""Modified Julian date of a DatetimeIndex."""
+    if epoch.tz is not None:
+        epoch = epoch.tz_convert("UTC").tz_localize(None)
+    ns = epoch.as_unit("ns").asi8
+    return ns / 86400e9 + _MJD_UNIX
+
+
+def _sun(mjd):
+    r"""Geocentric ecliptic longitude of the Sun, obliquity, and Sun-Earth distance."""
+    d = mjd - _MJD_J2000
+    mean_lon = 280.460 + 0.9856474 * d
+    anomaly = np.deg2rad(357.528 + 0.9856003 * d)
+    lon = mean_lon + 1.915 * np.sin(anomaly) + 0.020 * np.sin(2.0 * anomaly)
+    obliquity = 23.439 - 4.0e-7 * d
+    distance = 1.00014 - 0.01671 * np.cos(anomaly) - 0.00014 * np.cos(2.0 * anomaly)
+    return lon, obliquity, distance * _AU
+
+
+def _gsm_tilt(mjd, sun_lon, obliquity):
+    r"""Angle :math:`\psi` of the dipole axis projected onto the GSE YZ plane."""
+    years = (mjd - 46066.0) / 365.25
+    lat = np.deg2rad(78.8 + 4.283e-2 * years)
+    lon = np.deg2rad(289.1 - 1.413e-2 * years)
+    q_geo = np.stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1
+    )
+
+    gmst = 280.46061837 + 360.98564736629 * (mjd - _MJD_J2000)
+    gei2geo = _rotation(gmst, "z")
+    gei2gse = _rotation(sun_lon, "z") @ _rotation(obliquity, "x")
+    q_gse = np.einsum("nij,nkj,nk->ni", gei2gse, gei2geo, q_geo)
+    return np.rad2deg(np.arctan2(q_gse[:, 1], q_gse[:, 2]))
+
+
+def _node(mjd):
+    r"""Ecliptic longitude of the ascending node of the solar equator."""
+    return 73.6667 + 0.013958 * (mjd + 3242.0) / 365.25
+
+
+def _from_hae(frame, mjd):
+    r"""``(N, 3, 3)`` rotations from HAE to `frame`."""
+    n = mjd.shape[0]
+    if frame == "HAE":
+        return np.broadcast_to(np.eye(3), (n, 3, 3))
+
+    if frame == "HCI":
+        # The node's longitude of date includes precession, so HCI is inertial.
+        incl = np.full(n, _INCLINATION)
+        return _rotation(incl, "x") @ _rotation(_node(mjd), "z")
+
+    sun_lon, obliquity, _ = _sun(mjd)
+    if frame == "GSE":
+        return _rotation(sun_lon, "z")
+
+    if frame == "GSM":
+        psi = _gsm_tilt(mjd, sun_lon, obliquity)
+        return _rotation(-psi, "x") @ _rotation(sun_lon, "z")
+
+    if frame == "HEEQ":
+        node = _node(mjd)
+        incl = np.full(n, _INCLINATION)
+        # Rotate X from the node to the Earth's longitude in the solar equator.
+        dlon = np.deg2rad(sun_lon + 180.0 - node)
+        theta = np.rad2deg(
+            np.arctan2(np.cos(np.deg2rad(_INCLINATION)) * np.sin(dlon), np.cos(dlon))
+        )
+        return _rotation(theta, "z") @ _rotation(incl, "x") @ _rotation(node, "z")
+
+    raise NotImplementedError(f"Unrecognized frame: {frame}")
+
+
+def _unique_epochs(epoch):
+    r"""Unique MJDs in `epoch` and the inverse index back to `epoch`."""
+    if not isinstance(epoch, pd.DatetimeIndex):
+        epoch = pd.DatetimeIndex(epoch)
+    mjd = _mjd(epoch)
+    unique, inverse = np.unique(mjd, return_inverse=True)
+    return mjd, unique, inverse
+
+
+def _fixed_matrices(src, dst, epoch):
+    r"""Cached ``(N, 3, 3)`` rotations between two frames other than RTN."""
+    mjd, unique, inverse = _unique_epochs(epoch)
+    key = (src, dst, mjd.shape[0], hash(mjd.tobytes()))
+    cached = _cache.get(key)
+    if cached is not None and np.array_equal(cached[0], mjd):
+        _cache.move_to_end(key)
+        return cached[1]
+
+    if src == dst:
+        matrices = np.broadcast_to(np.eye(3), (unique.shape[0], 3, 3))
+    else:
+        to_src = _from_hae(src, unique)
+        to_dst = _from_hae(dst, unique)
+        matrices = to_dst @ np.swapaxes(to_src, -1, -2)
+    matrices = matrices[inverse]
+    matrices.flags.writeable = False
+
+    _cache[key] = (mjd, matrices)
+    while len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return matrices
+
+
+def _rtn_from_hci(position_hci):
+    r"""``(N, 3, 3)`` rotations from HCI to RTN at heliocentric `position_hci`."""
+    r = position_hci / np.linalg.norm(position_hci, axis=1, keepdims=True)
+    t = np.cross(np.array([0.0, 0.0, 1.0]), r)
+    t /= np.linalg.norm(t, axis=1, keepdims=True)
+    n = np.cross(r, t)
+    return np.stack([r, t, n], axis=1)
+
+
+def rotation_matrices(src, dst, epoch, position=None, position_frame=None):
+    r"""Rotations from `src` to `dst` at each time in `epoch`.
+
+    Parameters
+    ----------
+    src, dst : str
+        Frames in :py:data:`FRAMES`.
+    epoch : pd.DatetimeIndex
+        Times of the vectors. Naive times are UTC.
+    position : np.ndarray, optional
+        ``(N, 3)`` spacecraft positions defining RTN. Required if either frame
+        is RTN.
+    position_frame : str, optional
+        Frame of `position`, which can't be RTN.
+
+    Returns
+    -------
+    matrices : np.ndarray
+        ``(N, 3, 3)`` with ``v_dst = matrices @ v_src``.
+    """
+    src, dst = conform_frame(src), conform_frame(dst)
+    if "RTN" not in (src, dst):
+        return _fixed_matrices(src, dst, epoch)
+    if src == dst:
+        return np.broadcast_to(np.eye(3), (len(epoch), 3, 3))
+
+    if position is None or position_frame is None:
+        raise ValueError("RTN transformations require the spacecraft position.")
+    position_frame = conform_frame(position_frame)
+    if position_frame == "RTN":
+        raise ValueError("The spacecraft position can't be in RTN.")
+
+    hci = transform_position(position, position_frame, "HCI", epoch)
+    to_rtn = _rtn_from_hci(hci)
+    if src == "RTN":
+        return _fixed_matrices("HCI", dst, epoch) @ np.swapaxes(to_rtn, -1, -2)
+    return to_rtn @ _fixed_matrices(src, "HCI", epoch)
+
+
+def transform(vectors, src, dst, epoch, position=None, position_frame=None):
+    r"""Rotate ``(N, 3)`` `vectors` from frame `src` to `dst`.
+
+    Use for directions, velocities, and fields. See
+    :py:func:`transform_position` for positions. Other parameters are as for
+    :py:func:`rotation_matrices`.
+    """
+    vectors = np.asarray(vectors, dtype=float)
+    matrices = rotation_matrices(
+        src, dst, epoch, position=position, position_frame=position_frame
+    )
+    return np.einsum("nij,nj->ni", matrices, vectors)
+
+
+def _earth_hae(epoch):
+    r"""Heliocentric position of the Earth in HAE [m]."""
+    mjd, unique, inverse = _unique_epochs(epoch)
+    sun_lon, _, distance = _sun(unique)
+    lon = np.deg2rad(sun_lon + 180.0)
+    earth = distance[:, None] * np.stack(
+        [np.cos(lon), np.sin(lon), np.zeros_like(lon)], axis=-1
+    )
+    return earth[inverse]
+
+
+def transform_position(position, src, dst, epoch):
+    r"""Translate and rotate ``(N, 3)`` positions from `src` to `dst`.
+
+    Geocentric positions (GSE, GSM) are in Earth radii. Heliocentric positions
+    (HAE, HCI, HEEQ) are in solar radii. Neither frame can be RTN.
+    """
+    src, dst = conform_frame(src), conform_frame(dst)
+    if "RTN" in (src, dst):
+        raise ValueError("Positions can't be transformed to or from RTN.")
+
+    position = np.asarray(position, dtype=float)
+    if src == dst:
+        return position.copy()
+
+    if (src in GEOCENTRIC) == (dst in GEOCENTRIC):
+        return transform(position, src, dst, epoch)
+
+    hae = transform(position, src, "HAE", epoch)
+    if src in GEOCENTRIC:
+        hae = hae * _RE + _earth_hae(epoch)
+    else:
+        hae = hae * _RS
+
+    if dst in GEOCENTRIC:
+        return transform((hae - _earth_hae(epoch)) / _RE, "HAE", dst, epoch)
+    return transform(hae / _RS, "HAE", dst, epoch)
@@ -6,9 +6,11 @@ Vector and Tensor objects.
 """
 
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
 from . import base
+from . import units_constants
 from . import vector
 from . import tensor
 
@@ -29,8 +31,23 @@ class Ion(base.Base):
     ----------
     species : str
         The ion's species name.
+
+    Notes
+    -----
+    :py:class:`~solarwindpy.core.plasma.Plasma` creates its ions with
+    :py:meth:`view`, which defers selecting the species' data until it is
+    first needed and shares the plasma's buffers where possible.
     """
 
+    _required_columns = (
+        ("n", ""),
+        ("v", "x"),
+        ("v", "y"),
+        ("v", "z"),
+        ("w", "par"),
+        ("w", "per"),
+    )
+
     def __init__(self, data: pd.DataFrame, species: str):
         """Initialize an Ion instance with plasma measurement data.
 
@@ -79,6 +96,48 @@ class Ion(base.Base):
         self.set_species(species)
         super().__init__(data)
 
+    @classmethod
+    def view(cls, data, species, storage=None, units=None, constants=None):
+        r"""Create a lazily materialized :py:class:`Ion` from plasma data.
+
+        Nothing is selected from `data` until a quantity is requested. When
+        `storage` is given, number density, velocity, and thermal speed are
+        views into its blocks rather than copies.
+
+        Parameters
+        ----------
+        data : :class:`pandas.DataFrame`
+            Plasma data with ``("M", "C", "S")`` columns that has already been
+            validated and sorted by :py:meth:`Plasma.set_data`.
+        species : str
+            Species to select from `data`.
+        storage : :py:class:`~solarwindpy.core.storage.ColumnarStorage`, optional
+            Columnar storage holding the same data.
+        units, constants : optional
+            Shared :py:class:`~solarwindpy.core.units_constants.Units` and
+            :py:class:`~solarwindpy.core.units_constants.Constants` so that
+            each ion doesn't build its own.
+
+        Returns
+        -------
+        Ion
+        """
+        ion = cls.__new__(cls)
+        ion._init_logger()
+        if units is None:
+            ion._init_units()
+        else:
+            ion._units = units
+        if constants is None:
+            ion._init_constants()
+        else:
+            ion._constants = constants
+        ion.set_species(species)
+        ion._source = data
+        ion._storage = storage
+        ion._views = {}
+        return ion
+
     def __eq__(self, other: object) -> bool:
         """Check equality between Ion objects.
 
@@ -113,6 +172,30 @@ class Ion(base.Base):
             raise ValueError("Species with '+' are not supported")
         self._species = species
 
+    @property
+    def _slot(self) -> int:
+        """Slot of the species in :py:data:`units_constants.SPECIES`."""
+        return units_constants.SPECIES.slot(self.species)
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Ion data with ``("M", "C")`` columns.
+
+        Lazily selected from the parent plasma for ions created by :py:meth:`view`.
+        """
+        try:
+            return self._data
+        except AttributeError:
+            pass
+
+        store = self._storage
+        if store is not None:
+            data = store.ion_frame(self.species)
+        else:
+            data = self._source.xs(self.species, axis=1, level="S")
+        self._data = data
+        return data
+
     def set_data(self, data: pd.DataFrame) -> None:
         """Set the data for the ion.
 
@@ -134,18 +217,13 @@ class Ion(base.Base):
         elif data.columns.names != ["M", "C"]:
             raise ValueError(f"Unrecognized data column names: {data.columns.names}")
 
-        required_columns = [
-            ("n", ""),
-            ("v", "x"),
-            ("v", "y"),
-            ("v", "z"),
-            ("w", "par"),
-            ("w", "per"),
-        ]
-        if not pd.Index(required_columns).isin(data.columns).all():
+        if not pd.Index(self._required_columns).isin(data.columns).all():
             raise ValueError("Missing required columns in data")
 
         self._data = data
+        self._source = None
+        self._storage = None
+        self._views = {}
 
     @property
     def species(self) -> str:
@@ -155,7 +233,15 @@ class Ion(base.Base):
     @property
     def velocity(self) -> vector.Vector:
         """Get the ion's velocity as a Vector."""
-        return vector.Vector(self.data.loc[:, "v"])
+        v = self._views.get("v")
+        if v is None:
+            store = self._storage
+            if store is not None:
+                v = vector.Vector(store.vector_frame(self.species))
+            else:
+                v = vector.Vector(self.data.loc[:, "v"])
+            self._views["v"] = v
+        return v
 
     @property
     def v(self) -> vector.Vector:
@@ -165,7 +251,15 @@ class Ion(base.Base):
     @property
     def thermal_speed(self) -> tensor.Tensor:
         """Get the ion's thermal speed as a Tensor."""
-        return tensor.Tensor(self.data.loc[:, "w"])
+        w = self._views.get("w")
+        if w is None:
+            store = self._storage
+            if store is not None:
+                w = tensor.Tensor(store.tensor_frame(self.species))
+            else:
+                w = tensor.Tensor(self.data.loc[:, "w"])
+            self._views["w"] = w
+        return w
 
     @property
     def w(self) -> tensor.Tensor:
@@ -174,8 +268,25 @@ class Ion(base.Base):
 
     @property
     def number_density(self) -> pd.Series:
-        """Get the number density of the ion."""
-        return self.data.loc[:, "n"]
+        """Get the number density of the ion.
+
+        The Series wraps read-only values shared with the plasma, so writing to
+        it raises a ValueError.
+        """
+        store = self._storage
+        if store is not None:
+            # Storage blocks are read-only.
+            n = store.n[:, store.slot(self.species)]
+            return pd.Series(n, index=store.index, name="n", copy=False)
+
+        # Selecting from MultiIndex columns dominates cheap quantities, so
+        # select once and wrap the values in a new Series on each call.
+        n = self._views.get("n")
+        if n is None:
+            n = self.data.loc[:, "n"].to_numpy().view()
+            n.flags.writeable = False
+            self._views["n"] = n
+        return pd.Series(n, index=self.data.index, name="n", copy=False)
 
     @property
     def n(self) -> pd.Series:
@@ -185,9 +296,9 @@ class Ion(base.Base):
     @property
     def mass_density(self) -> pd.Series:
         """Calculate the ion's mass density."""
-        out = self.n * self.constants.m_in_mp.loc[self.species]
-        out.name = "rho"
-        return out
+        m_in_mp = units_constants.SPECIES.m_in_mp[self._slot]
+        n = self.n
+        return pd.Series(n.to_numpy() * m_in_mp, index=n.index, name="rho")
 
     @property
     def rho(self) -> pd.Series:
@@ -203,11 +314,9 @@ class Ion(base.Base):
         pd.Series
             Temperature anisotropy.
         """
-        exp = pd.Series({"par": -1, "per": 1})
-        pth = self.pth.drop("scalar", axis=1)
-        ani = pth.pow(exp, axis=1, level="C").product(axis=1, skipna=False)
-        ani.name = "RT"
-        return ani
+        pth = self.pth
+        ani = pth.loc[:, "per"].to_numpy() / pth.loc[:, "par"].to_numpy()
+        return pd.Series(ani, index=pth.index, name="RT")
 
     @property
     def temperature(self) -> pd.DataFrame:
@@ -218,10 +327,13 @@ class Ion(base.Base):
         pd.DataFrame
             Temperature of the ion.
         """
-        m = self.constants.m.loc[self.species]
-        w = self.w.data * self.units.w
-        coeff = 0.5 * m / (self.constants.kb.J * self.units.temperature)
-        temp = coeff * w.pow(2)
+        units = self.units
+        coeff = units_constants.SPECIES.m_2kb[self._slot]
+        coeff *= units.w**2.0 / units.temperature
+        w = self.w.data
+        temp = pd.DataFrame(
+            coeff * np.square(w.to_numpy()), index=w.index, columns=w.columns
+        )
         temp.name = "T"
         return temp
 
@@ -234,9 +346,15 @@ class Ion(base.Base):
         pd.DataFrame
             Thermal pressure.
         """
-        rho = self.rho * self.units.rho
-        w = self.w.data.multiply(self.units.w)
-        pth = (0.5 / self.units.pth) * w.pow(2).multiply(rho, axis=0)
+        units = self.units
+        coeff = 0.5 * units.rho * units.w**2.0 / units.pth
+        rho = self.rho.to_numpy() * coeff
+        w = self.w.data
+        pth = pd.DataFrame(
+            np.square(w.to_numpy()) * rho[:, np.newaxis],
+            index=w.index,
+            columns=w.columns,
+        )
         pth.name = "pth"
         return pth
 
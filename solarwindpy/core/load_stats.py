@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+r"""Streaming, mergeable summary statistics logged when data is loaded.
+
+:py:class:`FrameStats` summarizes every column of a DataFrame in linear and
+:math:`\log_{10}` space in a single pass. Count, mean, standard deviation,
+minimum, and maximum are exact and merged with the pairwise update of Chan et
+al. (1979). Quantiles are calculated according to `mode`:
+
+``"exact"``
+    Keep the non-NaN values and calculate quantiles exactly. Memory scales
+    with the data.
+``"approximate"``
+    Insert values into a :py:class:`QuantileSketch`, a logarithmically binned
+    histogram in the style of DDSketch (Masson et al. 2019) with a bounded
+    relative error. Very long frames are subsampled at evenly spaced rows and
+    the sampled values are weighted accordingly.
+
+Both modes merge, so statistics of a chunked load are the statistics of the
+full load. Logarithmic quantiles are the logarithms of the linear quantiles of
+the positive values, so no second pass is required.
+
+References
+----------
+Chan, T. F., Golub, G. H., & LeVeque, R. J. (1979). Updating formulae and a
+pairwise algorithm for computing sample variances. Stanford CS-TR-79-773.
+
+Masson, C., Rim, J. E., & Lee, H. K. (2019). DDSketch: A fast and fully-mergeable
+quantile sketch with relative-error guarantees. Proc. VLDB Endow. 12(12).
+"""
+
+import numpy as np
+import pandas as pd
+
+MODES = ("exact", "approximate", "off")
+PERCENTILES = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+
+
+def conform_mode(mode):
+    r"""Convert `mode` to one of :py:data:`MODES`.
+
+    True and False are accepted for backwards compatibility and map to
+    "approximate" and "off".
+    """
+    if mode is True:
+        return "approximate"
+    elif mode is False or mode is None:
+        return "off"
+
+    mode = str(mode).lower()
+    if mode not in MODES:
+        raise ValueError(f"Unrecognized statistics mode `{mode}`. Use one of {MODES}")
+    return mode
+
+
+class _Store(object):
+    r"""Dense bin counts indexed from `offset`, grown on demand."""
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0)
+
+    def add(self, index, weight):
+        if not index.size:
+            return
+        lo, hi = index.min(), index.max()
+        self._extend(lo, hi)
+        self.counts += np.bincount(
+            index - self.offset, minlength=self.counts.size
+        ) * float(weight)
+
+    def _extend(self, lo, hi):
+        if not self.counts.size:
+            self.offset = lo
+            self.counts = np.zeros(hi - lo + 1)
+            return
+
+        stop = self.offset + self.counts.size
+        new_lo, new_hi = min(lo, self.offset), max(hi, stop - 1)
+        if new_lo == self.offset and new_hi == stop - 1:
+            return
+        counts = np.zeros(new_hi - new_lo + 1)
+        counts[self.offset - new_lo : stop - new_lo] = self.counts
+        self.offset = new_lo
+        self.counts = counts
+
+    def merge(self, other):
+        if not other.counts.size:
+            return
+        self._extend(other.offset, other.offset + other.counts.size - 1)
+        start = other.offset - self.offset
+        self.counts[start : start + other.counts.size] += other.counts
+
+    @property
+    def total(self):
+        return self.counts.sum()
+
+
+class QuantileSketch(object):
+    r"""Mergeable quantile sketch with relative accuracy `alpha`.
+
+    Values are binned by :math:`\lceil \log_\gamma |x| \rceil` with
+    :math:`\gamma = (1 + \alpha) / (1 - \alpha)`, so every returned quantile
+    is within a factor :math:`1 \pm \alpha` of a value at the requested rank.
+    """
+
+    def __init__(self, alpha=0.01):
+        if not 0 < alpha < 1:
+            raise ValueError(f"`alpha` must be in (0, 1), not {alpha}")
+        self.alpha = alpha
+        self._log_gamma = np.log((1.0 + alpha) / (1.0 - alpha))
+        self._pos = _Store()
+        self._neg = _Store()
+        self._zero = 0.0
+
+    @property
+    def count(self):
+        r"""Weighted number of values in the sketch."""
+        return self._pos.total + self._neg.total + self._zero
+
+    def _index(self, x):
+        return np.ceil(np.log(x) / self._log_gamma).astype(np.int64)
+
+    def _value(self, index):
+        gamma = np.exp(self._log_gamma)
+        return 2.0 * gamma**index / (gamma + 1.0)
+
+    def add(self, x, weight=1.0):
+        r"""Add the finite values of array `x`, each with `weight`."""
+        x = x[np.isfinite(x)]
+        self._pos.add(self._index(x[x > 0]), weight)
+        self._neg.add(self._index(-x[x < 0]), weight)
+        self._zero += weight * np.count_nonzero(x == 0)
+
+    def merge(self, other):
+        r"""Add the contents of `other` in place."""
+        if other.alpha != self.alpha:
+            raise ValueError("Can't merge sketches with different accuracies.")
+        self._pos.merge(other._pos)
+        self._neg.merge(other._neg)
+        self._zero += other._zero
+        return self
+
+    def quantile(self, q, positive=False):
+        r"""Estimate quantiles `q`, optionally of the positive values only."""
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+
+        pos = self._pos
+        values = [self._value(np.arange(pos.offset, pos.offset + pos.counts.size))]
+        counts = [pos.counts]
+        if not positive:
+            neg = self._neg
+            idx = np.arange(neg.offset, neg.offset + neg.counts.size)[::-1]
+            values = [-self._value(idx), np.zeros(1)] + values
+            counts = [neg.counts[::-1], np.array([self._zero])] + counts
+
+        values = np.concatenate(values)
+        cumulative = np.cumsum(np.concatenate(counts))
+        total = cumulative[-1] if cumulative.size else 0.0
+        if total <= 0:
+            return np.full(q.shape, np.nan)
+
+        # Match the linear interpolation rank used by `np.quantile`.
+        rank = q * (total - 1.0)
+        i = np.searchsorted(cumulative, rank, side="right")
+        return values[np.minimum(i, values.size - 1)]
+
+
+class _Moments(object):
+    r"""Count, mean, sum of squared deviations, min, and max of a column."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, x):
+        if not x.size:
+            return
+        other = _Moments()
+        other.n = x.size
+        other.mean = x.mean()
+        other.m2 = np.square(x - other.mean).sum()
+        other.min = x.min()
+        other.max = x.max()
+        self.merge(other)
+
+    def merge(self, other):
+        n = self.n + other.n
+        if not n:
+            return
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta**2 * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+    def summary(self):
+        if not self.n:
+            return [0.0] + [np.nan] * 4
+        return [float(self.n), self.mean, self.std, self.min, self.max]
+
+
+class _ColumnStats(object):
+    def __init__(self, mode, alpha):
+        self.mode = mode
+        self.lin = _Moments()
+        self.log = _Moments()
+        self.nan = 0
+        if mode == "exact":
+            self.values = []
+        else:
+            self.sketch = QuantileSketch(alpha)
+
+    def add(self, x, sample=None, weight=1.0):
+        isnan = np.isnan(x)
+        self.nan += int(isnan.sum())
+        x = x[~isnan]
+        self.lin.add(x)
+
+        positive = x[x > 0]
+        self.log.add(np.log10(positive))
+
+        if self.mode == "exact":
+            self.values.append(x)
+        else:
+            self.sketch.add(x if sample is None else sample, weight=weight)
+
+    def merge(self, other):
+        self.lin.merge(other.lin)
+        self.log.merge(other.log)
+        self.nan += other.nan
+        if self.mode == "exact":
+            self.values.extend(other.values)
+        else:
+            self.sketch.merge(other.sketch)
+
+    def quantiles(self, q):
+        if self.mode == "exact":
+            x = np.concatenate(self.values) if self.values else np.zeros(0)
+            positive = x[x > 0]
+            lin = np.quantile(x, q) if x.size else np.full(len(q), np.nan)
+            log = (
+                np.quantile(np.log10(positive), q)
+                if positive.size
+                else np.full(len(q), np.nan)
+            )
+            return lin, log
+
+        lin = self.sketch.quantile(q)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log = np.log10(self.sketch.quantile(q, positive=True))
+        return lin, log
+
+
+class FrameStats(object):
+    r"""Mergeable per-column statistics of a DataFrame.
+
+    Parameters
+    ----------
+    columns : pd.Index
+        Columns to summarize. Non-numeric columns are skipped.
+    mode : {"exact", "approximate"}
+        How quantiles are calculated.
+    alpha : float
+        Relative accuracy of the approximate quantiles.
+    max_rows : int
+        In "approximate" mode, frames with more rows are subsampled at evenly
+        spaced rows before inserting them into the quantile sketches. Moments
+        are always calculated from all rows.
+    """
+
+    def __init__(self, columns, mode="approximate", alpha=0.01, max_rows=1_000_000):
+        mode = conform_mode(mode)
+        if mode == "off":
+            raise ValueError("FrameStats requires 'exact' or 'approximate' mode.")
+
+        self._columns = columns
+        self._mode = mode
+        self._alpha = alpha
+        self._max_rows = int(max_rows)
+        self._rows = 0
+        self._rows_with_nan = 0
+        self._stats = [_ColumnStats(mode, alpha) for _ in columns]
+
+    @classmethod
+    def from_frame(cls, frame, mode="approximate", **kwargs):
+        r"""Summarize the numeric columns of `frame`."""
+        numeric = [
+            pd.api.types.is_numeric_dtype(dt) or pd.api.types.is_bool_dtype(dt)
+            for dt in frame.dtypes
+        ]
+        stats = cls(frame.columns[numeric], mode=mode, **kwargs)
+        stats.update(frame)
+        return stats
+
+    @property
+    def columns(self):
+        r"""Summarized columns."""
+        return self._columns
+
+    @property
+    def mode(self):
+        r"""Quantile mode, "exact" or "approximate"."""
+        return self._mode
+
+    @property
+    def rows(self):
+        r"""Number of rows summarized."""
+        return self._rows
+
+    @property
+    def rows_with_nan(self):
+        r"""Number of rows with at least one NaN."""
+        return self._rows_with_nan
+
+    def update(self, frame):
+        r"""Stream the rows of `frame` into the statistics."""
+        frame = frame.loc[:, self.columns]
+        n = frame.shape[0]
+
+        sample = None
+        weight = 1.0
+        if self.mode == "approximate" and n > self._max_rows:
+            sample = np.linspace(0, n - 1, self._max_rows).astype(np.intp)
+            weight = n / sample.size
+
+        any_nan = np.zeros(n, dtype=bool)
+        for j, stats in enumerate(self._stats):
+            x = frame.iloc[:, j].to_numpy(dtype=float, na_value=np.nan)
+            isnan = np.isnan(x)
+            any_nan |= isnan
+            xs = None
+            if sample is not None:
+                xs = x[sample]
+                xs = xs[~np.isnan(xs)]
+            stats.add(x, sample=xs, weight=weight)
+
+        self._rows += n
+        self._rows_with_nan += int(any_nan.sum())
+        return self
+
+    def merge(self, other):
+        r"""Add the statistics in `other` in place."""
+        if not other.columns.equals(self.columns):
+            raise ValueError("Can't merge statistics of different columns.")
+        if other.mode != self.mode:
+            raise ValueError("Can't merge statistics with different modes.")
+        for mine, theirs in zip(self._stats, other._stats):
+            mine.merge(theirs)
+        self._rows += other.rows
+        self._rows_with_nan += other.rows_with_nan
+        return self
+
+    def copy(self):
+        r"""Independent copy that can be merged into without changing `self`."""
+        new = FrameStats(
+            self.columns, mode=self.mode, alpha=self._alpha, max_rows=self._max_rows
+        )
+        return new.merge(self)
+
+    def nan_info(self):
+        r"""NaN count and fraction for each column."""
+        count = pd.Series([s.nan for s in self._stats], index=self.columns)
+        return pd.DataFrame(
+            {"count": count, "mean": count / self.rows if self.rows else np.nan}
+        )
+
+    def describe(self, percentiles=PERCENTILES):
+        r"""Statistics in the layout of :py:meth:`pandas.DataFrame.describe`.
+
+        Returns
+        -------
+        stats : pd.DataFrame
+            Rows are the columns of the summarized frame with an extra "lin" or
+            "log" level. Columns are "count", "mean", "std", "min", the
+            percentiles, and "max".
+        """
+        pct = [f"{100 * p:g}%" for p in percentiles]
+        labels = ["count", "mean", "std", "min"] + pct + ["max"]
+
+        rows = {}
+        for col, stats in zip(self.columns, self._stats):
+            qlin, qlog = stats.quantiles(percentiles)
+            for kind, moments, q in (
+                ("lin", stats.lin, qlin),
+                ("log", stats.log, qlog),
+            ):
+                count, mean, std, lo, hi = moments.summary()
+                key = (col if isinstance(col, tuple) else (col,)) + (kind,)
+                rows[key] = [count, mean, std, lo] + list(q) + [hi]
+
+        names = list(self.columns.names) + [None]
+        index = pd.MultiIndex.from_tuples(list(rows), names=names)
+        return pd.DataFrame(list(rows.values()), index=index, columns=labels)
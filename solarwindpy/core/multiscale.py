@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+r"""Rolling means over many windows for :py:meth:`AlfvenicTurbulence.scales`.
+
+Each column is integrated once into cumulative sums of its values and of its
+number of valid measurements. The mean over any trailing window is then the
+difference of two prefix sums divided by the difference of two counts, so
+every additional window costs :math:`O(N)` regardless of its width. Windows
+match :py:meth:`pandas.DataFrame.rolling`: time-based windows, e.g. "15min",
+cover :math:`(t - w, t]`, integer windows cover the last `w` rows, and NaNs
+are excluded from both the sums and the counts compared with `min_periods`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import parallel
+
+QUANTITIES = ("sigma_c", "sigma_r", "rE", "rA")
+
+
+def window_starts(index, window):
+    r"""First row of the trailing `window` ending at each row of `index`.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        Sorted times.
+    window : int, str, or pd.Timedelta
+        Number of rows or a time offset.
+    """
+    n = len(index)
+    if isinstance(window, (int, np.integer)):
+        if window < 1:
+            raise ValueError(f"`window` must be positive, not {window}")
+        return np.maximum(np.arange(n) - int(window) + 1, 0)
+
+    if not isinstance(index, pd.DatetimeIndex):
+        raise TypeError("Time-based windows require a DatetimeIndex.")
+    if not index.is_monotonic_increasing:
+        raise ValueError("Time-based windows require a sorted index.")
+    window = pd.Timedelta(pd.tseries.frequencies.to_offset(window))
+    return index.searchsorted(index - window, side="right")
+
+
+class PrefixSums(object):
+    r"""Cumulative sums of ``(N, k)`` `values` and of their valid counts.
+
+    The column means are subtracted before summing to limit the round-off of
+    long series.
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2:
+            raise ValueError(f"`values` must be 2D, not {values.ndim}D")
+
+        valid = np.isfinite(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            offset = np.nan_to_num(
+                values.sum(axis=0, where=valid) / valid.sum(axis=0), nan=0.0
+            )
+
+        nrows, ncols = values.shape
+        sums = np.zeros((nrows + 1, ncols))
+        np.cumsum(np.where(valid, values - offset, 0.0), axis=0, out=sums[1:])
+        counts = np.zeros((nrows + 1, ncols), dtype=np.int64)
+        np.cumsum(valid, axis=0, out=counts[1:])
+
+        self._offset = offset
+        self._sums = sums
+        self._counts = counts
+
+    def __len__(self):
+        return self._sums.shape[0] - 1
+
+    def means(self, starts, min_periods=1):
+        r"""Means of the rows ``starts[i]`` through ``i``.
+
+        Windows with fewer than `min_periods` valid values are NaN.
+        """
+        stops = np.arange(1, len(self) + 1)
+        counts = self._counts[stops] - self._counts[starts]
+        total = self._sums[stops] - self._sums[starts]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = total / counts + self._offset
+        out[counts < max(int(min_periods), 1)] = np.nan
+        return out
+
+
+def _energies(dv, db):
+    r"""Half squared magnitudes of `dv`, `db`, `dv + db`, and `dv - db`.
+
+    NaN components don't contribute, like :py:meth:`pandas.DataFrame.sum`.
+    """
+    ev = 0.5 * np.nansum(dv**2, axis=1)
+    eb = 0.5 * np.nansum(db**2, axis=1)
+    ep = 0.5 * np.nansum((dv + db) ** 2, axis=1)
+    em = 0.5 * np.nansum((dv - db) ** 2, axis=1)
+    return ev, eb, ep, em
+
+
+def alfvenic_scales(v, b, index, windows, min_periods=5, polarity=None, n_jobs=1):
+    r"""Normalized cross helicity, residual energy, and ratios at many scales.
+
+    Parameters
+    ----------
+    v, b : np.ndarray
+        ``(N, 3)`` velocity and magnetic field in Alfv\'en units.
+    index : pd.DatetimeIndex
+        Times of `v` and `b`.
+    windows : iterable of int, str, or pd.Timedelta
+        Averaging windows defining the fluctuations at each scale.
+    min_periods : int
+        Minimum number of measurements in each average.
+    polarity : np.ndarray, optional
+        Sign applied to the magnetic field fluctuations, see
+        :py:attr:`AlfvenicTurbulence.polarity`.
+    n_jobs : int
+        Number of threads processing windows. Negative values count back from
+        the number of CPUs, so -1 uses all of them.
+
+    Returns
+    -------
+    panel : pd.DataFrame
+        Columns are a ``("window", "M")`` MultiIndex with `windows` and
+        :py:data:`QUANTITIES`.
+    """
+    windows = list(windows)
+    if not windows:
+        raise ValueError("At least one window is required.")
+
+    data = np.concatenate([np.asarray(v, float), np.asarray(b, float)], axis=1)
+    prefix = PrefixSums(data)
+
+    def work(window):
+        delta = data - prefix.means(window_starts(index, window), min_periods)
+        dv, db = delta[:, :3], delta[:, 3:]
+        if polarity is not None:
+            db = db * np.asarray(polarity, dtype=float)[:, None]
+
+        ev, eb, ep, em = _energies(dv, db)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.stack(
+                [(ep - em) / (ep + em), (ev - eb) / (ev + eb), em / ep, ev / eb],
+                axis=1,
+            )
+
+    panels = parallel.map_threads(work, windows, n_jobs)
+
+    columns = pd.MultiIndex.from_product(
+        [range(len(windows)), QUANTITIES], names=["window", "M"]
+    )
+    panel = pd.DataFrame(np.concatenate(panels, axis=1), index=index, columns=columns)
+    # Keep the windows as passed, e.g. "15min", as labels.
+    return panel.rename(columns=dict(enumerate(windows)), level="window")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+r"""Map functions over items in thread or process pools.
+
+Chunked, vectorized kernels spend their time in NumPy and SciPy, which release
+the GIL, so they run in threads. Picklable work, such as reading files, can
+also run in processes. With one worker, items are mapped in the calling thread
+without creating a pool.
+"""
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def n_workers(n_jobs):
+    r"""Number of workers requested by `n_jobs`.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        Number of workers. None and 0 mean 1. Negative values count back from
+        the number of CPUs, so -1 uses all of them.
+    """
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return int(n_jobs)
+
+
+def _map(pool_type, func, items, n_jobs):
+    items = list(items)
+    workers = min(n_workers(n_jobs), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with pool_type(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
+def map_threads(func, items, n_jobs=1):
+    r"""``[func(item) for item in items]`` computed by `n_jobs` threads.
+
+    Parameters
+    ----------
+    func : callable
+    items : iterable
+    n_jobs : int
+        See :py:func:`n_workers`. At most one thread is used per item.
+
+    Returns
+    -------
+    results : list
+        Results in the order of `items`. Exceptions raised by `func` are
+        raised here.
+    """
+    return _map(ThreadPoolExecutor, func, items, n_jobs)
+
+
+def map_processes(func, items, n_jobs=1):
+    r"""Like :py:func:`map_threads`, but in `n_jobs` processes.
+
+    `func`, `items`, and the results must be picklable.
+    """
+    return _map(ProcessPoolExecutor, func, items, n_jobs)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+r"""Columnar Parquet persistence for :py:class:`~solarwindpy.core.plasma.Plasma`.
+
+A plasma is written as a directory of Hive-partitioned Parquet datasets::
+
+    path/
+        data/period=2020-01/part-0.parquet
+        spacecraft/period=2020-01/part-0.parquet
+        auxiliary_data/period=2020-01/part-0.parquet
+
+MultiIndex columns are flattened to ``"M|C|S"`` strings, following the
+convention used by the test data files. The time index is written as a
+column. Because the ``period`` partition key sorts lexicographically, loads
+restricted to a time range skip whole partitions, and because Parquet is
+columnar, loads restricted to species or measurements read only those
+columns.
+"""
+
+import json
+
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+_SEP = "|"
+_INDEX = "epoch"
+_PERIOD = "period"
+_METADATA_KEY = b"solarwindpy"
+
+_PARTITION_FORMATS = {
+    "Y": "%Y",
+    "M": "%Y-%m",
+    "D": "%Y-%m-%d",
+}
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is required for Parquet persistence. "
+            "Install with 'pip install pyarrow'."
+        )
+
+
+def _flatten_columns(columns):
+    return [_SEP.join(c) for c in columns]
+
+
+def _unflatten_columns(columns, names):
+    return pd.MultiIndex.from_tuples(
+        [tuple(c.split(_SEP)) for c in columns], names=names
+    )
+
+
+def write_frame(frame, path, partition="M", metadata=None):
+    r"""Write `frame` to a Parquet dataset at `path` partitioned by time.
+
+    Parameters
+    ----------
+    frame : :py:class:`pandas.DataFrame`
+        Data with a :py:class:`pandas.DatetimeIndex` and MultiIndex columns.
+    path : str or pathlib.Path
+        Directory in which to write the dataset. Partitions that are rewritten
+        replace existing files.
+    partition : {"Y", "M", "D"} or None
+        Partition by year, month, or day. None writes a single partition.
+    metadata : dict, optional
+        JSON-serializable metadata stored with the dataset schema.
+    """
+    _require_pyarrow()
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise TypeError("Parquet persistence requires a DatetimeIndex.")
+
+    if partition is None:
+        period = "all"
+    elif partition in _PARTITION_FORMATS:
+        period = frame.index.strftime(_PARTITION_FORMATS[partition])
+    else:
+        raise ValueError(
+            f"Unrecognized partition `{partition}`. "
+            f"Use one of {tuple(_PARTITION_FORMATS)} or None."
+        )
+
+    meta = {
+        "index_name": frame.index.name,
+        "column_names": list(frame.columns.names),
+        "partition": partition,
+    }
+    meta.update(metadata or {})
+
+    flat = frame.set_axis(_flatten_columns(frame.columns), axis=1)
+    flat = flat.reset_index(names=_INDEX)
+    flat[_PERIOD] = period
+
+    table = pa.Table.from_pandas(flat, preserve_index=False)
+    table = table.replace_schema_metadata({_METADATA_KEY: json.dumps(meta)})
+
+    ds.write_dataset(
+        table,
+        str(path),
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([(_PERIOD, pa.string())]), flavor="hive"
+        ),
+        existing_data_behavior="delete_matching",
+    )
+
+
+def read_metadata(path):
+    r"""Metadata stored by :py:func:`write_frame` for the dataset at `path`."""
+    _require_pyarrow()
+    dataset = ds.dataset(str(path), format="parquet", partitioning="hive")
+    return json.loads(dataset.schema.metadata[_METADATA_KEY])
+
+
+def periods(path):
+    r"""Sorted partition values of the dataset at `path`."""
+    _require_pyarrow()
+    dataset = ds.dataset(str(path), format="parquet", partitioning="hive")
+    values = set()
+    for fragment in dataset.get_fragments():
+        expr = ds.get_partition_keys(fragment.partition_expression)
+        values.add(expr[_PERIOD])
+    return sorted(values)
+
+
+def read_frame(
+    path, species=None, measurements=None, start=None, stop=None, period=None
+):
+    r"""Read a dataset written by :py:func:`write_frame`.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Dataset directory.
+    species : iterable of str, optional
+        If not None, only read columns whose ``"S"`` level is in `species` or
+        empty. Ignored for frames without an ``"S"`` level.
+    measurements : iterable of str, optional
+        If not None, only read columns whose ``"M"`` level is in
+        `measurements`.
+    start, stop : optional, parsable by `pd.to_datetime`
+        Only read times in ``[start, stop]``. Partitions outside the range are
+        skipped without being opened.
+    period : str, optional
+        Only read the partition with this value, see :py:func:`periods`.
+
+    Returns
+    -------
+    frame : :py:class:`pandas.DataFrame`
+    """
+    _require_pyarrow()
+    dataset = ds.dataset(str(path), format="parquet", partitioning="hive")
+    meta = json.loads(dataset.schema.metadata[_METADATA_KEY])
+    names = meta["column_names"]
+
+    columns = [c for c in dataset.schema.names if c not in (_INDEX, _PERIOD)]
+    labels = _unflatten_columns(columns, names)
+    keep = pd.Series(True, index=columns)
+    if species is not None and "S" in names:
+        s = labels.get_level_values("S")
+        keep &= (s == "") | s.isin(list(species))
+    if measurements is not None:
+        keep &= labels.get_level_values("M").isin(list(measurements))
+    columns = keep.index[keep.values].tolist()
+
+    expr = None
+    partition = meta["partition"]
+    for value, op in ((start, "ge"), (stop, "le")):
+        if value is None:
+            continue
+        value = pd.to_datetime(value)
+        cond = getattr(ds.field(_INDEX), f"__{op}__")(pa.scalar(value))
+        if partition is not None:
+            bound = value.strftime(_PARTITION_FORMATS[partition])
+            cond = cond & getattr(ds.field(_PERIOD), f"__{op}__")(bound)
+        expr = cond if expr is None else expr & cond
+    if period is not None:
+        cond = ds.field(_PERIOD) == period
+        expr = cond if expr is None else expr & cond
+
+    table = dataset.to_table(columns=[_INDEX] + columns, filter=expr)
+    table = table.sort_by(_INDEX)
+
+    frame = table.to_pandas().set_index(_INDEX)
+    frame.index.name = meta["index_name"]
+    frame.columns = _unflatten_columns(frame.columns, names)
+    return frame
+
+
+def exists(path):
+    r"""Test if a dataset exists at `path`."""
+    path = Path(path)
+    return path.is_dir() and any(path.rglob("*.parquet"))
@@ -31,6 +31,10 @@ Propoded Updates
 import numpy as np
 import pandas as pd
 import itertools
+import logging
+import time
+
+from collections import OrderedDict, namedtuple
 
 # We rely on views via DataFrame.xs to reduce memory size and do not
 # `.copy(deep=True)`, so we want to make sure that this doesn't
@@ -40,8 +44,145 @@ from . import base
 from . import vector
 from . import ions
 from . import spacecraft
+from . import storage as columnar
+from . import quantity_cache as qcache
+from . import parquet_io
+from . import shared
+from . import coulomb
+from . import parallel
+from . import frame_buffer
+from . import load_stats
+from . import resampling
+from . import units_constants
+from . import quality_flags
 from . import alfvenic_turbulence as alf_turb
 
+_SLICE_CACHE_SIZE = 32
+
+# Component coefficients shared by every call.
+_ANISOTROPY_EXP = pd.Series({"par": -1, "per": 1})
+_PER_MINUS_PAR = pd.Series({"per": 1, "par": -1})
+
+
+def _search_rows(index, start, stop):
+    r"""Positional slice of `index` from `start` to `stop`, inclusive.
+
+    Bounds are resolved as by ``DataFrame.loc``, so partial dates such as
+    "2020-01-02" cover the whole period. Uses a binary search, so `index` must
+    be sorted.
+    """
+    if not index.is_monotonic_increasing:
+        raise ValueError("Slicing by time requires a sorted index.")
+    i0, i1, _ = index.slice_indexer(start, stop).indices(len(index))
+    return slice(int(i0), int(max(i0, i1)))
+
+
+class _TimeSlicer(object):
+    r"""Implements ``Plasma.loc[start:stop]``."""
+
+    def __init__(self, plasma):
+        self._plasma = plasma
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice) or key.step is not None:
+            raise TypeError("Plasma.loc only supports slices without a step.")
+        return self._plasma.slice(key.start, key.stop)
+
+
+def _quasi_neutral_electrons(n, v, q, n_ref, w_ref, me_mp):
+    r"""Electron moments from quasi-neutrality and zero current.
+
+    Parameters
+    ----------
+    n, v : np.ndarray
+        Ion densities and velocities shaped ``(time, species)`` and
+        ``(time, species, 3)``. NaNs don't contribute.
+    q : np.ndarray
+        Ion charge states.
+    n_ref, w_ref : np.ndarray
+        Density and scalar thermal speed of the (core) protons.
+    me_mp : float
+        Electron to proton mass ratio.
+
+    Returns
+    -------
+    ne, ve, we : np.ndarray
+        :math:`n_e = \sum_i q_i n_i`, :math:`v_e = \sum_i q_i n_i v_i / n_e`,
+        and :math:`w_e = w_p \sqrt{n_p / (n_e m_e/m_p)}`. Times without ions
+        are NaN.
+    """
+    nq = n * q
+    ne = np.nansum(nq, axis=1)
+    nqv = np.nansum(nq[:, :, np.newaxis] * v, axis=1)
+
+    ne = np.where(ne == 0, np.nan, ne)
+    ve = nqv / ne[:, np.newaxis]
+    we = np.sqrt(n_ref / ne / me_mp * w_ref**2.0)
+    return ne, ve, we
+
+
+def _time_range_where(start, stop):
+    r"""Build an `HDFStore.select` query selecting times in `[start, stop]`."""
+    where = []
+    if start is not None:
+        where.append("index >= %r" % pd.to_datetime(start).isoformat())
+    if stop is not None:
+        where.append("index <= %r" % pd.to_datetime(stop).isoformat())
+    return where or None
+
+
+def _w_scalar(par, per):
+    r"""Scalar thermal speed :math:`\sqrt{(w_\parallel^2 + 2 w_\perp^2) / 3}`.
+
+    NaN components don't contribute to the sum, matching a ``skipna`` sum.
+    """
+    par = par**2.0 * (1.0 / 3.0)
+    per = per**2.0 * (2.0 / 3.0)
+    par = np.where(np.isnan(par), 0.0, par)
+    per = np.where(np.isnan(per), 0.0, per)
+    return np.sqrt(par + per)
+
+
+def _select_hdf(store, key, start=None, stop=None):
+    r"""Read `key` from `store`, restricted to `[start, stop]` when possible.
+
+    Table-format stores are queried with their on-disk index so that only the
+    requested rows are read. Fixed-format stores are read in full and sliced.
+    """
+    if store.get_storer(key).is_table:
+        return store.select(key, where=_time_range_where(start, stop))
+
+    data = store.select(key)
+    if start is not None or stop is not None:
+        data = data.loc[start:stop]
+    return data
+
+
+def _read_hdf_file(fname, dkey, sckey, akey, start=None, stop=None):
+    r"""Read the raw frames of one file for :py:meth:`Plasma.load_many`.
+
+    Returns
+    -------
+    frames: dict
+        Raw "data", "spacecraft", and "auxiliary_data" frames. Keys that are
+        false aren't read and map to None.
+    seconds: float
+        Wall time spent reading.
+    """
+    t0 = time.perf_counter()
+    frames = {}
+    with pd.HDFStore(fname, mode="r") as store:
+        for name, key in (
+            ("data", dkey),
+            ("spacecraft", sckey),
+            ("auxiliary_data", akey),
+        ):
+            frames[name] = _select_hdf(store, key, start, stop) if key else None
+    return frames, time.perf_counter() - t0
+
+
+CoulombPairs = namedtuple("CoulombPairs", "lnlambda,nuc,nc")
+
 
 class Plasma(base.Base):
     r"""Container for multi-species plasma physics data and analysis.
@@ -125,6 +266,7 @@ class Plasma(base.Base):
         spacecraft=None,
         auxiliary_data=None,
         log_plasma_stats=False,
+        storage="pandas",
     ):
         r"""Initialize a :class:`Plasma` instance.
 
@@ -145,8 +287,15 @@ class Plasma(base.Base):
         auxiliary_data : :class:`pandas.DataFrame`, optional
             Additional measurements to carry with the plasma, for example data
             quality flags. The column labelling scheme must match ``data``.
-        log_plasma_stats : bool, default ``False``
-            Log summary statistics when ``data`` is set.
+        log_plasma_stats : bool or {"exact", "approximate", "off"}, default ``False``
+            Log summary statistics when ``data`` is set. See
+            :py:meth:`set_log_plasma_stats`.
+        storage : {"pandas", "columnar"}, default ``"pandas"``
+            Storage engine used by the derived methods. ``"columnar"`` also
+            holds ``n``, ``v``, ``w``, and ``b`` in a
+            :py:class:`~solarwindpy.core.storage.ColumnarStorage` so that
+            calculations run on contiguous NumPy arrays instead of the
+            MultiIndex DataFrame.
 
         Notes
         -----
@@ -200,6 +349,7 @@ class Plasma(base.Base):
         self._init_logger()
         self._set_species(*species)
         self.set_log_plasma_stats(log_plasma_stats)
+        self.set_storage_engine(storage)
         super(Plasma, self).__init__(data)
         self._set_ions()
         self.set_spacecraft(spacecraft)
@@ -269,29 +419,149 @@ class Plasma(base.Base):
         --------
         set_log_plasma_stats : Method to modify this setting
         """
-        return self._log_plasma_at_init
+        return self.plasma_stats_mode != "off"
+
+    @property
+    def plasma_stats_mode(self):
+        r"""How load statistics are calculated: "exact", "approximate", or "off"."""
+        return self._plasma_stats_mode
+
+    @property
+    def load_stats(self):
+        r"""Statistics of the data loaded into the plasma.
+
+        Returns
+        -------
+        dict
+            :py:class:`~solarwindpy.core.load_stats.FrameStats` keyed by
+            "plasma", "spacecraft", and "auxiliary_data". Statistics of rows
+            added with :py:meth:`append` are merged into the existing ones, so
+            they describe every row loaded, including rows no longer retained.
+            Empty when statistics are off.
+        """
+        return self.__dict__.setdefault("_load_stats", {})
 
     def set_log_plasma_stats(self, new):
-        """Set flag for logging plasma statistics during initialization.
+        """Set how plasma statistics are calculated and logged at load.
 
         Parameters
         ----------
-        new : bool
-            Whether to enable logging of plasma statistics.
+        new : bool or {"exact", "approximate", "off"}
+            ``"exact"`` calculates exact quantiles, holding a copy of the
+            values while doing so. ``"approximate"`` streams the data once
+            into mergeable quantile sketches with 1% relative accuracy.
+            ``"off"`` skips statistics. True and False are aliases for
+            ``"approximate"`` and ``"off"``.
 
         Notes
         -----
-        When enabled, summary statistics including density ranges, velocity
-        distributions, and magnetic field statistics are logged during
-        plasma initialization.
+        When enabled, NaN counts and summary statistics of each column in
+        linear and logarithmic space are logged during plasma initialization
+        and stored in :py:attr:`load_stats`.
 
         Examples
         --------
         >>> plasma.set_log_plasma_stats(True)  # doctest: +SKIP
         >>> plasma.log_plasma_at_init  # doctest: +SKIP
         True
+        >>> plasma.plasma_stats_mode  # doctest: +SKIP
+        'approximate'
+        """
+        self._plasma_stats_mode = load_stats.conform_mode(new)
+
+    @property
+    def quantity_cache(self):
+        r"""The :py:class:`~solarwindpy.core.quantity_cache.QuantityCache` or None.
+
+        See Also
+        --------
+        enable_cache, disable_cache
         """
-        self._log_plasma_at_init = bool(new)
+        return self.__dict__.get("_quantity_cache")
+
+    def enable_cache(self, max_bytes=256 * 2**20):
+        r"""Memoize derived quantities such as :py:meth:`beta` and :py:meth:`nuc`.
+
+        Results are keyed by method, species, and keyword arguments.
+        :py:meth:`set_data`, :py:meth:`set_spacecraft`, and
+        :py:meth:`estimate_electrons` with ``inplace=True`` clear the cache.
+
+        Parameters
+        ----------
+        max_bytes : int, default 256 MiB
+            Memory budget for cached values. Least recently used values are
+            evicted once the budget is exceeded.
+
+        Returns
+        -------
+        cache : :py:class:`~solarwindpy.core.quantity_cache.QuantityCache`
+
+        Examples
+        --------
+        >>> plasma.enable_cache(max_bytes=2**30)  # doctest: +SKIP
+        >>> beta = plasma.beta("p1")  # doctest: +SKIP
+        >>> plasma.quantity_cache.info  # doctest: +SKIP
+        CacheInfo(hits=0, misses=2, evictions=0, entries=2, nbytes=..., max_bytes=1073741824)
+        """
+        cache = qcache.QuantityCache(max_bytes=max_bytes)
+        self._quantity_cache = cache
+        return cache
+
+    def disable_cache(self):
+        r"""Stop memoizing derived quantities and drop any cached values."""
+        self._quantity_cache = None
+
+    def clear_cache(self):
+        r"""Drop all cached derived quantities."""
+        cache = self.quantity_cache
+        if cache is not None:
+            cache.clear()
+
+    @property
+    def storage_engine(self):
+        r"""Name of the storage engine, either "pandas" or "columnar"."""
+        return self._storage_engine
+
+    @property
+    def storage(self):
+        r"""The :py:class:`~solarwindpy.core.storage.ColumnarStorage` or None.
+
+        Only available when :py:attr:`storage_engine` is "columnar".
+        """
+        store = self.__dict__.get("_storage")
+        if store is None and self.__dict__.get("_storage_engine") == "columnar":
+            # Rebuilt on demand after `append`.
+            if "_data" in self.__dict__:
+                self._set_storage()
+                store = self._storage
+        return store
+
+    def set_storage_engine(self, engine):
+        r"""Select the storage engine used by the derived methods.
+
+        Parameters
+        ----------
+        engine : {"pandas", "columnar"}
+            With "columnar", the number densities, velocities, thermal speeds,
+            and magnetic field are copied into contiguous
+            ``(time, species, component)`` blocks that the derived methods read
+            from. With "pandas", derived methods operate on :py:attr:`data`.
+        """
+        engine = str(engine).lower()
+        if engine not in ("pandas", "columnar"):
+            raise ValueError(f"Unrecognized storage engine: {engine}")
+
+        self._storage_engine = engine
+        if "_data" in self.__dict__:
+            self._set_storage()
+
+    def _set_storage(self):
+        if self.storage_engine == "columnar":
+            store = columnar.ColumnarStorage.from_frame(self.data, self._ion_species())
+            self.logger.debug("columnar storage: %.0f bytes", store.nbytes)
+        else:
+            store = None
+        self._storage = store
 
     def save(
         self,
@@ -302,6 +572,7 @@ class Plasma(base.Base):
         data_modifier_fcn=None,
         sc_modifier_fcn=None,
         aux_modifier_fcn=None,
+        format="fixed",
     ):
         r"""Save the plasma's data and aux DataFrame to an HDF5 file at `fname`.
 
@@ -331,6 +602,11 @@ class Plasma(base.Base):
         aux_modifier_fcn: None, FunctionType
             A function to modify the auxiliary_data saved. See
             `data_modifier_fcn` for syntax.
+        format: str, "fixed"
+            Passed to `pd.DataFrame.to_hdf`. "table" writes queryable stores with
+            an on-disk time index, which :py:meth:`iter_chunks` requires and which
+            lets :py:meth:`load_from_file` read only the rows between `start`
+            and `stop`.
         """
         from types import FunctionType
 
@@ -348,7 +624,7 @@ class Plasma(base.Base):
             data = data_modifier_fcn(data)
 
         # Recalculate "w_scalar" on load, so no need to save.
-        data.drop("scalar", axis=1, level="C").to_hdf(fname, key=dkey)
+        data.drop("scalar", axis=1, level="C").to_hdf(fname, key=dkey, format=format)
         self.logger.info(
             "data saved\n{:<5}  %s\n{:<5}  %s\n{:<5}  %s".format(
                 "file", "dkey", "shape"
@@ -366,7 +642,7 @@ class Plasma(base.Base):
                     raise TypeError(msg % type(sc_modifier_fcn))
                 sc = sc_modifier_fcn(sc)
 
-            sc.to_hdf(fname, key=sckey)
+            sc.to_hdf(fname, key=sckey, format=format)
             self.logger.info(
                 "spacecraft saved\n{:<5}  %s\n{:<5}  %s\n{:<5}  %s".format(
                     "file", "sckey", "shape"
@@ -384,7 +660,7 @@ class Plasma(base.Base):
                     raise TypeError(msg % type(aux_modifier_fcn))
                 aux = aux_modifier_fcn(aux)
 
-            aux.to_hdf(fname, key=akey)
+            aux.to_hdf(fname, key=akey, format=format)
             self.logger.info(
                 "aux saved\n{:<5}  %s\n{:<5}  %s\n{:<5}  %s".format(
                     "file", "akey", "shape"
@@ -426,17 +702,20 @@ class Plasma(base.Base):
         akey: str, "FC_AUX"
             key for getting auxiliary data from HDF5 file.
         start, stop: None, parsable by `pd.to_datetime`
-            If not None, time to start/stop for loading data.
+            If not None, time to start/stop for loading data. When the file was
+            saved with `format="table"`, only these rows are read from disk.
         kwargs:
             Passed to `Plasma.__init__`.
+
+        See Also
+        --------
+        iter_chunks
         """
 
-        data = pd.read_hdf(fname, key=dkey)
+        with pd.HDFStore(fname, mode="r") as store:
+            data = _select_hdf(store, dkey, start, stop)
         data.columns.names = ["M", "C", "S"]
 
-        if start is not None or stop is not None:
-            data = data.loc[start:stop]
-
         if not species:
             species = [s for s in data.columns.get_level_values("S").unique() if s]
         s_chk = [isinstance(s, str) for s in species]
@@ -459,16 +738,19 @@ class Plasma(base.Base):
         )
 
         if sckey:
-            sc = pd.read_hdf(fname, key=sckey)
-            sc.columns.names = ("M", "C")
-
             if (sc_name is None) or (sc_frame is None):
                 raise ValueError(
                     "Must specify spacecraft name and frame\nname : %s\nframe: %s"
                     % (sc_name, sc_frame)
                 )
 
-            if start is not None or stop is not None:
+            with pd.HDFStore(fname, mode="r") as store:
+                sc = _select_hdf(store, sckey, start, stop)
+            sc.columns.names = ("M", "C")
+
+            if (start is not None or stop is not None) and not sc.index.equals(
+                data.index
+            ):
                 sc = sc.loc[data.index]
 
             sc = spacecraft.Spacecraft(sc, sc_name, sc_frame)
@@ -479,10 +761,13 @@ class Plasma(base.Base):
             )
 
         if akey:
-            aux = pd.read_hdf(fname, key=akey)
+            with pd.HDFStore(fname, mode="r") as store:
+                aux = _select_hdf(store, akey, start, stop)
             aux.columns.names = ("M", "C", "S")
 
-            if start is not None or stop is not None:
+            if (start is not None or stop is not None) and not aux.index.equals(
+                data.index
+            ):
                 aux = aux.loc[data.index]
 
             plasma.set_auxiliary_data(aux)
@@ -492,6 +777,545 @@ class Plasma(base.Base):
 
         return plasma
 
+    @classmethod
+    def iter_chunks(
+        cls,
+        fname,
+        *species,
+        chunksize=100_000,
+        dkey="FC",
+        sckey="SC",
+        akey="FC_AUX",
+        sc_frame=None,
+        sc_name=None,
+        start=None,
+        stop=None,
+        **kwargs,
+    ):
+        r"""Iterate over an HDF5 file at `fname` in chunks of plasmas.
+
+        Only `chunksize` rows are held in memory at once. Spacecraft and
+        auxiliary data are read for the same time range as each chunk and
+        aligned with it.
+
+        Parameters
+        ----------
+        fname: str or pathlib.Path
+            File written by :py:meth:`save` with `format="table"`.
+        species: list-like of str
+            The species to load. If none are passed, they are automatically
+            selected from the first chunk.
+        chunksize: int
+            Maximum number of rows in each chunk.
+        dkey, sckey, akey: str
+            See :py:meth:`load_from_file`. Pass a false value for `sckey` or
+            `akey` to skip spacecraft or auxiliary data.
+        sc_frame, sc_name: str
+            Spacecraft frame and name. Required if `sckey`.
+        start, stop: None, parsable by `pd.to_datetime`
+            If not None, time to start/stop for loading data. Selected with the
+            on-disk time index so that rows outside this range aren't read.
+        kwargs:
+            Passed to `Plasma.__init__`. With `log_plasma_stats`, each chunk's
+            statistics are merged and the statistics of the full load are
+            logged once iteration finishes.
+
+        Yields
+        ------
+        plasma: Plasma
+
+        Examples
+        --------
+        >>> plasma.save("swe.h5", format="table")  # doctest: +SKIP
+        >>> for chunk in Plasma.iter_chunks(
+        ...     "swe.h5", chunksize=10_000, sckey=None, akey=None
+        ... ):  # doctest: +SKIP
+        ...     beta = chunk.beta("p1")
+        """
+        chunksize = int(chunksize)
+        if chunksize < 1:
+            raise ValueError(f"`chunksize` must be positive, not {chunksize}")
+        if sckey and ((sc_name is None) or (sc_frame is None)):
+            raise ValueError(
+                "Must specify spacecraft name and frame\nname : %s\nframe: %s"
+                % (sc_name, sc_frame)
+            )
+
+        with pd.HDFStore(fname, mode="r") as store:
+            for key in (dkey, sckey, akey):
+                if key and not store.get_storer(key).is_table:
+                    raise ValueError(
+                        "Chunked iteration requires a table-format store. Re-save "
+                        "`%s` with `Plasma.save(..., format='table')`.\nkey: %s"
+                        % (fname, key)
+                    )
+
+            chunks = store.select(
+                dkey,
+                where=_time_range_where(start, stop),
+                chunksize=chunksize,
+                iterator=True,
+            )
+
+            totals = {}
+            plasma = None
+            for data in chunks:
+                if data.empty:
+                    continue
+                data.columns.names = ["M", "C", "S"]
+
+                if not species:
+                    species = [
+                        s for s in data.columns.get_level_values("S").unique() if s
+                    ]
+
+                t0 = data.index[0]
+                t1 = data.index[-1]
+                plasma = cls(data, *species, **kwargs)
+
+                if sckey:
+                    sc = _select_hdf(store, sckey, t0, t1).loc[data.index]
+                    sc.columns.names = ("M", "C")
+                    plasma.set_spacecraft(spacecraft.Spacecraft(sc, sc_name, sc_frame))
+
+                if akey:
+                    aux = _select_hdf(store, akey, t0, t1).loc[data.index]
+                    aux.columns.names = ("M", "C", "S")
+                    plasma.set_auxiliary_data(aux)
+
+                plasma.logger.debug(
+                    "Loaded chunk from file\nFile:  %s\nshape : %s\nstart : %s\nstop  : %s",
+                    str(fname),
+                    data.shape,
+                    t0,
+                    t1,
+                )
+
+                for name, stats in plasma.load_stats.items():
+                    total = totals.get(name)
+                    if total is None:
+                        totals[name] = stats.copy()
+                    elif total.columns.equals(stats.columns):
+                        total.merge(stats)
+
+                yield plasma
+
+            # Statistics of the whole load, merged from each chunk.
+            for name, total in totals.items():
+                plasma._log_stats("%s (all chunks)" % name, total)
+
+    @classmethod
+    def load_many(
+        cls,
+        fnames,
+        *species,
+        n_jobs=1,
+        backend="processes",
+        dkey="FC",
+        sckey="SC",
+        akey="FC_AUX",
+        sc_frame=None,
+        sc_name=None,
+        start=None,
+        stop=None,
+        **kwargs,
+    ):
+        r"""Load many HDF5 files, e.g. a daily archive, into one plasma.
+
+        Files are read concurrently, the raw frames are concatenated once, and
+        the plasma is conformed, validated, and its ions built once.
+
+        Parameters
+        ----------
+        fnames: iterable of str or pathlib.Path
+            Files written by :py:meth:`save`.
+        species: list-like of str
+            The species to load. If none are passed, they are automatically
+            selected from the data.
+        n_jobs: int
+            Number of files read at once. Negative values count back from the
+            number of CPUs, so -1 uses all of them.
+        backend: {"processes", "threads"}
+            Pool used when `n_jobs` isn't 1. HDF5 builds that aren't
+            thread-safe serialize reads, so processes are the default.
+        dkey, sckey, akey, sc_frame, sc_name, start, stop:
+            See :py:meth:`load_from_file`.
+        kwargs:
+            Passed to `Plasma.__init__`.
+
+        Returns
+        -------
+        plasma: Plasma
+            The combined plasma. Per-file read times are in
+            :py:attr:`load_timing`.
+
+        Examples
+        --------
+        >>> fnames = sorted(Path("archive").glob("wind_*.h5"))  # doctest: +SKIP
+        >>> plasma = Plasma.load_many(
+        ...     fnames, "a", "p1", n_jobs=-1, sc_name="Wind", sc_frame="GSE"
+        ... )  # doctest: +SKIP
+        >>> plasma.load_timing.seconds.describe()  # doctest: +SKIP
+        """
+        from functools import partial
+
+        fnames = [str(f) for f in fnames]
+        if not fnames:
+            raise ValueError("No files to load.")
+        if backend not in ("processes", "threads"):
+            raise ValueError(f"Unrecognized backend `{backend}`")
+        if sckey and ((sc_name is None) or (sc_frame is None)):
+            raise ValueError(
+                "Must specify spacecraft name and frame\nname : %s\nframe: %s"
+                % (sc_name, sc_frame)
+            )
+
+        read = partial(
+            _read_hdf_file, dkey=dkey, sckey=sckey, akey=akey, start=start, stop=stop
+        )
+        t0 = time.perf_counter()
+        if backend == "processes":
+            results = parallel.map_processes(read, fnames, n_jobs)
+        else:
+            results = parallel.map_threads(read, fnames, n_jobs)
+        t_read = time.perf_counter() - t0
+
+        timing = pd.DataFrame(
+            {
+                "seconds": [seconds for _, seconds in results],
+                "rows": [len(frames["data"]) for frames, _ in results],
+            },
+            index=pd.Index(fnames, name="file"),
+        )
+
+        # Concatenate in time order so the combined index is sorted.
+        results = [frames for frames, _ in results if len(frames["data"])]
+        if not results:
+            raise ValueError("No data in files between %s and %s" % (start, stop))
+        results.sort(key=lambda frames: frames["data"].index[0])
+
+        def combine(name):
+            frames = [r[name] for r in results]
+            if all(f is None for f in frames):
+                return None
+            combined = pd.concat(frames, axis=0, sort=False)
+            if not combined.index.is_monotonic_increasing:
+                combined = combined.sort_index(kind="mergesort")
+            return combined
+
+        data = combine("data")
+        data.columns.names = ["M", "C", "S"]
+        if not species:
+            species = [s for s in data.columns.get_level_values("S").unique() if s]
+
+        log_at_init = kwargs.pop("log_plasma_stats", False)
+        plasma = cls(data, *species, log_plasma_stats=log_at_init, **kwargs)
+
+        if sckey:
+            sc = combine("spacecraft")
+            sc.columns.names = ("M", "C")
+            plasma.set_spacecraft(
+                spacecraft.Spacecraft(sc.loc[data.index], sc_name, sc_frame)
+            )
+
+        if akey:
+            aux = combine("auxiliary_data")
+            aux.columns.names = ("M", "C", "S")
+            plasma.set_auxiliary_data(aux.loc[data.index])
+
+        plasma._load_timing = timing
+        plasma.logger.warning(
+            "Loaded plasma from %s files\nshape : %s\nstart : %s\nstop  : %s\n"
+            "read  : %.3f s (%s workers)\nbuild : %.3f s",
+            len(fnames),
+            data.shape,
+            data.index.min(),
+            data.index.max(),
+            t_read,
+            min(parallel.n_workers(n_jobs), len(fnames)),
+            time.perf_counter() - t0 - t_read,
+        )
+        plasma.logger.info("Per-file read times\n%s", timing.to_string())
+        return plasma
+
+    @property
+    def load_timing(self):
+        r"""Per-file read time and rows of a plasma from :py:meth:`load_many`.
+
+        None for plasmas created by other means.
+        """
+        return self.__dict__.get("_load_timing")
+
+    def save_parquet(self, path, partition="M"):
+        r"""Save the plasma to a directory of time-partitioned Parquet datasets.
+
+        Data, spacecraft, and auxiliary data are written to the `data`,
+        `spacecraft`, and `auxiliary_data` subdirectories of `path`. Partitions
+        that are rewritten replace existing files, so saving a plasma covering
+        new periods into an existing `path` extends it.
+
+        Parameters
+        ----------
+        path: str or pathlib.Path
+            Directory in which to save the plasma.
+        partition: {"Y", "M", "D"} or None
+            Partition the datasets by year, month, or day so that
+            :py:meth:`load_parquet` only opens files overlapping the requested
+            time range. None writes a single partition.
+
+        Notes
+        -----
+        Requires `pyarrow`.
+        """
+        from pathlib import Path
+
+        path = Path(path)
+        data = self.data.drop("scalar", axis=1, level="C")
+        meta = {"species": list(self.species)}
+
+        sc = self.sc
+        if sc is not None:
+            meta["sc_name"] = sc.name
+            meta["sc_frame"] = sc.frame
+            parquet_io.write_frame(sc.data, path / "spacecraft", partition=partition)
+
+        if self.aux is not None:
+            parquet_io.write_frame(
+                self.aux, path / "auxiliary_data", partition=partition
+            )
+
+        # Write data last so that its metadata describe the saved plasma.
+        parquet_io.write_frame(data, path / "data", partition=partition, metadata=meta)
+        self.logger.info(
+            "Parquet saved\n{:<9}  %s\n{:<9}  %s\n{:<9}  %s".format(
+                "path", "partition", "shape"
+            ),
+            str(path),
+            partition,
+            data.shape,
+        )
+
+    @classmethod
+    def load_parquet(
+        cls,
+        path,
+        *species,
+        measurements=None,
+        start=None,
+        stop=None,
+        spacecraft_data=True,
+        auxiliary_data=True,
+        sc_frame=None,
+        sc_name=None,
+        **kwargs,
+    ):
+        r"""Load a plasma saved with :py:meth:`save_parquet`.
+
+        Only the columns for the requested species and measurements and only
+        the partitions overlapping `start`-`stop` are read from disk.
+
+        Parameters
+        ----------
+        path: str or pathlib.Path
+            Directory written by :py:meth:`save_parquet`.
+        species: list-like of str
+            The species to load. If none are passed, load the saved species.
+        measurements: None, list-like of str
+            Measurements ("M" level) to load in addition to the "n", "v",
+            "w", and "b" that a plasma requires. If None, load all.
+        start, stop: None, parsable by `pd.to_datetime`
+            If not None, time to start/stop for loading data.
+        spacecraft_data, auxiliary_data: bool
+            If True, load spacecraft and auxiliary data when they were saved.
+        sc_frame, sc_name: None, str
+            Override the spacecraft frame and name saved with the plasma.
+        kwargs:
+            Passed to `Plasma.__init__`.
+
+        Notes
+        -----
+        Requires `pyarrow`.
+        """
+        from pathlib import Path
+
+        path = Path(path)
+        meta = parquet_io.read_metadata(path / "data")
+        if not species:
+            species = meta["species"]
+        s_chk = [isinstance(s, str) for s in species]
+        if not np.all(s_chk):
+            msg = "Only string species allowed. Default or passed species: {}.".format(
+                s_chk
+            )
+            raise ValueError(msg)
+
+        if measurements is not None:
+            measurements = set(measurements).union(("n", "v", "w", "b"))
+
+        data = parquet_io.read_frame(
+            path / "data",
+            species=species,
+            measurements=measurements,
+            start=start,
+            stop=stop,
+        )
+
+        log_at_init = kwargs.pop("log_plasma_stats", False)
+        plasma = cls(data, *species, log_plasma_stats=log_at_init, **kwargs)
+        plasma.logger.warning(
+            "Loaded plasma from Parquet\nPath  :  %s\nshape : %s\nstart : %s\nstop  : %s",
+            str(path),
+            data.shape,
+            data.index.min(),
+            data.index.max(),
+        )
+
+        if spacecraft_data and parquet_io.exists(path / "spacecraft"):
+            sc = parquet_io.read_frame(path / "spacecraft", start=start, stop=stop)
+            sc = spacecraft.Spacecraft(
+                sc.loc[data.index],
+                meta["sc_name"] if sc_name is None else sc_name,
+                meta["sc_frame"] if sc_frame is None else sc_frame,
+            )
+            plasma.set_spacecraft(sc)
+
+        if auxiliary_data and parquet_io.exists(path / "auxiliary_data"):
+            aux = parquet_io.read_frame(
+                path / "auxiliary_data", species=species, start=start, stop=stop
+            )
+            plasma.set_auxiliary_data(aux.loc[data.index])
+
+        return plasma
+
+    @classmethod
+    def _from_validated(
+        cls,
+        data,
+        *species,
+        spacecraft=None,
+        auxiliary_data=None,
+        log_plasma_stats=False,
+        storage="pandas",
+        columnar_storage=None,
+    ):
+        r"""Build a plasma around `data` without copying it.
+
+        `data` must already be conformed by :py:meth:`set_data`, e.g. taken
+        from another plasma's :py:attr:`data`. Spacecraft and auxiliary data
+        are set without index checks. A `columnar_storage` aligned with `data`
+        is used as is rather than built from `data`.
+        """
+        plasma = cls.__new__(cls)
+        base.Core.__init__(plasma)
+        plasma._set_species(*species)
+        plasma.set_log_plasma_stats(log_plasma_stats)
+        plasma.set_storage_engine(storage)
+
+        plasma._data = data
+        plasma._bfield = vector.BField(data.b.xs("", axis=1, level="S"))
+        if columnar_storage is None:
+            plasma._set_storage()
+        else:
+            plasma._storage = columnar_storage
+        plasma._set_ions()
+        plasma._spacecraft = spacecraft
+        plasma._auxiliary_data = auxiliary_data
+        return plasma
+
+    def to_dask(self, npartitions=None, chunksize=None):
+        r"""Partition the plasma by time into a lazy :py:class:`DaskPlasma`.
+
+        Derived methods of the result have the same signatures and return dask
+        objects that are evaluated in parallel with ``.compute()``.
+
+        Parameters
+        ----------
+        npartitions, chunksize: int, optional
+            Number of partitions or rows per partition. Defaults to one
+            partition per CPU.
+
+        Notes
+        -----
+        Requires `dask[dataframe]`.
+
+        See Also
+        --------
+        solarwindpy.core.dask_plasma.DaskPlasma
+        """
+        from .dask_plasma import DaskPlasma
+
+        return DaskPlasma.from_plasma(
+            self, npartitions=npartitions, chunksize=chunksize
+        )
+
+    def to_shared(self, path=None):
+        r"""Export the plasma to memory-mapped buffers shareable by processes.
+
+        Send the returned handle to `joblib` or `multiprocessing` workers and
+        reattach with :py:meth:`from_shared`. Workers map the same pages
+        instead of each unpickling a copy of the data.
+
+        Parameters
+        ----------
+        path: None, str or pathlib.Path
+            Empty directory in which to write the buffers. If None, a
+            temporary directory in ``/dev/shm`` is used when available.
+
+        Returns
+        -------
+        handle: :py:class:`~solarwindpy.core.shared.SharedPlasmaHandle`
+            Picklable handle. Call `handle.release()` to delete the buffers.
+
+        Examples
+        --------
+        With ``work(handle, s)`` calling ``Plasma.from_shared(handle)``:
+
+        >>> from joblib import Parallel, delayed  # doctest: +SKIP
+        >>> handle = plasma.to_shared()  # doctest: +SKIP
+        >>> out = Parallel(n_jobs=64)(delayed(work)(handle, s) for s in plasma.species)  # doctest: +SKIP
+        >>> handle.release()  # doctest: +SKIP
+        """
+        handle = shared.export_plasma(self, path)
+        self.logger.info("Exported plasma to shared buffers\npath: %s", handle.path)
+        return handle
+
+    @classmethod
+    def from_shared(cls, handle, mmap_mode="c", storage=None):
+        r"""Attach to a plasma exported with :py:meth:`to_shared`.
+
+        Parameters
+        ----------
+        handle: :py:class:`~solarwindpy.core.shared.SharedPlasmaHandle`, str
+            Handle returned by :py:meth:`to_shared` or its path.
+        mmap_mode: {"c", "r"}
+            With "c", writes are private to the process and only copy the
+            pages they touch. With "r", the buffers are read-only.
+        storage: None, {"pandas", "columnar"}
+            Storage engine. If None, use the exported plasma's engine. The
+            columnar blocks are built from the mapped data in each process.
+
+        Returns
+        -------
+        plasma: Plasma
+            Plasma whose data, spacecraft, and auxiliary data are views of the
+            shared buffers.
+        """
+        meta, frames = shared.attach_plasma(handle, mmap_mode=mmap_mode)
+
+        sc = frames["spacecraft"]
+        if sc is not None:
+            sc = spacecraft.Spacecraft._from_validated(
+                sc, meta["spacecraft"]["name"], meta["spacecraft"]["frame"]
+            )
+
+        return cls._from_validated(
+            frames["data"],
+            *meta["species"],
+            spacecraft=sc,
+            auxiliary_data=frames["auxiliary_data"],
+            storage=meta["storage"] if storage is None else storage,
+        )
+
     def _set_species(self, *species):
         r"""Initialize `species` property to make overriding `set_data` easier.
 
@@ -535,18 +1359,46 @@ class Plasma(base.Base):
     @property
     def ions(self):
         r"""`pd.Series` containing the ions."""
-        return self._ions
-
-    def _set_ions(self):
+        ions_ = self._ions
+        if ions_ is None:
+            # Rebuilt on demand after `append`.
+            self._set_ions()
+            ions_ = self._ions
+        return ions_
+
+    def _ion_species(self):
         species = self.species
         if len(species) == 1:
             species = species[0].split(",")
         assert np.all(
             ["+" not in s for s in species]
         ), "Plasma.species can't contain '+'."
-        species = tuple(species)
+        return tuple(species)
+
+    def _set_ions(self):
+        r"""Create lazily materialized :py:class:`Ion` views of each species.
 
-        ions_ = pd.Series({s: ions.Ion(self.data, s) for s in species})
+        The ions share this plasma's data, storage, units, and constants, so the
+        cost of creating them doesn't scale with the number of species.
+        """
+        species = self._ion_species()
+        data = self.data
+
+        required = [(m, c, s) for s in species for m, c in ions.Ion._required_columns]
+        if not pd.Index(required).isin(data.columns).all():
+            raise ValueError("Missing required columns in data")
+
+        store = self.storage
+        units = self.units
+        constants = self.constants
+        ions_ = pd.Series(
+            {
+                s: ions.Ion.view(
+                    data, s, storage=store, units=units, constants=constants
+                )
+                for s in species
+            }
+        )
         self._ions = ions_
         self._species = species
 
@@ -591,8 +1443,12 @@ class Plasma(base.Base):
             *remaining,
             spacecraft=self.spacecraft,
             auxiliary_data=aux,
-            log_plasma_stats=self.log_plasma_at_init,
+            log_plasma_stats=self.plasma_stats_mode,
+            storage=self.storage_engine,
         )
+        cache = self.quantity_cache
+        if cache is not None:
+            new.enable_cache(max_bytes=cache.max_bytes)
         return new
 
     def set_spacecraft(self, new):
@@ -633,6 +1489,7 @@ class Plasma(base.Base):
 
         self._log_object_at_load(new.data if new is not None else new, "spacecraft")
         self._spacecraft = new
+        self.clear_cache()
 
     def set_auxiliary_data(self, new):
         """Set or update auxiliary measurement data.
@@ -656,116 +1513,373 @@ class Plasma(base.Base):
         examples include quality flags, statistical uncertainties, or
         instrument operational parameters.
 
-        Examples
-        --------
-        >>> quality_flags = pd.DataFrame({'quality': [0, 1, 0]},  # doctest: +SKIP
-        ...                              index=plasma.epoch)
-        >>> plasma.set_auxiliary_data(quality_flags)  # doctest: +SKIP
-        >>> plasma.aux.quality  # Access auxiliary data  # doctest: +SKIP
+        Examples
+        --------
+        >>> quality_flags = pd.DataFrame({'quality': [0, 1, 0]},  # doctest: +SKIP
+        ...                              index=plasma.epoch)
+        >>> plasma.set_auxiliary_data(quality_flags)  # doctest: +SKIP
+        >>> plasma.aux.quality  # Access auxiliary data  # doctest: +SKIP
+        """
+        assert isinstance(new, pd.DataFrame) or new is None
+
+        if new is not None:
+            assert isinstance(new.index, pd.DatetimeIndex)
+            assert new.index.equals(self.data.index)
+            assert new.columns.names == ("M", "C", "S")
+            if new.columns.isin(self.data.columns).any():
+                raise ValueError("Auxiliary data should not duplicate plasma data")
+
+        self._log_object_at_load(new, "auxiliary_data")
+        self._auxiliary_data = new
+        self._flags = None
+
+    def set_flags(self, definitions=None, **flags):
+        r"""Define named data quality flags.
+
+        Flags are evaluated when first used, packed into one ``uint64`` per
+        time by :py:class:`~solarwindpy.core.quality_flags.FlagIndex`, and
+        re-evaluated after the auxiliary data changes. Up to 64 flags are
+        supported.
+
+        Parameters
+        ----------
+        definitions : dict, optional
+            Maps flag names to definitions. Replaces any existing flags.
+        flags :
+            Flag names and definitions added to `definitions`. A definition
+            is one of
+
+            - an auxiliary data column label, e.g. ``("fit_flag", "", "p1")``,
+              with the flag set where the column is non-zero;
+            - a callable taking :py:attr:`auxiliary_data` and returning
+              booleans for each time;
+            - booleans for each time.
+
+        Examples
+        --------
+        >>> plasma.set_flags(  # doctest: +SKIP
+        ...     converged=("fit_flag", "", "p1"),
+        ...     dense=lambda aux: aux.loc[:, ("counts", "", "")] > 100,
+        ... )
+        >>> good = plasma.where_flags(include="converged", exclude="dense")  # doctest: +SKIP
+        """
+        definitions = dict(definitions or {})
+        definitions.update(flags)
+        if len(definitions) > quality_flags.MAX_FLAGS:
+            raise ValueError(
+                "At most %s flags are supported." % quality_flags.MAX_FLAGS
+            )
+        self._flag_definitions = definitions
+        self._flags = None
+
+    @property
+    def flags(self):
+        r"""The :py:class:`~solarwindpy.core.quality_flags.FlagIndex` or None.
+
+        See :py:meth:`set_flags`.
+        """
+        index = self.__dict__.get("_flags")
+        definitions = self.__dict__.get("_flag_definitions")
+        if index is None and definitions:
+            index = quality_flags.FlagIndex.from_definitions(
+                definitions, self.auxiliary_data, self.data.shape[0]
+            )
+            self._flags = index
+        return index
+
+    def where_flags(self, include=(), exclude=()):
+        r"""Select the times with every flag in `include` and none in `exclude`.
+
+        Parameters
+        ----------
+        include, exclude : str or iterable of str
+            Flag names defined with :py:meth:`set_flags`.
+
+        Returns
+        -------
+        plasma : :py:class:`Plasma`
+            Plasma with the selected times, its spacecraft, auxiliary data, and
+            flags. Data are taken by position without being validated again.
+        """
+        index = self.flags
+        if index is None:
+            raise ValueError("No flags defined. See `Plasma.set_flags`.")
+
+        rows = index.mask(include=include, exclude=exclude)
+        if not rows.any():
+            raise ValueError(
+                "No data with flags include=%s, exclude=%s" % (include, exclude)
+            )
+
+        new = self._take_rows(rows)
+        new._flags = index.take(rows)
+        return new
+
+    def _take_rows(self, rows, sc_rows=None, aux_rows=None, columnar_storage=None):
+        r"""Plasma with `rows` of the data, spacecraft, and auxiliary data.
+
+        `sc_rows` and `aux_rows` default to `rows`. Rows are taken by position
+        with ``iloc``, so slices share memory with this plasma. The result
+        keeps the flags definitions and quantity cache settings.
+        """
+        sc = self.spacecraft
+        if sc is not None:
+            sc_rows = rows if sc_rows is None else sc_rows
+            sc = type(sc)._from_validated(sc.data.iloc[sc_rows], sc.name, sc.frame)
+        aux = self.auxiliary_data
+        if aux is not None:
+            aux = aux.iloc[rows if aux_rows is None else aux_rows]
+
+        new = type(self)._from_validated(
+            self.data.iloc[rows],
+            *self.species,
+            spacecraft=sc,
+            auxiliary_data=aux,
+            log_plasma_stats=self.plasma_stats_mode,
+            storage=self.storage_engine,
+            columnar_storage=columnar_storage,
+        )
+        new._flag_definitions = self.__dict__.get("_flag_definitions")
+        cache = self.quantity_cache
+        if cache is not None:
+            new.enable_cache(max_bytes=cache.max_bytes)
+        return new
+
+    def _aligned_rows(self, name, other, start, stop, rows):
+        r"""Positions in `other`'s index of the data `rows` from `start` to `stop`.
+
+        Indices checked to equal :py:attr:`data`'s are remembered by identity,
+        so aligned spacecraft and auxiliary data reuse `rows` without another
+        comparison. Otherwise, `other` is searched for `start` and `stop`.
+        """
+        index = other.index
+        aligned = self.__dict__.setdefault("_aligned", {})
+        if aligned.get(name) is not index:
+            if not index.equals(self.data.index):
+                return _search_rows(index, start, stop)
+            aligned[name] = index
+        return rows
+
+    def slice(self, start=None, stop=None):
+        r"""Times from `start` to `stop`, inclusive, sharing this plasma's memory.
+
+        Parameters
+        ----------
+        start, stop : str, datetime, or pd.Timestamp, optional
+            Bounds. None selects from the first or to the last time. As with
+            ``data.loc``, partial date strings cover their whole period, e.g.
+            ``slice("2020-01", "2020-01")`` selects all of January.
+
+        Returns
+        -------
+        plasma : :py:class:`Plasma`
+            Plasma with the selected times, its spacecraft, auxiliary data, and
+            flags. The data, spacecraft, auxiliary data, and columnar storage
+            are views taken by position after a binary search of the sorted
+            time index. They aren't validated or logged again. Equivalent to
+            ``plasma.loc[start:stop]``.
+
+        Notes
+        -----
+        Modifying the result's data modifies this plasma's. Methods writing
+        in place, e.g. ``estimate_electrons(inplace=True)``, copy the data
+        and storage first.
+        """
+        key = (start, stop)
+        slices = self.__dict__.get("_slices")
+        if slices is None:
+            slices = self._slices = OrderedDict()
+
+        data = self.data
+        cached = slices.get(key)
+        if cached is not None and cached[0] is data.index:
+            slices.move_to_end(key)
+            rows = cached[1]
+        else:
+            rows = _search_rows(data.index, start, stop)
+            slices[key] = (data.index, rows)
+            while len(slices) > _SLICE_CACHE_SIZE:
+                slices.popitem(last=False)
+
+        if rows.start == rows.stop:
+            raise ValueError("No data from %s to %s" % key)
+
+        sc = self.spacecraft
+        sc_rows = None if sc is None else self._aligned_rows("sc", sc.data, *key, rows)
+        aux = self.auxiliary_data
+        aux_rows = None if aux is None else self._aligned_rows("aux", aux, *key, rows)
+
+        store = self.storage
+        if store is not None:
+            store = store.rows(rows.start, rows.stop)
+
+        new = self._take_rows(
+            rows, sc_rows=sc_rows, aux_rows=aux_rows, columnar_storage=store
+        )
+        flags = self.__dict__.get("_flags")
+        if flags is not None:
+            new._flags = flags.take(rows)
+        # Copied before in-place writes, see `_own_buffers`.
+        new._views = True
+        return new
+
+    def _own_buffers(self):
+        r"""Copy data and storage that are views of another plasma's.
+
+        Called before writing in place, so the other plasma and its quantity
+        cache don't see the write.
         """
-        assert isinstance(new, pd.DataFrame) or new is None
+        if not self.__dict__.get("_views"):
+            return
+        self._data = self.data.copy()
+        # Rebuilt from the copied data on next access.
+        self._storage = None
+        self._views = False
 
-        if new is not None:
-            assert isinstance(new.index, pd.DatetimeIndex)
-            assert new.index.equals(self.data.index)
-            assert new.columns.names == ("M", "C", "S")
-            if new.columns.isin(self.data.columns).any():
-                raise ValueError("Auxiliary data should not duplicate plasma data")
+    @property
+    def loc(self):
+        r"""Slice by time, e.g. ``plasma.loc["2020-01-01":"2020-01-02"]``.
 
-        self._log_object_at_load(new, "auxiliary_data")
-        self._auxiliary_data = new
+        See :py:meth:`slice`.
+        """
+        return _TimeSlicer(self)
+
+    def _log_object_at_load(self, data, name, merge=False):
+        r"""Calculate, store, and log the load statistics of `data`.
 
-    def _log_object_at_load(self, data, name):
+        If `merge`, the statistics are merged into those already stored under
+        `name`. Returns the statistics of `data` alone.
+        """
 
         if data is None:
             self.logger.info("No %s data passed to %s", name, self.__class__.__name__)
+            self.load_stats.pop(name, None)
+            return None
+
+        elif not self.log_plasma_at_init:
             return None
 
-        elif self.log_plasma_at_init:
+        stats = load_stats.FrameStats.from_frame(data, mode=self.plasma_stats_mode)
+        stored = self.load_stats.get(name)
+        if (
+            merge
+            and stored is not None
+            and stored.mode == stats.mode
+            and stored.columns.equals(stats.columns)
+        ):
+            stored.merge(stats)
+        else:
+            self.load_stats[name] = stats.copy()
 
-            nan_frame = data.isna()
-            nan_info = pd.DataFrame(
-                {"count": nan_frame.sum(axis=0), "mean": nan_frame.mean(axis=0)}
-            )
-            # Log to DEBUG if no NaNs. Otherwise log to INFO.
-            if nan_info.any().any():
-                self.logger.info(
-                    "%s %.0f spectra contain at least one NaN",
-                    name,
-                    nan_info.any(axis=1).sum(),
-                )
-                #             self.logger.log(10 * int(1 + nan_info.any().any()),
-                #                             "plasma NaN info\n%s", nan_info.to_string())
-                self.logger.debug("%s NaN info\n%s", name, nan_info.to_string())
-            else:
-                self.logger.debug("%s does not contain NaNs", name)
-
-            pct = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
-            stats = (
-                pd.concat(
-                    {
-                        "lin": data.describe(percentiles=pct),
-                        "log": data.applymap(np.log10).describe(percentiles=pct),
-                    },
-                    axis=0,
-                )
-                .unstack(level=0)
-                .sort_index(axis=0)
-                .sort_index(axis=1)
-                .T
-            )
-            self.logger.debug(
-                "%s stats\n%s\n%s",
+        self._log_stats(name, stats)
+        return stats
+
+    def _log_stats(self, name, stats):
+        r"""Log NaN info and summary statistics from a `FrameStats`."""
+        nan_info = stats.nan_info()
+        # Log to DEBUG if no NaNs. Otherwise log to INFO.
+        if stats.rows_with_nan:
+            self.logger.info(
+                "%s %.0f spectra contain at least one NaN",
                 name,
-                stats.loc[:, ["count", "mean", "std"]].to_string(),
-                stats.drop(["count", "mean", "std"], axis=1).to_string(),
+                stats.rows_with_nan,
             )
+            self.logger.debug("%s NaN info\n%s", name, nan_info.to_string())
+        else:
+            self.logger.debug("%s does not contain NaNs", name)
 
-    def set_data(self, new):
-        r"""Set the data and log statistics about it."""
-        super(Plasma, self).set_data(new)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return None
+
+        table = stats.describe()
+        self.logger.debug(
+            "%s stats\n%s\n%s",
+            name,
+            table.loc[:, ["count", "mean", "std"]].to_string(),
+            table.drop(["count", "mean", "std"], axis=1).to_string(),
+        )
+
+    def _conform_data(self, new):
+        r"""Select the plasma columns of `new` and calculate the scalar `w`.
 
-        new = new.reorder_levels(["M", "C", "S"], axis=1).sort_index(axis=1)
-        assert new.columns.names == ["M", "C", "S"]
+        Columns are selected by label, the scalar thermal speeds are
+        calculated with :py:func:`_w_scalar`, and everything is gathered into
+        a single column-major array in sorted column order. `new` is sorted
+        once and copied once.
+
+        Returns
+        -------
+        data, dropped: pd.DataFrame
+            The conformed data and the columns of `new` that aren't kept.
+        """
+        columns = new.columns.reorder_levels(
+            [new.columns.names.index(x) for x in ("M", "C", "S")]
+        )
+        assert columns.names == ["M", "C", "S"]
 
         # These are the only quantities we want in plasma.
         # TODO: move `theta_rms`, `mag_rms` and anything not common to
         #       multiple spacecraft to `auxiliary_data`. (20190216)
-        tk_plasma = pd.IndexSlice[
+        tk_plasma = (
             ["b", "n", "v", "w"],
             ["", "x", "y", "z", "per", "par"],
             list(self.species) + [""],
-        ]
-
-        data = new.loc[:, tk_plasma].sort_index(axis=1)
-        dropped = new.drop(data.columns, axis=1)
-        data = data.loc[:, ~data.columns.duplicated()]
+        )
+        levels = [columns.get_level_values(i) for i in range(3)]
+        keep = np.ones(len(columns), dtype=bool)
+        for level, labels in zip(levels, tk_plasma):
+            present = pd.Index(level.unique())
+            for label in labels:
+                if label not in present:
+                    raise KeyError(label)
+            keep &= level.isin(labels)
+
+        dropped = new.iloc[:, ~keep]
+        keep &= ~columns.duplicated()
+        positions = np.flatnonzero(keep)
+
+        labels = columns[positions]
+        is_w = labels.get_level_values("M") == "w"
+        w_par = np.flatnonzero(is_w & (labels.get_level_values("C") == "par"))
+        w_per = np.flatnonzero(is_w & (labels.get_level_values("C") == "per"))
+        w_species = sorted(
+            set(labels[w_par].get_level_values("S"))
+            | set(labels[w_per].get_level_values("S"))
+        )
+        scalar = pd.MultiIndex.from_tuples(
+            [("w", "scalar", s) for s in w_species], names=["M", "C", "S"]
+        )
 
-        coeff = pd.Series({"per": 2.0, "par": 1.0}) / 3.0
+        out_columns = self.mi_tuples(labels.append(scalar))
+        order = out_columns.argsort()
+        out_columns = out_columns[order]
 
-        w = (
-            data.loc[:, pd.IndexSlice["w", ["par", "per"]]]
-            .pow(2)
-            .multiply(coeff, axis=1, level="C")
-        )
+        dtype = np.result_type(np.float64, *new.dtypes.iloc[positions])
+        out = np.empty((new.shape[0], len(out_columns)), dtype=dtype, order="F")
 
-        # TODO: test `skipna=False` to ensure we don't accidentially create valid data
-        #       where there is none. Actually, not possible as we are combining along
-        #       "S".
+        # Map each output column back to its input column or scalar `w`.
+        source = np.empty(len(out_columns), dtype=np.intp)
+        source[order] = np.arange(len(out_columns))
+        for j, i in zip(source[: len(positions)], positions):
+            out[:, j] = new.iloc[:, i].to_numpy()
 
-        # Workaround for `skipna=False` bug. (20200814)
-        # Changed to new groupby method (20250611)
-        w = w.T.groupby("S").sum().T.pow(0.5)
+        def gather(locs):
+            arr = np.full((new.shape[0], len(w_species)), np.nan, dtype=dtype)
+            for k in locs:
+                s = labels[k][2]
+                arr[:, w_species.index(s)] = out[:, source[k]]
+            return arr
 
-        # TODO: can probably just `w.columns.map(lambda x: ("w", "scalar", x))`
-        w.columns = w.columns.to_series().apply(lambda x: ("w", "scalar", x))
-        w.columns = self.mi_tuples(w.columns)
+        out[:, source[len(positions) :]] = _w_scalar(gather(w_par), gather(w_per))
 
-        data = pd.concat([data, w], axis=1, sort=False).sort_index(axis=1)
+        data = pd.DataFrame(out, index=new.index, columns=out_columns, copy=False)
+        return data, dropped
 
-        data.columns = self.mi_tuples(data.columns)
-        data = data.sort_index(axis=1)
+    def set_data(self, new):
+        r"""Set the data and log statistics about it."""
+        super(Plasma, self).set_data(new)
 
+        data, dropped = self._conform_data(new)
         self._data = data
         self.logger.debug(
             "plasma shape: %s\nstart: %s\nstop: %s",
@@ -782,19 +1896,287 @@ class Plasma(base.Base):
             self.logger.info("no columns dropped from plasma")
 
         self._bfield = vector.BField(data.b.xs("", axis=1, level="S"))
+        self._set_storage()
+        self.clear_cache()
+        self._flags = None
 
         self._log_object_at_load(data, "plasma")
 
+    def _frame_buffer(self, key, frame):
+        r"""The :py:class:`FrameBuffer` holding `frame`, creating it if needed.
+
+        Buffers are only reused while `frame` is the object they last returned,
+        so setting data, spacecraft, or auxiliary data by other means starts a
+        new buffer.
+        """
+        buffers = self.__dict__.setdefault("_frame_buffers", {})
+        buf, last = buffers.get(key, (None, None))
+        if buf is None or last is not frame:
+            buf = frame_buffer.FrameBuffer(frame)
+        return buf
+
+    def _conform_appended(self, new):
+        r"""Validate and conform rows passed to :py:meth:`append`."""
+        if new.empty:
+            raise ValueError("You can't append empty data.")
+        self._verify_datetimeindex(new)
+
+        try:
+            data, dropped = self._conform_data(new)
+        except KeyError as e:
+            raise ValueError(
+                "Appended data doesn't match plasma columns.\n%s" % e
+            ) from e
+        if not data.columns.equals(self.data.columns):
+            raise ValueError(
+                "Appended data doesn't match plasma columns.\nmissing: %s\nextra: %s"
+                % (
+                    self.data.columns.difference(data.columns).tolist(),
+                    data.columns.difference(self.data.columns).tolist(),
+                )
+            )
+        return data, dropped
+
+    def _appended_targets(self, data, spacecraft, auxiliary_data):
+        r"""Map each frame extended by :py:meth:`append` to its old and new rows.
+
+        Spacecraft and auxiliary data must be passed if and only if the plasma
+        has them, and their indices must match `data`'s.
+        """
+        sc = self.spacecraft
+        if (sc is None) != (spacecraft is None):
+            raise ValueError(
+                "Spacecraft data must be appended if and only if the plasma has it."
+            )
+        if sc is not None:
+            if not isinstance(spacecraft, type(sc)):
+                spacecraft = type(sc)(spacecraft, sc.name, sc.frame)
+            spacecraft = spacecraft.data
+            if not spacecraft.index.equals(data.index):
+                raise ValueError("Spacecraft index must match appended data.")
+
+        aux = self.auxiliary_data
+        if (aux is None) != (auxiliary_data is None):
+            raise ValueError(
+                "Auxiliary data must be appended if and only if the plasma has it."
+            )
+        if aux is not None and not auxiliary_data.index.equals(data.index):
+            raise ValueError("Auxiliary data index must match appended data.")
+
+        targets = {"data": (self.data, data)}
+        if sc is not None:
+            targets["spacecraft"] = (sc.data, spacecraft)
+        if aux is not None:
+            targets["auxiliary_data"] = (aux, auxiliary_data)
+        return targets
+
+    def _extend_buffers(self, targets):
+        r"""Write the new rows in `targets` into their :py:class:`FrameBuffer`.
+
+        Columns are checked before anything is written. Returns the buffers.
+        """
+        buffers = {k: self._frame_buffer(k, old) for k, (old, _) in targets.items()}
+        appended = {}
+        for k, (_, rows) in targets.items():
+            columns = buffers[k].columns
+            if not rows.columns.equals(columns):
+                if (
+                    len(rows.columns) != len(columns)
+                    or not columns.isin(rows.columns).all()
+                ):
+                    raise ValueError("Appended %s columns don't match plasma." % k)
+                rows = rows.loc[:, columns]
+            appended[k] = rows
+
+        for k, rows in appended.items():
+            buffers[k].append(rows)
+        return buffers
+
+    @staticmethod
+    def _trim_buffers(buffers, retain):
+        r"""Apply :py:meth:`append`'s `retain` policy to each buffer."""
+        for buf in buffers.values():
+            if isinstance(retain, (int, np.integer)):
+                buf.keep_last(retain)
+            else:
+                buf.drop_before(buf.last - pd.to_timedelta(retain), inclusive=True)
+
+    def append(self, new, spacecraft=None, auxiliary_data=None, retain=None):
+        r"""Append rows to the plasma in amortized :math:`O(k)` time.
+
+        Only the `k` new rows are validated, conformed, and have their scalar
+        thermal speed calculated. They are written into preallocated buffers
+        that grow geometrically, so the existing history isn't copied or
+        re-sorted. The magnetic field, ions, and columnar storage are rebuilt
+        on their next access and the quantity cache is cleared.
+
+        Parameters
+        ----------
+        new: pd.DataFrame
+            Rows with the same measurements and species as :py:attr:`data`,
+            starting after the last time in the plasma.
+        spacecraft: None, pd.DataFrame, or Spacecraft
+            Spacecraft data for the new rows. Required if and only if the
+            plasma contains spacecraft data.
+        auxiliary_data: None, pd.DataFrame
+            Auxiliary data for the new rows. Required if and only if the
+            plasma contains auxiliary data.
+        retain: None, int, or str or pd.Timedelta
+            Ring buffer retention. An int keeps that many of the most recent
+            rows. A time span, e.g. "7D", keeps rows within that span of the
+            last time. None keeps everything.
+
+        Examples
+        --------
+        >>> for minute in stream:  # doctest: +SKIP
+        ...     plasma.append(minute, retain="3D")
+        """
+        data, dropped = self._conform_appended(new)
+        sc = self.spacecraft
+        aux = self.auxiliary_data
+        targets = self._appended_targets(data, spacecraft, auxiliary_data)
+        buffers = self._extend_buffers(targets)
+        if retain is not None:
+            self._trim_buffers(buffers, retain)
+
+        frames = {k: buf.frame() for k, buf in buffers.items()}
+        self._frame_buffers = {k: (buffers[k], frames[k]) for k in buffers}
+
+        self._data = frames["data"]
+        if sc is not None:
+            self._spacecraft = type(sc)._from_validated(
+                frames["spacecraft"], sc.name, sc.frame
+            )
+        if aux is not None:
+            self._auxiliary_data = frames["auxiliary_data"]
+
+        self._bfield = None
+        self._flags = None
+        self._storage = None
+        self._ions = None
+        self.clear_cache()
+
+        self.logger.debug(
+            "appended %s rows\nplasma shape: %s\nstop: %s",
+            len(data),
+            self._data.shape,
+            data.index.max(),
+        )
+        if dropped.columns.values.any():
+            self.logger.info(
+                "columns dropped from appended rows\n%s",
+                [str(c) for c in dropped.columns.values],
+            )
+        self._log_object_at_load(data, "plasma", merge=True)
+        for k in ("spacecraft", "auxiliary_data"):
+            if k in targets:
+                self._log_object_at_load(targets[k][1], k, merge=True)
+
+    def resample(self, rule, how="physical"):
+        r"""Downsample the plasma into time bins of width `rule`.
+
+        Parameters
+        ----------
+        rule: str or pd.DateOffset
+            Bin width, e.g. "1h" or "1D". Bins are closed on the left and
+            labelled by their start. See :py:func:`resampling.bins`.
+        how: {"physical", "mean"}
+            "physical" averages number densities, density-weights velocities
+            to conserve momentum, averages pressures :math:`n w^2` before
+            converting them back to thermal speeds, and rescales the mean
+            magnetic field to the mean field magnitude. "mean" takes the
+            arithmetic mean of every column.
+
+        Returns
+        -------
+        plasma: Plasma
+            New plasma with the binned spacecraft and auxiliary data. Floating
+            point spacecraft and auxiliary data are averaged. Integer and
+            boolean columns, e.g. flags, take their maximum. Empty bins are
+            dropped and scalar thermal speeds are recalculated.
+
+        Examples
+        --------
+        >>> hourly = plasma.resample("1h")  # doctest: +SKIP
+        """
+        if how not in ("physical", "mean"):
+            raise ValueError(f"Unrecognized resample method `{how}`")
+
+        data = self.data
+        bins = resampling.bins(data.index, rule)
+        if how == "physical":
+            data = resampling.plasma_frame(data, bins)
+        else:
+            data = resampling.frame(data.drop("scalar", axis=1, level="C"), bins)
+
+        sc = self.spacecraft
+        if sc is not None:
+            sc = type(sc)(resampling.frame(sc.data, bins), sc.name, sc.frame)
+
+        aux = self.auxiliary_data
+        if aux is not None:
+            aux = resampling.frame(aux, bins)
+
+        return type(self)(
+            data,
+            *self.species,
+            spacecraft=sc,
+            auxiliary_data=aux,
+            log_plasma_stats=self.plasma_stats_mode,
+            storage=self.storage_engine,
+        )
+
     @property
     def bfield(self):
         r"""Magnetic field data."""
-        return self._bfield
+        bfield = self.__dict__.get("_bfield")
+        if bfield is None:
+            # Rebuilt on demand after `append`.
+            bfield = vector.BField(self.data.b.xs("", axis=1, level="S"))
+            self._bfield = bfield
+        return bfield
 
     @property
     def b(self):
         r"""Shortcut for :py:attr:`bfield`."""
         return self.bfield
 
+    @qcache.cached
+    def _bmag(self):
+        r"""Magnetic field magnitude, calculated from storage when available."""
+        store = self.storage
+        if store is None:
+            return self.bfield.mag
+
+        b = store.b
+        mag = np.sqrt(np.einsum("ij,ij->i", b, b))
+        return pd.Series(mag, index=store.index, name="mag")
+
+    def _rho_array(self, slist):
+        r"""Mass densities from storage as an array shaped ``(time, species)``."""
+        m_in_mp = units_constants.SPECIES.take("m_in_mp", *slist)
+        return self.storage.take("n", *slist) * m_in_mp
+
+    def _pth_array(self, slist):
+        r"""Thermal pressures from storage shaped ``(time, species, component)``."""
+        units = self.units
+        rho = self._rho_array(slist) * units.rho
+        w = self.storage.take("w", *slist) * units.w
+        return (0.5 / units.pth) * w**2 * rho[:, :, np.newaxis]
+
+    def _tensor_from_array(self, arr, slist, species):
+        r"""Format a ``(time, species, component)`` array like :py:meth:`pth`.
+
+        A single species argument is summed over species, matching the
+        ``groupby("C").sum()`` in the pandas implementation.
+        """
+        store = self.storage
+        components = columnar.TENSOR_COMPONENTS
+        if len(species) == 1:
+            return store.component_frame(np.nansum(arr, axis=1), components)
+        return store.component_species_frame(arr, slist, components)
+
+    @qcache.cached
     def number_density(self, *species, skipna=True):
         r"""Get the plasma number densities.
 
@@ -817,6 +2199,14 @@ class Plasma(base.Base):
         """
         slist = self._chk_species(*species)
 
+        store = self.storage
+        if store is not None:
+            n = store.take("n", *slist)
+            if len(species) == 1:
+                n = np.nansum(n, axis=1) if skipna else n.sum(axis=1)
+                return pd.Series(n, index=store.index, name=species[0])
+            return store.species_frame(n, slist)
+
         n = {s: self.ions.loc[s].n for s in slist}
         n = pd.concat(n, axis=1, names=["S"], sort=True)
 
@@ -830,6 +2220,7 @@ class Plasma(base.Base):
         r"""Shortcut to :py:meth:`number_density`."""
         return self.number_density(*species, skipna=skipna)
 
+    @qcache.cached
     def mass_density(self, *species):
         r"""Get the plasma mass densities.
 
@@ -848,6 +2239,15 @@ class Plasma(base.Base):
         """
         slist = self._chk_species(*species)
 
+        store = self.storage
+        if store is not None:
+            rho = self._rho_array(slist)
+            if len(species) == 1:
+                return pd.Series(
+                    np.nansum(rho, axis=1), index=store.index, name=species[0]
+                )
+            return store.species_frame(rho, slist)
+
         rho = {s: self.ions.loc[s].rho for s in slist}
         rho = pd.concat(rho, axis=1, names=["S"], sort=True)
 
@@ -860,6 +2260,7 @@ class Plasma(base.Base):
         r"""Shortcut to :py:meth:`mass_density`."""
         return self.mass_density(*species)
 
+    @qcache.cached
     def thermal_speed(self, *species):
         r"""Get the thermal speed.
 
@@ -880,6 +2281,11 @@ class Plasma(base.Base):
             )
 
         slist = self._chk_species(*species)
+
+        store = self.storage
+        if store is not None:
+            return self._tensor_from_array(store.take("w", *slist), slist, species)
+
         w = {s: self.ions.loc[s].thermal_speed.data for s in slist}
         w = pd.concat(w, axis=1, names=["S"], sort=True)
         w = w.reorder_levels(["C", "S"], axis=1).sort_index(axis=1)
@@ -893,6 +2299,7 @@ class Plasma(base.Base):
         r"""Shortcut to :py:meth:`thermal_speed`."""
         return self.thermal_speed(*species)
 
+    @qcache.cached
     def pth(self, *species):
         r"""Get the thermal pressure.
 
@@ -914,6 +2321,9 @@ class Plasma(base.Base):
         if include_dynamic:
             raise NotImplementedError
 
+        if self.storage is not None:
+            return self._tensor_from_array(self._pth_array(slist), slist, species)
+
         pth = {s: self.ions.loc[s].pth for s in slist}
         pth = pd.concat(pth, axis=1, names=["S"], sort=True)
         pth = pth.reorder_levels(["C", "S"], axis=1).sort_index(axis=1)
@@ -922,6 +2332,7 @@ class Plasma(base.Base):
             pth = pth.T.groupby("C").sum().T
         return pth
 
+    @qcache.cached
     def temperature(self, *species):
         r"""Get the thermal temperature.
 
@@ -939,6 +2350,15 @@ class Plasma(base.Base):
             See Parameters for more info.
         """
         slist = self._chk_species(*species)
+
+        store = self.storage
+        if store is not None:
+            units = self.units
+            coeff = units_constants.SPECIES.take("m_2kb", *slist)
+            coeff *= units.w**2.0 / units.temperature
+            temp = coeff[np.newaxis, :, np.newaxis] * store.take("w", *slist) ** 2
+            return self._tensor_from_array(temp, slist, species)
+
         temp = {s: self.ions.loc[s].temperature for s in slist}
         temp = pd.concat(temp, axis=1, names=["S"], sort=True)
         temp = temp.reorder_levels(["C", "S"], axis=1).sort_index(axis=1)
@@ -947,6 +2367,7 @@ class Plasma(base.Base):
             temp = temp.T.groupby("C").sum().T
         return temp
 
+    @qcache.cached
     def beta(self, *species):
         r"""Get perpendicular, parallel, and scalar plasma beta.
 
@@ -991,7 +2412,7 @@ class Plasma(base.Base):
             raise NotImplementedError
 
         pth = self.pth(*species)
-        bsq = self.bfield.mag.pow(2)
+        bsq = self._bmag().pow(2)
         beta = pth.divide(bsq, axis=0)
 
         units = self.units.pth / (self.units.b**2.0)
@@ -999,6 +2420,7 @@ class Plasma(base.Base):
         beta *= coeff
         return beta
 
+    @qcache.cached
     def anisotropy(self, *species):
         r"""Pressure anisotropy.
 
@@ -1024,7 +2446,7 @@ class Plasma(base.Base):
             pdv = self.pdv(*species)
             pth.loc[:, "par"] = pth.loc[:, "par"].add(pdv, axis=0)
 
-        exp = pd.Series({"par": -1, "per": 1})
+        exp = _ANISOTROPY_EXP
 
         if len(species) > 1:
             ani = pth.pow(exp, axis=1, level="C").T.groupby(level="S").prod().T
@@ -1034,6 +2456,7 @@ class Plasma(base.Base):
 
         return ani
 
+    @qcache.cached
     def velocity(self, *species, project_m2q=False):
         r"""Get an ion velocity or calculate the center-of-mass velocity.
 
@@ -1058,11 +2481,10 @@ class Plasma(base.Base):
             s = stuple[0]
             v = self.ions.loc[s].velocity
             if project_m2q:
-                m2q = np.sqrt(
-                    self.constants.m_in_mp[s] / self.constants.charge_states[s]
+                (m2q,) = units_constants.SPECIES.take("sqrt_m2q", s)
+                v = vector.Vector._wrap(
+                    v.xyz * m2q, v.data.index, v.cartesian.columns, v.frame
                 )
-                v = v.data.multiply(m2q)
-                v = vector.Vector(v)
 
         elif project_m2q:
             raise NotImplementedError(
@@ -1074,6 +2496,15 @@ species: {}
             )
 
         else:
+            store = self.storage
+            if store is not None and len(species) == 1:
+                rho = self._rho_array(stuple)
+                rv = np.nansum(rho[:, :, np.newaxis] * store.take("v", *stuple), axis=1)
+                v = rv / np.nansum(rho, axis=1)[:, np.newaxis]
+                return vector.Vector(
+                    store.component_frame(v, columnar.VECTOR_COMPONENTS)
+                )
+
             v = self.ions.loc[list(stuple)].apply(lambda x: x.velocity)
             if len(species) == 1:
                 rhos = self.mass_density(*stuple)
@@ -1093,6 +2524,7 @@ species: {}
         r"""Shortcut to `velocity`."""
         return self.velocity(*species, project_m2q=project_m2q)
 
+    @qcache.cached
     def dv(self, s0, s1, project_m2q=False):
         r"""Calculate the differential flow between species `s0` and `s1`.
 
@@ -1123,14 +2555,21 @@ species: {}
             )
             raise NotImplementedError(msg % (s0, s1))
 
-        v0 = self.velocity(s0, project_m2q=project_m2q).cartesian
-        v1 = self.velocity(s1, project_m2q=project_m2q).cartesian
+        v0 = self.velocity(s0, project_m2q=project_m2q)
+        v1 = self.velocity(s1, project_m2q=project_m2q)
+
+        if v0.data.index.equals(v1.data.index):
+            # Subtract the cached component arrays without aligning.
+            return vector.Vector._wrap(
+                v0.xyz - v1.xyz, v0.data.index, v0.cartesian.columns, None
+            )
 
-        dv = v0.subtract(v1)
+        dv = v0.cartesian.subtract(v1.cartesian)
         dv = vector.Vector(dv)
 
         return dv
 
+    @qcache.cached
     def pdynamic(self, *species, project_m2q=False):
         r"""Calculate the dynamic or drift pressure for the given species.
 
@@ -1191,6 +2630,7 @@ species: {}
         r"""Shortcut to :py:meth:`pdynamic`."""
         return self.pdynamic(*species, project_m2q=project_m2q)
 
+    @qcache.cached
     def sound_speed(self, *species):
         r"""Calculate the sound speed.
 
@@ -1223,6 +2663,7 @@ species: {}
         r"""Shortcut to :py:meth:`sound_speed`."""
         return self.sound_speed(*species)
 
+    @qcache.cached
     def ca(self, *species):
         r"""Calculate the isotropic MHD Alfven speed.
 
@@ -1238,7 +2679,7 @@ species: {}
         stuple = self._chk_species(*species)  # noqa: F841
 
         rho = self.mass_density(*species)
-        b = self.bfield.mag
+        b = self._bmag()
 
         units = self.units
         mu0 = self.constants.misc.mu0
@@ -1250,6 +2691,7 @@ species: {}
 
         return ca
 
+    @qcache.cached
     def afsq(self, *species, pdynamic=False):
         r"""Calculate the square of anisotropy factor.
 
@@ -1290,8 +2732,7 @@ species: {}
         pth = self.pth(*species)
         pth = pth.drop("scalar", axis=1)
 
-        sum_coeff = pd.Series({"per": 1, "par": -1})
-        dp = pth.multiply(sum_coeff, axis=1, level="C" if multi_species else None)
+        dp = pth.multiply(_PER_MINUS_PAR, axis=1, level="C" if multi_species else None)
 
         # The following level kwarg controls returning a DataFrame
         # of the various species or a single result for one species.
@@ -1313,6 +2754,7 @@ species: {}
 
         return afsq
 
+    @qcache.cached
     def caani(self, *species, pdynamic=False):
         r"""
         Calculate the anisotropic MHD Alfven speed:
@@ -1350,6 +2792,7 @@ species: {}
 
         return caani
 
+    @qcache.cached
     def lnlambda(self, s0, s1):
         r"""Calculate the Coulomb logarithm between species s0 and s1.
 
@@ -1387,30 +2830,29 @@ species: {}
 
         constants = self.constants
         units = self.units
+        table = units_constants.SPECIES
 
-        z0 = constants.charge_states.loc[s0]
-        z1 = constants.charge_states.loc[s1]
-
-        a0 = constants.m_amu.loc[s0]
-        a1 = constants.m_amu.loc[s1]
+        z0, z1 = table.take("charge_states", s0, s1)
+        a0, a1 = table.take("m_amu", s0, s1)
 
-        n0 = self.ions.loc[s0].n * units.n
-        n1 = self.ions.loc[s1].n * units.n
+        ion0, ion1 = self.ions.loc[s0], self.ions.loc[s1]
+        index = ion0.n.index
+        n0 = ion0.n.to_numpy() * units.n
+        n1 = ion1.n.to_numpy() * units.n
 
-        T0 = self.ions.loc[s0].temperature.scalar * units.temperature * constants.kb.eV
-        T1 = self.ions.loc[s1].temperature.scalar * units.temperature * constants.kb.eV
+        T_eV = units.temperature * constants.kb.eV
+        T0 = ion0.temperature.scalar.to_numpy() * T_eV
+        T1 = ion1.temperature.scalar.to_numpy() * T_eV
 
-        r0 = n0.multiply(z0**2.0).divide(T0, axis=0)
-        r1 = n1.multiply(z1**2.0).divide(T1, axis=0)
-        right = r0.add(r1).pipe(np.sqrt)
-
-        left = z0 * z1 * (a0 + a1) / (a0 * T1).add(a1 * T0, axis=0)
+        right = np.sqrt(n0 * z0**2.0 / T0 + n1 * z1**2.0 / T1)
+        left = z0 * z1 * (a0 + a1) / (a0 * T1 + a1 * T0)
 
         lnlambda = (29.9 - np.log(left * right)) / units.lnlambda
-        lnlambda.name = "%s,%s" % (s0, s1)
+        lnlambda = pd.Series(lnlambda, index=index, name="%s,%s" % (s0, s1))
 
         return lnlambda
 
+    @qcache.cached
     def nuc(self, sa, sb, both_species=True):
         r"""Calculate the momentum collision rate following [1].
 
@@ -1461,10 +2903,10 @@ species: {}
         units = self.units
         constants = self.constants
 
-        qabsq = constants.charges.loc[[sa, sb]].pow(2).product()
-        ma = constants.m.loc[sa]
-        masses = constants.m.loc[[sa, sb]]
-        mu = masses.product() / masses.sum()
+        table = units_constants.SPECIES
+        qabsq = np.prod(table.take("charges", sa, sb) ** 2.0)
+        ma, mb = table.take("m", sa, sb)
+        mu = ma * mb / (ma + mb)
         coeff = qabsq / (4.0 * np.pi * constants.misc.e0**2.0 * ma * mu)
 
         lnlambda = self.lnlambda(sa, sb) * units.lnlambda
@@ -1503,6 +2945,7 @@ species: {}
 
         return nu
 
+    @qcache.cached
     def nc(self, sa, sb, both_species=True):
         r"""Calculate the Coulomb number between species `sa` and `sb`.
 
@@ -1551,6 +2994,111 @@ species: {}
 
         return nc
 
+    def coulomb_pairs(self, *species, both_species=True, chunksize=100_000, n_jobs=1):
+        r"""Calculate :py:meth:`lnlambda`, :py:meth:`nuc`, and :py:meth:`nc` for all pairs.
+
+        Number densities, thermal speeds, and velocities are gathered once into
+        ``(time, species)`` arrays and every pair is calculated by broadcasting
+        over ``(time, species, species)``.
+
+        Parameters
+        ----------
+        species: str
+            Individual species to pair. If none are passed, use all species in
+            the plasma.
+        both_species: bool
+            Passed to :py:meth:`nuc`.
+        chunksize: int
+            Number of rows calculated at once.
+        n_jobs: int
+            Number of threads calculating chunks. -1 uses all CPUs.
+
+        Returns
+        -------
+        pairs: namedtuple
+            `lnlambda`, `nuc`, and `nc` DataFrames whose columns are named like
+            the pd.Series returned by the single pair methods, e.g. "a,p1" and
+            "a+p1". Symmetric quantities contain each unordered pair once. When
+            `both_species` is False, `nuc` and `nc` contain each ordered pair.
+            `nc` is None if the plasma doesn't contain spacecraft data.
+
+        See Also
+        --------
+        lnlambda, nuc, nc
+        """
+        if not species:
+            species = self.species
+        slist = []
+        for s in species:
+            s = self._chk_species(s)
+            if len(s) > 1:
+                raise ValueError(
+                    "`coulomb_pairs` can only pair individual species.\nspecies: %s"
+                    % (species,)
+                )
+            slist.extend(s)
+        slist = sorted(set(slist))
+        if len(slist) < 2:
+            raise ValueError("Need at least two species to pair. species: %s" % slist)
+
+        store = self.storage
+        if store is None:
+            store = columnar.ColumnarStorage.from_frame(self.data, slist)
+
+        units = self.units
+        constants = self.constants
+
+        n = store.take("n", *slist) * units.n
+        w = store.take("w", *slist) * units.w
+        v = store.take("v", *slist) * units.v
+        table = units_constants.SPECIES
+        slots = table.slots(*slist)
+        m = table.m[slots]
+
+        rates = coulomb.pair_rates(
+            n,
+            n * m,
+            w[:, :, 0],
+            w[:, :, 2],
+            v,
+            table.charge_states[slots],
+            table.m_amu[slots],
+            table.charges[slots],
+            m,
+            constants.misc.e0,
+            constants.kb.J / constants.kb.eV,
+            both_species=both_species,
+            chunksize=chunksize,
+            n_jobs=n_jobs,
+        )
+
+        def to_frame(arr, pairs, sep):
+            i, j = np.array(pairs).T
+            names = [f"{slist[a]}{sep}{slist[b]}" for a, b in pairs]
+            return pd.DataFrame(
+                arr[:, i, j], index=self.data.index, columns=pd.Index(names)
+            )
+
+        combos = list(itertools.combinations(range(len(slist)), 2))
+        perms = list(itertools.permutations(range(len(slist)), 2))
+
+        lnl = to_frame(rates.lnlambda / units.lnlambda, combos, ",")
+        if both_species:
+            nu = to_frame(rates.nuc / units.nuc, combos, "+")
+        else:
+            nu = to_frame(rates.nuc / units.nuc, perms, "-")
+
+        nc = None
+        sc = self.spacecraft
+        if sc is not None:
+            r = sc.distance2sun * units.distance2sun
+            vsw = self.velocity("+".join(self.species)).mag * units.v
+            tau_exp = r.divide(vsw, axis=0)
+            nc = nu.multiply(units.nuc).multiply(tau_exp, axis=0) / units.nc
+
+        return CoulombPairs(lnl, nu, nc)
+
+    @qcache.cached
     def vdf_ratio(self, beam="p2", core="p1"):
         r"""Calculate the ratio of the VDFs at the beam velocity.
 
@@ -1639,19 +3187,24 @@ species: {}
     def estimate_electrons(self, inplace=False):
         r"""Estimate the electron parameters with a scalar temperature.
 
-        Assume temperature is the same as proton scalar temerature.
-        """
+        Assume temperature is the same as proton scalar temerature. The
+        electron density and velocity follow from quasi-neutrality and zero
+        current, summed over all ion species in one broadcast.
 
-        species = self.species
+        Parameters
+        ----------
+        inplace: bool
+            If False, only return the electrons. If True, also store them in
+            the plasma's data and storage in place, overwriting any existing
+            electrons or inserting their columns without rebuilding the
+            plasma.
 
-        if "e" in species:
-            msg = (
-                r"Estimating electrons when there are e- in the data has been "
-                r"disabled because I've screwed it up and estimated them as zero b/c "
-                r"of various strange things. I need to disable `inplace` when `e` in "
-                r"speces and do some ther things for this to work."
-            )
-            raise NotImplementedError(msg)
+        Returns
+        -------
+        electrons: :py:class:`Ion`
+        """
+
+        species = tuple(s for s in self.species if s != "e")
 
         if "p" not in species and "p1" not in species:
             msg = (
@@ -1673,59 +3226,78 @@ species: {}
             msg = "Unrecognized species: {}".format(species)
             raise ValueError(species)
 
-        qi = self.constants.charge_states.loc[list(species)]
-        ni = self.number_density(*species)
-        vi = self.velocity(*species)
-        if isinstance(vi, vector.Vector):
-            # Then we only have a single component proton plasma.
-            qi = qi.loc[species[0]]
-            vi = vi.cartesian
-            niqi = ni.multiply(qi)
-            ne = niqi
-            niqivi = vi.multiply(niqi, axis=0)
-        else:
-            vi = pd.concat(
-                vi.apply(lambda x: x.cartesian).to_dict(), axis=1, names="S", sort=True
-            )
-            niqi = ni.multiply(qi, axis=1, level="S")
-            ne = niqi.sum(axis=1)
-            niqivi = vi.multiply(niqi, axis=1, level="S").T.groupby(level="C").sum().T
+        ion_species = tuple(s for s in self._ion_species() if s != "e")
+        store = self.storage
+        if store is None:
+            store = columnar.ColumnarStorage.from_frame(self.data, ion_species)
+        table = units_constants.SPECIES
+
+        ne, ve, we = _quasi_neutral_electrons(
+            store.take("n", *ion_species),
+            store.take("v", *ion_species),
+            table.take("charge_states", *ion_species),
+            store.take("n", tkw)[:, 0],
+            store.take("w", tkw)[:, 0, 2],
+            table.take("m_in_mp", "e")[0],
+        )
+
+        index = self.data.index
+        columns = pd.MultiIndex.from_tuples(
+            [("n", "")]
+            + [("v", c) for c in columnar.VECTOR_COMPONENTS]
+            + [("w", "par"), ("w", "per")],
+            names=["M", "C"],
+        )
+        values = np.column_stack([ne, ve, we, we])
+        electrons = ions.Ion(pd.DataFrame(values, index=index, columns=columns), "e")
 
-        ve = niqivi.divide(ne, axis=0)
+        if inplace:
+            self._set_electrons(ne, ve, we)
+        return electrons
 
-        wp = self.w(tkw).loc[:, "scalar"]
-        nrat = self.number_density(tkw).divide(ne, axis=0)
-        mpme = self.constants.m_in_mp["e"] ** -1
-        we = (nrat * mpme).multiply(wp.pow(2), axis=0).pipe(np.sqrt)
-        we = pd.concat([we, we], axis=1, keys=["par", "per"], sort=True)
+    def _set_electrons(self, ne, ve, we):
+        r"""Store estimated electrons in the data and storage in place.
 
-        ne.name = ""
-        electrons = pd.concat(
-            [ne, ve, we], axis=1, keys=["n", "v", "w"], names=["M", "C"], sort=True
+        Existing electron columns are overwritten. Otherwise, the columns are
+        inserted in sorted position with a single copy of the data, without
+        validating or sorting it again.
+        """
+        nt = ne.shape[0]
+        w = np.column_stack([we, we, _w_scalar(we, we)])
+        columns = pd.MultiIndex.from_tuples(
+            [("n", "", "e")]
+            + [("v", c, "e") for c in columnar.VECTOR_COMPONENTS]
+            + [("w", c, "e") for c in columnar.TENSOR_COMPONENTS],
+            names=["M", "C", "S"],
         )
-        mask = ~ne.astype(bool)
-        electrons = electrons.mask(mask, axis=0)
+        values = np.column_stack([ne, ve, w])
 
-        electrons = ions.Ion(electrons, "e")
-
-        if inplace:
-            cols = electrons.data.columns
-            cols = [x + ("e",) for x in cols.values]
-            cols = pd.MultiIndex.from_tuples(cols, names=["M", "C", "S"])
-            electrons.data.columns = cols
-
-            data = self.data
-            if data.columns.intersection(electrons.data.columns).size:
-                data.update(electrons.data)
-            else:
-                data = pd.concat([data, electrons.data], axis=1, sort=True)
-                species = sorted(self.species + ("e",))
-                self._set_species(*species)
-                self.set_data(data)
-                self._set_ions()
+        self._own_buffers()
+        data = self.data
+        locs = data.columns.get_indexer(columns)
+        if (locs >= 0).all():
+            for j, loc in enumerate(locs):
+                data.iloc[:, loc] = values[:, j]
+        else:
+            combined = data.columns.append(columns)
+            order = combined.argsort()
+            out = np.empty((nt, len(combined)), dtype=np.float64, order="F")
+            source = np.empty(len(combined), dtype=np.intp)
+            source[order] = np.arange(len(combined))
+            out[:, source[: data.shape[1]]] = data.to_numpy(dtype=np.float64)
+            out[:, source[data.shape[1] :]] = values
+            self._data = pd.DataFrame(
+                out, index=data.index, columns=combined[order], copy=False
+            )
+            self._species = tuple(sorted(self.species + ("e",)))
 
-        return electrons
+        store = self.storage
+        if store is not None:
+            store.set_species("e", ne, ve, w)
+        self._set_ions()
+        self.clear_cache()
 
+    @qcache.cached
     def heat_flux(self, *species):
         r"""Calculate the parallel heat flux.
 
@@ -1821,10 +3393,89 @@ species: {}
 
         return turb
 
+    def build_alfvenic_turbulences(self, *species, panel=False, **kwargs):
+        r"""Create Alfvenic turbulence instances for many species at once.
+
+        The Cartesian magnetic field, each velocity and mass density, the
+        Alfven unit conversion, and the rolling means are calculated once and
+        shared by all `species` using them. Velocities and mass densities come
+        from the quantity cache, or a temporary one if it is disabled.
+
+        Parameters
+        ----------
+        species: str
+            Species identifiers, as in :py:meth:`build_alfvenic_turbulence`,
+            e.g. "p1", "p1+a", "p1,p1+a".
+        panel: bool
+            If True, return `sigma_c`, `sigma_r`, `rE`, and `rA` for every
+            species in one pd.DataFrame with ("S", "M") columns.
+        kwargs:
+            Passed to `rolling` method in
+            :py:class:`~solarwindpy.core.alfvenic_turbulence.AlfvenicTurbulence`
+            to specify window size. Unlike :py:meth:`build_alfvenic_turbulence`,
+            `raffaella_version` and `sc_vector` are not supported and raise a
+            ValueError.
+
+        Returns
+        -------
+        turbulence: dict or pd.DataFrame
+            Maps each species to its
+            :py:class:`~solarwindpy.core.alfvenic_turbulence.AlfvenicTurbulence`,
+            or the combined panel.
+        """
+        if not species:
+            raise ValueError("At least one species is required.")
+        if "raffaella_version" in kwargs or "sc_vector" in kwargs:
+            raise ValueError(
+                "`build_alfvenic_turbulences` does not support `raffaella_version`"
+                " or `sc_vector`. Use `build_alfvenic_turbulence` for each species."
+            )
+
+        cache = self.quantity_cache
+        if cache is None:
+            self._quantity_cache = qcache.QuantityCache(max_bytes=2**62)
+
+        try:
+            velocities = {}
+            densities = {}
+            keys = {}
+            for s in species:
+                species_ = s.split(",")
+                if len(species_) == 1:
+                    self._chk_species(species_[0])
+                    vkey = rkey = s
+                    if vkey not in velocities:
+                        velocities[vkey] = self.velocity(s).cartesian
+
+                elif len(species_) == 2:
+                    s0 = "+".join(self._chk_species(species_[0]))
+                    s1 = "+".join(self._chk_species(species_[1]))
+                    vkey = (s0, s1)
+                    rkey = s1
+                    if vkey not in velocities:
+                        velocities[vkey] = self.dv(s0, s1).cartesian
+
+                else:
+                    msg = "`species` can only contain at most 1 comma\nspecies: %s"
+                    raise ValueError(msg % s)
+
+                if rkey not in densities:
+                    densities[rkey] = self.mass_density(rkey)
+                keys[s] = (vkey, rkey)
+
+            b = self.bfield.cartesian
+        finally:
+            self._quantity_cache = cache
+
+        return alf_turb.AlfvenicTurbulence.batch(
+            b, velocities, densities, keys, panel=panel, **kwargs
+        )
+
     def S(self, *species):
         r"""Shortcut to :py:meth:`specific_entropy`."""
         return self.specific_entropy(*species)
 
+    @qcache.cached
     def specific_entropy(self, *species):
         r"""Calculate the specific entropy following [1] as.
 
@@ -1869,6 +3520,7 @@ species: {}
 
         return out
 
+    @qcache.cached
     def kinetic_energy_flux(self, *species):
         r"""Calculate the plasma kinetic energy flux.
 
@@ -1899,3 +3551,164 @@ species: {}
     def Wk(self, *species):
         r"""Shortcut to :py:meth:`~kinetic_energy_flux`."""
         return self.kinetic_energy_flux(*species)
+
+    # Methods that :py:meth:`compute` may call, including their shortcuts.
+    _computable = (
+        "number_density",
+        "n",
+        "mass_density",
+        "rho",
+        "thermal_speed",
+        "w",
+        "pth",
+        "temperature",
+        "beta",
+        "anisotropy",
+        "velocity",
+        "v",
+        "dv",
+        "pdynamic",
+        "pdv",
+        "sound_speed",
+        "cs",
+        "ca",
+        "afsq",
+        "caani",
+        "lnlambda",
+        "nuc",
+        "nc",
+        "vdf_ratio",
+        "heat_flux",
+        "qpar",
+        "specific_entropy",
+        "S",
+        "kinetic_energy_flux",
+        "Wk",
+    )
+
+    @staticmethod
+    def _conform_compute_calls(name, spec):
+        r"""Convert a :py:meth:`compute` request into ``[(args, kwargs), ...]``."""
+        if not isinstance(spec, list):
+            spec = [spec]
+
+        calls = []
+        for args in spec:
+            if args is None:
+                args = ()
+            elif isinstance(args, str):
+                args = (args,)
+            elif not isinstance(args, tuple):
+                raise TypeError(
+                    "Arguments for `%s` must be str, tuple, or a list of them, "
+                    "not %s" % (name, type(args))
+                )
+
+            kwargs = {}
+            if args and isinstance(args[-1], dict):
+                kwargs = args[-1]
+                args = args[:-1]
+            calls.append((args, kwargs))
+
+        return calls
+
+    @staticmethod
+    def _widen_result(name, label, result):
+        r"""Conform a derived quantity to a DataFrame with ("M", "C", "S") columns."""
+        if isinstance(result, base.Base):
+            result = result.data
+
+        if isinstance(result, pd.Series):
+            columns = [(name, "", label)]
+        elif isinstance(result, pd.DataFrame):
+            columns = []
+            for col in result.columns:
+                if not isinstance(col, tuple):
+                    col = (col,)
+                labels = dict(zip(result.columns.names, col))
+                s = labels.pop("S", label)
+                c = "_".join(str(x) for x in labels.values() if x != "")
+                columns.append((name, c, s))
+        else:
+            raise TypeError(
+                "`%s` returned %s, which can't be combined" % (name, type(result))
+            )
+
+        result = pd.DataFrame(result, copy=False)
+        result.columns = pd.MultiIndex.from_tuples(columns, names=["M", "C", "S"])
+        return result
+
+    def compute(self, quantities, max_bytes=None):
+        r"""Calculate several derived quantities in one pass.
+
+        Intermediates shared between quantities, e.g. mass densities, thermal
+        pressures, :math:`|B|`, center-of-mass velocities, and the Coulomb
+        logarithm, are calculated once and reused via the quantity cache.
+
+        Parameters
+        ----------
+        quantities: dict
+            Maps method names (e.g. "beta", "nc", or the shortcut "Wk") to
+            their species arguments. A str or tuple is passed as the arguments
+            of a single call. A list requests one call per element. A dict at
+            the end of a tuple is passed as keyword arguments, e.g.
+            ``{"dv": ("a", "p1", {"project_m2q": True})}``.
+        max_bytes: None, int
+            If the cache is disabled, the memory budget for the temporary cache
+            used during this call. If None, the budget is unbounded. The
+            temporary cache is dropped on return. If the cache is enabled, it is
+            used and populated as usual.
+
+        Returns
+        -------
+        result: pd.DataFrame
+            Columns are labelled ``("M", "C", "S")`` by the name in
+            `quantities`, the component ("" for scalars), and the species. For
+            quantities returned as a pd.Series, "S" joins the call's
+            arguments with ",".
+
+        Examples
+        --------
+        >>> plasma.compute({
+        ...     "beta": ("p1", "a"),
+        ...     "nc": [("p1", "a")],
+        ...     "Wk": ("p1+a",),
+        ... })  # doctest: +SKIP
+        """
+        if not isinstance(quantities, dict):
+            raise TypeError("`quantities` must be a dict, not %s" % type(quantities))
+
+        plan = []
+        for name, spec in quantities.items():
+            if name not in self._computable:
+                raise ValueError(
+                    "Unrecognized quantity `%s`. Use one of %s"
+                    % (name, self._computable)
+                )
+            for args, kwargs in self._conform_compute_calls(name, spec):
+                plan.append((name, args, kwargs))
+
+        cache = self.quantity_cache
+        if cache is None:
+            self._quantity_cache = qcache.QuantityCache(
+                max_bytes=2**62 if max_bytes is None else max_bytes
+            )
+
+        try:
+            results = []
+            for name, args, kwargs in plan:
+                result = getattr(self, name)(*args, **kwargs)
+                label = ",".join(str(x) for x in args)
+                results.append(self._widen_result(name, label, result))
+
+            info = self.quantity_cache.info
+        finally:
+            self._quantity_cache = cache
+
+        self.logger.debug(
+            "computed %s quantities\ncache hits: %s\ncache misses: %s",
+            len(plan),
+            info.hits,
+            info.misses,
+        )
+        return pd.concat(results, axis=1)
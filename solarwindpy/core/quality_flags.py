@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+r"""Named data quality flags packed into one bitmask per time.
+
+:py:class:`FlagIndex` evaluates up to 64 named flags once, e.g. from the
+quality columns in :py:attr:`Plasma.auxiliary_data`, and packs them into a
+``uint64`` per row. Selecting rows with any combination of required and
+excluded flags is then two bitwise operations over a single array, rather than
+one pandas comparison per flag, and the resulting masks are cached. See
+:py:meth:`Plasma.set_flags` and :py:meth:`Plasma.where_flags`.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MAX_FLAGS = 64
+_MASK_CACHE_SIZE = 32
+
+
+def _evaluate(definition, aux, nrows):
+    r"""Boolean array of the rows where flag `definition` is set.
+
+    Parameters
+    ----------
+    definition : callable, label, or array-like
+        A callable is called with `aux` and returns booleans. A tuple or
+        string is an `aux` column label and the flag is set where that column
+        is non-zero. Anything else is taken as booleans for each row.
+    aux : pd.DataFrame or None
+    nrows : int
+    """
+    if callable(definition):
+        values = definition(aux)
+    elif isinstance(definition, (tuple, str)):
+        if aux is None:
+            raise ValueError("Flag column %s requires auxiliary data." % (definition,))
+        values = aux.loc[:, definition]
+        if isinstance(values, pd.DataFrame):
+            raise ValueError("Flag column %s isn't unique." % (definition,))
+        values = values.to_numpy()
+        # NaN isn't a set flag.
+        values = np.nan_to_num(values.astype(float), nan=0.0) != 0
+    else:
+        values = definition
+
+    values = np.asarray(values)
+    if values.shape != (nrows,):
+        raise ValueError(
+            "Flags must have one value per row. Expected %s, not %s."
+            % (nrows, values.shape)
+        )
+    if values.dtype != bool:
+        values = np.nan_to_num(values.astype(float), nan=0.0) != 0
+    return values
+
+
+class FlagIndex(object):
+    r"""Up to 64 named boolean flags stored as one ``uint64`` per row.
+
+    Parameters
+    ----------
+    bits : np.ndarray
+        ``uint64`` bitmask per row. Bit ``i`` is flag ``names[i]``.
+    names : sequence of str
+        Flag names in bit order.
+    """
+
+    def __init__(self, bits, names):
+        names = tuple(names)
+        if len(names) > MAX_FLAGS:
+            raise ValueError("At most %s flags are supported." % MAX_FLAGS)
+        if len(set(names)) != len(names):
+            raise ValueError("Flag names must be unique: %s" % (names,))
+
+        bits = np.asarray(bits, dtype=np.uint64)
+        bits.flags.writeable = False
+        self._bits = bits
+        self._names = names
+        self._bit = {name: np.uint64(1) << np.uint64(i) for i, name in enumerate(names)}
+        self._masks = OrderedDict()
+
+    @classmethod
+    def from_definitions(cls, definitions, aux, nrows):
+        r"""Evaluate each named flag in `definitions` on `aux`.
+
+        Parameters
+        ----------
+        definitions : dict
+            Maps flag names to their definitions. See :py:func:`_evaluate`.
+        aux : pd.DataFrame or None
+            Auxiliary data the definitions are evaluated on.
+        nrows : int
+            Number of rows.
+        """
+        if len(definitions) > MAX_FLAGS:
+            raise ValueError("At most %s flags are supported." % MAX_FLAGS)
+        bits = np.zeros(nrows, dtype=np.uint64)
+        for i, definition in enumerate(definitions.values()):
+            values = _evaluate(definition, aux, nrows)
+            bits |= values.astype(np.uint64) << np.uint64(i)
+        return cls(bits, definitions.keys())
+
+    @property
+    def bits(self):
+        r"""Read-only ``uint64`` bitmask of each row."""
+        return self._bits
+
+    @property
+    def names(self):
+        r"""Flag names in bit order."""
+        return self._names
+
+    def __len__(self):
+        return len(self._bits)
+
+    def _combine(self, names):
+        if isinstance(names, str):
+            names = (names,)
+        out = np.uint64(0)
+        for name in names:
+            try:
+                out |= self._bit[name]
+            except KeyError:
+                raise KeyError(
+                    "Unknown flag %r. Available: %s" % (name, ", ".join(self.names))
+                ) from None
+        return out
+
+    def mask(self, include=(), exclude=()):
+        r"""Rows with every flag in `include` set and none in `exclude`.
+
+        Parameters
+        ----------
+        include, exclude : str or iterable of str
+            Flag names.
+
+        Returns
+        -------
+        mask : np.ndarray
+            Read-only boolean array. The most recently used masks are cached.
+        """
+        key = (self._combine(include), self._combine(exclude))
+        mask = self._masks.get(key)
+        if mask is not None:
+            self._masks.move_to_end(key)
+            return mask
+
+        inc, exc = key
+        bits = self._bits
+        if exc:
+            mask = (bits & (inc | exc)) == inc
+        else:
+            mask = (bits & inc) == inc
+        mask.flags.writeable = False
+
+        self._masks[key] = mask
+        while len(self._masks) > _MASK_CACHE_SIZE:
+            self._masks.popitem(last=False)
+        return mask
+
+    def take(self, rows):
+        r"""A new :py:class:`FlagIndex` with only `rows` (boolean or positions)."""
+        return type(self)(self._bits[rows], self._names)
+
+    def to_frame(self, index=None):
+        r"""Boolean DataFrame with one column per flag."""
+        columns = {name: (self._bits & bit) != 0 for name, bit in self._bit.items()}
+        return pd.DataFrame(columns, index=index, columns=list(self.names))
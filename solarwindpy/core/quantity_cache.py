@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+r"""Memoization of derived :py:class:`~solarwindpy.core.plasma.Plasma` quantities.
+
+Many :py:class:`~solarwindpy.core.plasma.Plasma` methods share intermediate
+results. For example, :py:meth:`~solarwindpy.core.plasma.Plasma.beta`,
+:py:meth:`~solarwindpy.core.plasma.Plasma.ca`, and
+:py:meth:`~solarwindpy.core.plasma.Plasma.nuc` all recalculate mass densities,
+thermal pressures, or velocities. :py:class:`QuantityCache` stores these results
+keyed by ``(method, args, kwargs)`` and evicts the least recently used entries
+once the cached values exceed a byte budget.
+
+Cached values are copied on the way in and on the way out so that in-place
+modifications by callers cannot corrupt the cache.
+"""
+
+import copy
+import functools
+
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+CacheInfo = namedtuple("CacheInfo", "hits,misses,evictions,entries,nbytes,max_bytes")
+
+
+def _nbytes(value):
+    r"""Approximate number of bytes held by `value`."""
+    data = getattr(value, "data", None)
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        # `Base` objects like `Vector` and `Tensor`.
+        value = data
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=False).sum())
+    elif isinstance(value, pd.Series):
+        return int(value.memory_usage(index=False))
+
+    return int(getattr(value, "nbytes", 0))
+
+
+def _copy(value):
+    r"""Copy `value` so that the cache and the caller don't share buffers."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=True)
+
+    data = getattr(value, "data", None)
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        out = copy.copy(value)
+        out._data = data.copy(deep=True)
+        return out
+
+    return copy.copy(value)
+
+
+class QuantityCache(object):
+    r"""Least-recently-used cache with a byte budget and hit/miss statistics.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Budget for the total size of cached values. Values larger than the
+        budget are never cached.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20):
+        max_bytes = int(max_bytes)
+        if max_bytes <= 0:
+            raise ValueError(f"`max_bytes` must be positive, not {max_bytes}")
+
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_bytes(self):
+        r"""Byte budget for cached values."""
+        return self._max_bytes
+
+    @property
+    def nbytes(self):
+        r"""Bytes currently held by cached values."""
+        return self._nbytes
+
+    @property
+    def info(self):
+        r""":py:class:`CacheInfo` containing hit, miss, and size statistics."""
+        return CacheInfo(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(self),
+            self.nbytes,
+            self.max_bytes,
+        )
+
+    @staticmethod
+    def make_key(name, args, kwargs):
+        r"""Build a hashable key from a method name and its arguments."""
+        return (name, tuple(args), tuple(sorted(kwargs.items())))
+
+    def get(self, key):
+        r"""Return ``(True, value)`` on a hit and ``(False, None)`` on a miss."""
+        try:
+            value, nbytes = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return True, _copy(value)
+
+    def put(self, key, value):
+        r"""Store a copy of `value` under `key`, evicting LRU entries as needed."""
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+
+        self.pop(key)
+        self._entries[key] = (_copy(value), nbytes)
+        self._nbytes += nbytes
+
+        while self._nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._nbytes -= evicted
+            self._evictions += 1
+
+    def pop(self, key):
+        r"""Remove `key` from the cache if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def clear(self):
+        r"""Drop all cached values. Statistics are retained."""
+        self._entries.clear()
+        self._nbytes = 0
+
+
+def cached(method):
+    r"""Memoize `method` in its instance's :py:class:`QuantityCache`.
+
+    The instance must expose the cache as ``quantity_cache``. When it is None,
+    `method` is called directly.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self.quantity_cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        key = cache.make_key(method.__name__, args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            # Let `method` validate arguments that can't be cached.
+            return method(self, *args, **kwargs)
+
+        hit, value = cache.get(key)
+        if hit:
+            return value
+
+        value = method(self, *args, **kwargs)
+        cache.put(key, value)
+        return value
+
+    return wrapper
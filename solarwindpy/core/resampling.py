@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+r"""Physically consistent time binning for :py:meth:`Plasma.resample`.
+
+Rows are assigned an integer bin code once and every reduction is a single
+:py:func:`numpy.add.reduceat` over the sorted rows, so the whole plasma is
+binned in one pass rather than through a separate pandas resampler per column.
+NaNs are excluded from every sum and bins without data are dropped.
+
+The plasma reductions conserve the bulk moments within each bin:
+
+- number densities are averaged;
+- velocities are density-weighted, i.e. mass-weighted because the mass of a
+  species is constant, so that momentum is conserved;
+- thermal speeds are converted to pressures :math:`p \propto n w^2`, which are
+  averaged and converted back with the mean density;
+- magnetic field components are averaged and rescaled so that the magnitude
+  of the result is the mean field magnitude.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+Bins = namedtuple("Bins", "starts,labels")
+
+
+def bins(index, rule):
+    r"""Assign sorted times in `index` to bins of width `rule`.
+
+    Bins are closed on the left and labelled by their start. Fixed-width rules,
+    e.g. "1h" or "1D", are aligned to midnight of the first day like
+    :py:meth:`pandas.DataFrame.resample`. Calendar rules, e.g. "MS", start at
+    the anchor on or before the first time.
+
+    Returns
+    -------
+    bins : :py:class:`Bins`
+        Position of the first row in each non-empty bin and the bin labels.
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        raise TypeError("Resampling requires a DatetimeIndex.")
+    if not index.is_monotonic_increasing:
+        raise ValueError("Resampling requires a sorted index.")
+    if not len(index):
+        raise ValueError("Can't resample empty data.")
+
+    offset = pd.tseries.frequencies.to_offset(rule)
+    origin = offset.rollback(index[0].normalize())
+    edges = pd.date_range(origin, index[-1], freq=offset)
+
+    codes = edges.searchsorted(index, side="right") - 1
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    labels = edges[codes[starts]]
+    labels.name = index.name
+    labels.freq = None
+    return Bins(starts, labels)
+
+
+def _sum(values, starts):
+    r"""NaN-excluding sums and counts of `values` rows within each bin."""
+    finite = np.isfinite(values)
+    total = np.add.reduceat(np.where(finite, values, 0.0), starts, axis=0)
+    count = np.add.reduceat(finite, starts, axis=0)
+    return total, count
+
+
+def _divide(num, den):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, num / den, np.nan)
+
+
+def mean(values, starts):
+    r"""NaN-excluding mean of the 2D `values` in each bin."""
+    total, count = _sum(values, starts)
+    return _divide(total, count)
+
+
+def weighted_mean(values, weights, starts):
+    r"""Mean of `values` weighted by `weights` in each bin.
+
+    Rows where either the value or the weight is NaN are excluded.
+    """
+    valid = np.isfinite(values) & np.isfinite(weights)
+    num, _ = _sum(np.where(valid, values * weights, np.nan), starts)
+    den, _ = _sum(np.where(valid, weights, np.nan), starts)
+    return _divide(num, den)
+
+
+def frame(data, bins):
+    r"""Bin `data` by averaging floats and taking the maximum of everything else.
+
+    Integer and boolean columns, such as quality flags, keep their dtype and
+    are reduced with the maximum.
+    """
+    floats = np.array([pd.api.types.is_float_dtype(dt) for dt in data.dtypes])
+    out = {}
+    if floats.any():
+        avg = mean(data.loc[:, floats].to_numpy(), bins.starts)
+        out.update(zip(np.flatnonzero(floats), avg.T))
+    for j in np.flatnonzero(~floats):
+        out[j] = np.maximum.reduceat(data.iloc[:, j].to_numpy(), bins.starts)
+
+    out = pd.DataFrame({j: out[j] for j in range(data.shape[1])}, index=bins.labels)
+    out.columns = data.columns
+    return out
+
+
+def plasma_frame(data, bins):
+    r"""Bin plasma `data` conserving density, momentum, pressure, and :math:`|B|`.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Plasma data with ("M", "C", "S") columns "b", "n", "v", and "w". Scalar
+        thermal speeds are dropped, to be recalculated from the binned
+        parallel and perpendicular thermal speeds.
+    bins : :py:class:`Bins`
+
+    Returns
+    -------
+    binned : pd.DataFrame
+    """
+    data = data.loc[:, data.columns.get_level_values("C") != "scalar"]
+    columns = data.columns
+    values = data.to_numpy(dtype=float)
+    m = columns.get_level_values("M")
+    s = columns.get_level_values("S")
+    starts = bins.starts
+
+    out = np.full((len(starts), len(columns)), np.nan)
+
+    is_n = m == "n"
+    n = values[:, is_n]
+    n_species = s[is_n]
+    out[:, is_n] = mean(n, starts)
+
+    # Density of each column's species, used as weights.
+    weighted = (m == "v") | (m == "w")
+    species = n_species.get_indexer(s[weighted])
+    if (species < 0).any():
+        raise ValueError("Velocities and thermal speeds require number densities.")
+    weights = n[:, species]
+
+    is_v = m[weighted] == "v"
+    x = values[:, weighted]
+    avg = np.empty((len(starts), x.shape[1]))
+    avg[:, is_v] = weighted_mean(x[:, is_v], weights[:, is_v], starts)
+    # Average pressure n w^2 and divide by the mean density. Only rows with
+    # both n and w contribute to either.
+    avg[:, ~is_v] = np.sqrt(
+        weighted_mean(x[:, ~is_v] ** 2.0, weights[:, ~is_v], starts)
+    )
+    out[:, weighted] = avg
+
+    is_b = m == "b"
+    if is_b.any():
+        b = values[:, is_b]
+        bmag = np.sqrt((b**2.0).sum(axis=1))
+        bavg = mean(b, starts)
+        ratio = _divide(
+            mean(bmag[:, None], starts), np.sqrt((bavg**2.0).sum(axis=1))[:, None]
+        )
+        out[:, is_b] = bavg * ratio
+
+    return pd.DataFrame(out, index=bins.labels, columns=columns)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+r"""Memory-mapped :py:class:`~solarwindpy.core.plasma.Plasma` buffers.
+
+Pickling a plasma to send it to `joblib` or `multiprocessing` workers gives
+each worker its own copy of the data. :py:func:`export_plasma` instead writes
+the plasma, spacecraft, and auxiliary data to ``.npy`` files that workers
+memory map with :py:func:`attach_plasma`. The operating system shares the
+mapped pages between processes, so N workers hold one copy of the data.
+
+By default, buffers are written to ``/dev/shm`` when it exists so that they
+live in shared memory rather than on disk.
+
+Each frame is stored column-major, one file per run of consecutive columns with
+the same dtype, so that attaching builds the DataFrame blocks directly on the
+mapped arrays without copying.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_META = "meta.json"
+_FRAMES = ("data", "spacecraft", "auxiliary_data")
+
+
+class SharedPlasmaHandle(namedtuple("SharedPlasmaHandle", "path")):
+    r"""Picklable reference to a plasma exported by :py:func:`export_plasma`.
+
+    Pass the handle to workers and reattach with
+    :py:meth:`~solarwindpy.core.plasma.Plasma.from_shared`.
+    """
+
+    __slots__ = ()
+
+    def release(self):
+        r"""Delete the exported buffers.
+
+        Plasmas already attached to the buffers keep their mappings alive
+        until they are garbage collected.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def _default_path():
+    shm = "/dev/shm"
+    return tempfile.mkdtemp(
+        prefix="solarwindpy-", dir=shm if os.path.isdir(shm) else None
+    )
+
+
+def _dtype_runs(frame):
+    r"""Slices of consecutive columns in `frame` sharing a dtype."""
+    dtypes = frame.dtypes.tolist()
+    start = 0
+    for stop in range(1, len(dtypes) + 1):
+        if stop == len(dtypes) or dtypes[stop] != dtypes[start]:
+            yield slice(start, stop)
+            start = stop
+
+
+def export_frame(frame, path, name):
+    r"""Write `frame` to memory-mappable files in `path`.
+
+    Returns
+    -------
+    meta : dict
+        JSON-serializable description of the files, passed to
+        :py:func:`attach_frame`.
+    """
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise TypeError("Shared buffers require a DatetimeIndex.")
+
+    index = frame.index
+    index_fname = f"{name}-index.npy"
+    np.save(path / index_fname, index.asi8)
+
+    blocks = []
+    for i, cols in enumerate(_dtype_runs(frame)):
+        fname = f"{name}-{i}.npy"
+        out = np.lib.format.open_memmap(
+            path / fname,
+            mode="w+",
+            dtype=frame.dtypes.iloc[cols.start],
+            shape=(cols.stop - cols.start, len(index)),
+        )
+        # Copy column by column to avoid materializing the whole block.
+        for j, k in enumerate(range(cols.start, cols.stop)):
+            out[j] = frame.iloc[:, k].to_numpy()
+        out.flush()
+        del out
+        blocks.append(fname)
+
+    return {
+        "index": index_fname,
+        "blocks": blocks,
+        "columns": [list(c) for c in frame.columns],
+        "column_names": list(frame.columns.names),
+        "index_name": index.name,
+        "unit": index.unit,
+        "tz": None if index.tz is None else str(index.tz),
+    }
+
+
+def attach_frame(path, meta, mmap_mode="c"):
+    r"""Build a DataFrame on the files written by :py:func:`export_frame`."""
+    index = np.load(path / meta["index"], mmap_mode=mmap_mode)
+    # `asi8` is in the unit of the exported index.
+    unit = meta.get("unit", "ns")
+    index = pd.DatetimeIndex(index.view(f"M8[{unit}]"), name=meta["index_name"])
+    if meta["tz"] is not None:
+        index = index.tz_localize("UTC").tz_convert(meta["tz"])
+
+    columns = pd.MultiIndex.from_tuples(
+        [tuple(c) for c in meta["columns"]], names=meta["column_names"]
+    )
+
+    frames = []
+    start = 0
+    for fname in meta["blocks"]:
+        values = np.load(path / fname, mmap_mode=mmap_mode)
+        stop = start + values.shape[0]
+        frames.append(
+            pd.DataFrame(values.T, index=index, columns=columns[start:stop], copy=False)
+        )
+        start = stop
+
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, axis=1, copy=False)
+
+
+def export_plasma(plasma, path=None):
+    r"""Write `plasma` to memory-mappable buffers.
+
+    Parameters
+    ----------
+    plasma : :py:class:`~solarwindpy.core.plasma.Plasma`
+    path : str or pathlib.Path, optional
+        Empty or non-existent directory in which to write the buffers. If None,
+        a temporary directory in ``/dev/shm`` is used when available.
+
+    Returns
+    -------
+    handle : :py:class:`SharedPlasmaHandle`
+    """
+    if path is None:
+        path = _default_path()
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    if any(path.iterdir()):
+        raise FileExistsError(f"Shared buffer directory is not empty: {path}")
+
+    meta = {
+        "species": list(plasma.species),
+        "storage": plasma.storage_engine,
+    }
+    meta["data"] = export_frame(plasma.data, path, "data")
+
+    sc = plasma.sc
+    if sc is not None:
+        meta["spacecraft"] = export_frame(sc.data, path, "spacecraft")
+        meta["spacecraft"]["name"] = sc.name
+        meta["spacecraft"]["frame"] = sc.frame
+
+    if plasma.aux is not None:
+        meta["auxiliary_data"] = export_frame(plasma.aux, path, "auxiliary_data")
+
+    with open(path / _META, "w") as f:
+        json.dump(meta, f)
+
+    return SharedPlasmaHandle(str(path))
+
+
+def attach_plasma(handle, mmap_mode="c"):
+    r"""Memory map the buffers referenced by `handle`.
+
+    Returns
+    -------
+    meta : dict
+        Plasma metadata.
+    frames : dict
+        DataFrames keyed by "data", "spacecraft", and "auxiliary_data". Missing
+        frames are None.
+    """
+    if mmap_mode not in ("r", "c"):
+        raise ValueError(f"`mmap_mode` must be 'r' or 'c', not {mmap_mode!r}")
+
+    path = Path(getattr(handle, "path", handle))
+    with open(path / _META) as f:
+        meta = json.load(f)
+
+    frames = {
+        k: attach_frame(path, meta[k], mmap_mode=mmap_mode) if k in meta else None
+        for k in _FRAMES
+    }
+    return meta, frames
@@ -12,8 +12,11 @@ import numpy as np
 # accidentally cause a problem.
 
 from . import base
+from . import frames
 from . import vector
 
+_GSE_SIGN = np.array([-1.0, 1.0, 1.0])
+
 
 class Spacecraft(base.Base):
     r"""Representation of a spacecraft trajectory.
@@ -79,6 +82,15 @@ class Spacecraft(base.Base):
         self.set_data(data)
         self._log_spacecraft()
 
+    @classmethod
+    def _from_validated(cls, data, name, frame):
+        r"""Wrap `data` already conformed by :py:meth:`set_data` without copying."""
+        sc = cls.__new__(cls)
+        base.Core.__init__(sc)
+        sc.set_frame_name(frame, name)
+        sc._data = data
+        return sc
+
     @property
     def frame(self):
         r"""Spacecraft's frame of reference (e.g. GSE, HCI, etc.)."""
@@ -99,7 +111,7 @@ class Spacecraft(base.Base):
             Position vector with x, y, z components.
         """
         pos = self.data.xs("pos", axis=1, level="M").loc[:, ("x", "y", "z")]
-        return vector.Vector(pos)
+        return vector.Vector(pos, frame=self.frame)
 
     @property
     def pos(self):
@@ -134,7 +146,7 @@ class Spacecraft(base.Base):
         """
         try:
             v = self.data.xs("v", axis=1, level="M").loc[:, ("x", "y", "z")]
-            return vector.Vector(v)
+            return vector.Vector(v, frame=self.frame)
         except KeyError as e:  # noqa: F841
             raise KeyError("Spacecraft doesn't know it's velocity.")
 
@@ -153,34 +165,35 @@ class Spacecraft(base.Base):
 
     @property
     def distance2sun(self):
-        r"""Radial distance to Sun in meters."""
+        r"""Radial distance to Sun in meters.
+
+        GSE positions are placed 1 AU from the Sun along the Sun-Earth line.
+        Positions in other geocentric frames use the Earth's ephemeris from
+        :py:func:`~solarwindpy.core.frames.transform_position`.
+        """
         pos = self.position.data
         frame = self.frame
+        misc = self.constants.misc
 
         if frame == "GSE":
-            re = self.constants.misc.loc["Re [m]"]
-            au = self.constants.misc.loc["1AU [m]"]
-            sign_x = pd.Series(
-                [-1.0, 1.0, 1.0], index=pd.Index(("x", "y", "z"), name="C")
-            )
-            change_origin = pd.Series(
-                [au, 0.0, 0.0], index=pd.Index(("x", "y", "z"), name="C")
-            )
-            pos_SI = (
-                pos.multiply(sign_x, axis=1).multiply(re).add(change_origin, axis=1)
-            )
+            pos_SI = pos.to_numpy(dtype=float) * (_GSE_SIGN * misc.loc["Re [m]"])
+            pos_SI[:, 0] += misc.loc["1AU [m]"]
+
+        elif frame in frames.HELIOCENTRIC:
+            # Rotations don't change the distance.
+            pos_SI = pos.to_numpy(dtype=float) * misc.loc["Rs [m]"]
 
-        elif frame == "HCI":
-            rs = self.constants.misc.loc["Rs [m]"]
-            pos_SI = pos.multiply(rs)
+        elif frame in frames.GEOCENTRIC:
+            pos_SI = frames.transform_position(pos.to_numpy(), frame, "HCI", pos.index)
+            pos_SI *= misc.loc["Rs [m]"]
 
         else:
             raise NotImplementedError("Unrecognized reference frame `{}`".format(frame))
 
         # distance2sun units should be [m], so this shouldn't matter. However, just as
         # beta is treated in this way, we similarly treat distance2sun.
-        d2s = pos_SI.pow(2).sum(axis=1).pipe(np.sqrt) / self.units.distance2sun
-        d2s.name = "distance2sun"
+        d2s = np.sqrt((pos_SI**2.0).sum(axis=1)) / self.units.distance2sun
+        d2s = pd.Series(d2s, index=pos.index, name="distance2sun")
         return d2s
 
     def _log_spacecraft(self):
@@ -194,19 +207,20 @@ class Spacecraft(base.Base):
         Parameters
         ----------
         frame : str
-            Coordinate frame ('GSE' or 'HCI').
+            Coordinate frame, any of
+            :py:data:`~solarwindpy.core.frames.FRAMES` other than RTN.
         name : str
             Spacecraft name.
 
         Raises
         ------
         NotImplementedError
-            If frame is not 'GSE' or 'HCI'.
+            If frame is unrecognized or RTN.
         """
         frame = frame.upper()
         name = name.upper()
 
-        if frame not in ("GSE", "HCI"):
+        if frame not in frames.FRAMES or frame == "RTN":
             raise NotImplementedError("Unrecognized frame: {}".format(frame))
         if name not in ("WIND", "PSP"):
             raise NotImplementedError("Unrecognized name: {}".format(name))
@@ -214,6 +228,40 @@ class Spacecraft(base.Base):
         self._frame = frame
         self._name = name
 
+    def to_frame(self, name):
+        r"""Transform the spacecraft into frame `name`.
+
+        Positions are translated and rotated with
+        :py:func:`~solarwindpy.core.frames.transform_position`, so they are in
+        Earth radii in geocentric frames and solar radii in heliocentric frames.
+        Velocities are only rotated, i.e. the motion of the new origin isn't
+        added. The Carrington location is unchanged.
+
+        Parameters
+        ----------
+        name : str
+            Target frame. Can't be RTN, which is centered on the spacecraft.
+
+        Returns
+        -------
+        spacecraft : :py:class:`Spacecraft`
+        """
+        name = frames.conform_frame(name)
+        if name == "RTN":
+            raise ValueError("A spacecraft's position in its own RTN frame is zero.")
+
+        data = self.data
+        epoch = data.index
+        out = data.copy()
+        out.loc[:, "pos"] = frames.transform_position(
+            data.loc[:, "pos"].to_numpy(dtype=float), self.frame, name, epoch
+        )
+        if "v" in data.columns.get_level_values("M"):
+            out.loc[:, "v"] = frames.transform(
+                data.loc[:, "v"].to_numpy(dtype=float), self.frame, name, epoch
+            )
+        return Spacecraft(out, self.name, name)
+
     def set_data(self, data):
         """Set the spacecraft data.
 
@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+r"""Elsasser variable spectra for :py:meth:`AlfvenicTurbulence.spectra`.
+
+Measurements are placed on a regular grid at their cadence and cut into
+segments of `nperseg` samples. Gaps of at most `max_gap` samples are filled by
+linear interpolation and segments with longer gaps are dropped. The segments
+are transformed in batches with :py:func:`numpy.fft.rfft`, so only `chunksize`
+segments are held in memory at once, and chunks can be processed in threads.
+The default `chunksize` keeps the coefficients of a chunk within
+:py:data:`CHUNK_BYTES`.
+
+The spectra of :math:`z^\pm = v \pm b` follow from those of :math:`v` and
+:math:`b` and their cross spectrum, :math:`|Z^\pm|^2 = |V|^2 + |B|^2 \pm 2
+\mathrm{Re}(V \cdot B^*)`, so only two transforms are calculated per segment.
+Spectra are traces over the three components, i.e. reduced spectra.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import parallel
+
+QUANTITIES = (
+    "e_plus",
+    "e_minus",
+    "kinetic_energy",
+    "magnetic_energy",
+    "sigma_c",
+    "sigma_r",
+)
+
+#: Approximate bytes of transform coefficients held per chunk by default.
+CHUNK_BYTES = 2**27
+
+
+def grid_positions(index, cadence=None):
+    r"""Position of each time in `index` on a regular grid.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        Sorted times.
+    cadence : str or pd.Timedelta, optional
+        Grid spacing. Defaults to the median spacing of `index`.
+
+    Returns
+    -------
+    positions : np.ndarray
+        Integer grid positions, starting at 0.
+    cadence : pd.Timedelta
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        raise TypeError("Spectra require a DatetimeIndex.")
+    if not index.is_monotonic_increasing:
+        raise ValueError("Spectra require a sorted index.")
+
+    t = index.asi8
+    if cadence is None:
+        cadence = pd.Timedelta(int(np.median(np.diff(t))), unit="ns")
+    else:
+        cadence = pd.Timedelta(pd.tseries.frequencies.to_offset(cadence))
+    if cadence.value <= 0:
+        raise ValueError(f"`cadence` must be positive, not {cadence}")
+
+    positions = np.rint((t - t[0]) / cadence.value).astype(np.int64)
+    return positions, cadence
+
+
+def fill_gaps(x, max_gap):
+    r"""Linearly interpolate NaN runs along the last axis of `x`.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        ``(..., L)`` segments.
+    max_gap : int
+        Longest run of NaNs that is filled.
+
+    Returns
+    -------
+    filled : np.ndarray
+        `x` with NaNs replaced. Runs at the ends take the nearest value.
+    good : np.ndarray
+        ``(...)`` booleans, False where a run is longer than `max_gap` or
+        there are no valid values.
+    """
+    n = x.shape[-1]
+    ok = np.isfinite(x)
+    i = np.arange(n)
+    prev = np.maximum.accumulate(np.where(ok, i, -1), axis=-1)
+    following = np.flip(
+        np.minimum.accumulate(np.flip(np.where(ok, i, n), axis=-1), axis=-1),
+        axis=-1,
+    )
+
+    run = np.where(ok, 0, following - prev - 1)
+    good = ok.any(axis=-1) & (run.max(axis=-1) <= max_gap)
+
+    x0 = np.take_along_axis(x, np.clip(prev, 0, n - 1), axis=-1)
+    x1 = np.take_along_axis(x, np.clip(following, 0, n - 1), axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = (i - prev) / (following - prev)
+        interp = x0 + (x1 - x0) * frac
+    interp = np.where(prev < 0, x1, np.where(following >= n, x0, interp))
+    return np.where(ok, x, interp), good
+
+
+def detrend(x, how="constant"):
+    r"""Remove the mean or a linear fit along the last axis of `x`."""
+    if how is None or how is False:
+        return x
+    mean = x.mean(axis=-1, keepdims=True)
+    if how == "constant":
+        return x - mean
+    if how == "linear":
+        t = np.arange(x.shape[-1], dtype=float)
+        t -= t.mean()
+        slope = (x * t).sum(axis=-1, keepdims=True) / (t**2).sum()
+        return x - mean - slope * t
+    raise ValueError(f"Unrecognized detrend: {how}")
+
+
+def hann(n):
+    r"""Periodic Hann window, as :py:func:`scipy.signal.get_window`."""
+    return 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(n) / n)
+
+
+def morlet(x, dt, frequencies, w0=6.0):
+    r"""Morlet wavelet transform along the last axis of `x`.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        ``(..., L)`` regularly sampled series without NaNs.
+    dt : float
+        Sample spacing in seconds.
+    frequencies : array-like
+        Fourier frequencies [Hz] of the wavelet scales.
+    w0 : float
+        Non-dimensional frequency of the mother wavelet.
+
+    Returns
+    -------
+    coefs : np.ndarray
+        ``(..., F, L)`` complex coefficients, normalized following Torrence &
+        Compo (1998) so white noise of variance :math:`\sigma^2` has
+        :math:`\langle |W|^2 \rangle = \sigma^2`.
+    """
+    n = x.shape[-1]
+    # Zero-pad to limit wrap around at the segment edges.
+    npad = 1 << int(np.ceil(np.log2(2 * n)))
+    omega = 2.0 * np.pi * np.fft.fftfreq(npad, d=dt)
+
+    fourier_factor = 4.0 * np.pi / (w0 + np.sqrt(2.0 + w0**2))
+    scales = 1.0 / (fourier_factor * np.asarray(frequencies, dtype=float))
+    so = scales[:, None] * omega
+    psi = (
+        np.sqrt(2.0 * np.pi * scales[:, None] / dt)
+        * np.pi**-0.25
+        * np.exp(-0.5 * (so - w0) ** 2)
+        * (omega > 0)
+    )
+
+    xf = np.fft.fft(x, n=npad, axis=-1)
+    coefs = np.fft.ifft(xf[..., None, :] * psi, axis=-1)
+    return coefs[..., :n]
+
+
+def _default_chunksize(method, nperseg, nfreq):
+    r"""Segments per chunk whose coefficients fit in :py:data:`CHUNK_BYTES`."""
+    if method == "welch":
+        per_segment = 6 * (nperseg // 2 + 1) * 16
+    else:
+        # `morlet` pads each segment to the next power of two >= 2 * nperseg.
+        npad = 1 << int(np.ceil(np.log2(2 * nperseg)))
+        per_segment = 6 * nfreq * npad * 16
+    return max(1, min(256, CHUNK_BYTES // per_segment))
+
+
+def _segment_spectra(segments, method, dt, frequencies, w0):
+    r"""Summed auto and cross spectra of the ``(S, 6, L)`` `segments`."""
+    if method == "welch":
+        window = hann(segments.shape[-1])
+        coefs = np.fft.rfft(segments * window, axis=-1)
+        # One-sided density, as `scipy.signal.welch(scaling="density")`.
+        scale = np.full(coefs.shape[-1], 2.0 * dt / (window**2).sum())
+        scale[0] /= 2.0
+        if segments.shape[-1] % 2 == 0:
+            scale[-1] /= 2.0
+    else:
+        coefs = morlet(segments, dt, frequencies, w0=w0)
+        # Global wavelet spectrum as a one-sided density.
+        scale = 2.0 * dt / segments.shape[-1]
+
+    v, b = coefs[:, :3], coefs[:, 3:]
+    # Sum over segments and components; the wavelet also sums over time.
+    axes = (0, 1, 3) if method == "wavelet" else (0, 1)
+    pv = (np.abs(v) ** 2).sum(axis=axes) * scale
+    pb = (np.abs(b) ** 2).sum(axis=axes) * scale
+    cross = (v * b.conj()).real.sum(axis=axes) * scale
+    return np.stack([pv, pb, cross])
+
+
+def elsasser_spectra(
+    v,
+    b,
+    index,
+    nperseg,
+    method="welch",
+    noverlap=None,
+    cadence=None,
+    max_gap=10,
+    detrend_how="constant",
+    frequencies=None,
+    w0=6.0,
+    polarity=None,
+    chunksize=None,
+    n_jobs=1,
+):
+    r"""Frequency-resolved Elsasser energies, :math:`\sigma_c`, and :math:`\sigma_r`.
+
+    Parameters
+    ----------
+    v, b : np.ndarray
+        ``(N, 3)`` velocity and magnetic field in Alfv\'en units.
+    index : pd.DatetimeIndex
+        Sorted times of `v` and `b`, possibly with gaps.
+    nperseg : int
+        Samples per segment.
+    method : {"welch", "wavelet"}
+        Welch-averaged, Hann windowed periodograms or the time-averaged Morlet
+        scalogram of each segment.
+    noverlap : int, optional
+        Samples shared by consecutive segments. Defaults to ``nperseg // 2``
+        for "welch" and 0 for "wavelet".
+    cadence : str or pd.Timedelta, optional
+        Grid spacing, see :py:func:`grid_positions`.
+    max_gap : int
+        Longest run of missing samples filled in a segment. Segments with
+        longer gaps are dropped.
+    detrend_how : {"constant", "linear", False}
+        Trend removed from each segment.
+    frequencies : array-like, optional
+        Wavelet frequencies [Hz]. Defaults to 32 log-spaced frequencies from
+        ``4 / (nperseg * dt)`` to the Nyquist frequency.
+    w0 : float
+        Morlet non-dimensional frequency.
+    polarity : np.ndarray, optional
+        Sign applied to `b`, see :py:attr:`AlfvenicTurbulence.polarity`.
+    chunksize : int, optional
+        Segments transformed at once. Defaults to at most 256 segments whose
+        complex coefficients fit in :py:data:`CHUNK_BYTES`. A wavelet chunk
+        holds ``(chunksize, 6, len(frequencies), npad)`` coefficients, where
+        ``npad`` is the next power of two of at least ``2 * nperseg``.
+    n_jobs : int
+        Number of threads processing chunks. -1 uses all CPUs.
+
+    Returns
+    -------
+    spectra : pd.DataFrame
+        :py:data:`QUANTITIES` indexed by frequency "f" [Hz]. Energies are
+        :math:`\frac{1}{2}` the trace power spectral densities. The number of
+        segments used is in ``spectra.attrs["segments"]``.
+
+    Raises
+    ------
+    ValueError
+        If there are fewer than `nperseg` samples or every segment has a gap
+        longer than `max_gap`.
+    """
+    if method not in ("welch", "wavelet"):
+        raise ValueError(f"Unrecognized method: {method}")
+    nperseg = int(nperseg)
+    if nperseg < 2:
+        raise ValueError(f"`nperseg` must be at least 2, not {nperseg}")
+    if noverlap is None:
+        noverlap = nperseg // 2 if method == "welch" else 0
+    step = nperseg - int(noverlap)
+    if step < 1:
+        raise ValueError("`noverlap` must be less than `nperseg`.")
+
+    data = np.concatenate([np.asarray(v, float), np.asarray(b, float)], axis=1)
+    if polarity is not None:
+        data[:, 3:] *= np.asarray(polarity, dtype=float)[:, None]
+    positions, cadence = grid_positions(index, cadence)
+    dt = cadence.total_seconds()
+
+    ngrid = positions[-1] + 1 if len(positions) else 0
+    nseg = (ngrid - nperseg) // step + 1 if ngrid >= nperseg else 0
+    if nseg < 1:
+        raise ValueError(f"Fewer than `nperseg` ({nperseg}) samples.")
+
+    if method == "welch":
+        f = np.fft.rfftfreq(nperseg, d=dt)
+    else:
+        if frequencies is None:
+            frequencies = np.geomspace(4.0 / (nperseg * dt), 0.5 / dt, 32)
+        f = np.asarray(frequencies, dtype=float)
+
+    if chunksize is None:
+        chunksize = _default_chunksize(method, nperseg, len(f))
+    chunksize = max(int(chunksize), 1)
+
+    def work(first):
+        last = min(first + chunksize, nseg)
+        g0 = first * step
+        g1 = (last - 1) * step + nperseg
+        lo, hi = positions.searchsorted([g0, g1])
+
+        grid = np.full((g1 - g0, data.shape[1]), np.nan)
+        grid[positions[lo:hi] - g0] = data[lo:hi]
+        segments = np.lib.stride_tricks.sliding_window_view(grid, nperseg, axis=0)
+        segments, good = fill_gaps(segments[::step], max_gap)
+        good = good.all(axis=1)
+
+        segments = detrend(segments[good], detrend_how)
+        if not len(segments):
+            return np.zeros((3, len(f))), 0
+        return _segment_spectra(segments, method, dt, f, w0), len(segments)
+
+    results = parallel.map_threads(work, range(0, nseg, chunksize), n_jobs)
+
+    used = sum(r[1] for r in results)
+    if not used:
+        raise ValueError(
+            f"All {nseg} segments have gaps longer than `max_gap` ({max_gap})."
+        )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pv, pb, cross = sum(r[0] for r in results) / used
+
+    ev = 0.5 * pv
+    eb = 0.5 * pb
+    ep = 0.5 * (pv + pb + 2.0 * cross)
+    em = 0.5 * (pv + pb - 2.0 * cross)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = pd.DataFrame(
+            {
+                "e_plus": ep,
+                "e_minus": em,
+                "kinetic_energy": ev,
+                "magnetic_energy": eb,
+                "sigma_c": (ep - em) / (ep + em),
+                "sigma_r": (ev - eb) / (ev + eb),
+            },
+            index=pd.Index(f, name="f"),
+        )
+    out.columns.name = "M"
+    out.attrs["segments"] = used
+    return out
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+r"""Array-backed columnar storage for :py:class:`~solarwindpy.core.plasma.Plasma`.
+
+The default :py:class:`~solarwindpy.core.plasma.Plasma` keeps all measurements in
+a single three-level ``("M", "C", "S")`` :py:class:`pandas.DataFrame`. Selecting a
+species from that frame requires a MultiIndex lookup and every multi-species
+quantity requires a ``concat`` plus a ``groupby``. For long time series, that
+overhead dominates the arithmetic.
+
+:py:class:`ColumnarStorage` instead holds each measurement as a contiguous
+NumPy block shaped ``(time, species, component)`` along with a species to slot
+index. Per-species slices of a block are views, so derived quantities can be
+calculated on plain arrays and only converted back to pandas objects at the
+edges. The blocks are read-only, so frames wrapping them without a copy can't
+be used to change the stored measurements.
+"""
+
+import numpy as np
+import pandas as pd
+
+VECTOR_COMPONENTS = ("x", "y", "z")
+TENSOR_COMPONENTS = ("par", "per", "scalar")
+
+
+def _readonly(arr):
+    r"""Read-only view of `arr`, leaving `arr` itself writeable."""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+class ColumnarStorage(object):
+    r"""Contiguous NumPy blocks containing plasma measurements.
+
+    Parameters
+    ----------
+    index : :py:class:`pandas.Index`
+        Time index shared by all blocks.
+    species : tuple of str
+        Species stored in the blocks. The position of each species in the tuple
+        is its slot along the species axis.
+    n : :py:class:`numpy.ndarray`
+        Number densities shaped ``(time, species)``.
+    v : :py:class:`numpy.ndarray`
+        Velocities shaped ``(time, species, 3)`` with components
+        :py:data:`VECTOR_COMPONENTS`.
+    w : :py:class:`numpy.ndarray`
+        Thermal speeds shaped ``(time, species, 3)`` with components
+        :py:data:`TENSOR_COMPONENTS`.
+    b : :py:class:`numpy.ndarray`
+        Magnetic field shaped ``(time, 3)`` with components
+        :py:data:`VECTOR_COMPONENTS`.
+
+    The blocks are stored as read-only views of `n`, `v`, `w`, and `b`.
+    """
+
+    def __init__(self, index, species, n, v, w, b):
+        species = tuple(species)
+        nt = len(index)
+        ns = len(species)
+
+        if n.shape != (nt, ns):
+            raise ValueError(f"`n` must have shape {(nt, ns)}, not {n.shape}")
+        if v.shape != (nt, ns, len(VECTOR_COMPONENTS)):
+            raise ValueError(f"`v` must have shape {(nt, ns, 3)}, not {v.shape}")
+        if w.shape != (nt, ns, len(TENSOR_COMPONENTS)):
+            raise ValueError(f"`w` must have shape {(nt, ns, 3)}, not {w.shape}")
+        if b.shape != (nt, len(VECTOR_COMPONENTS)):
+            raise ValueError(f"`b` must have shape {(nt, 3)}, not {b.shape}")
+
+        self._index = index
+        self._species = species
+        self._slots = {s: i for i, s in enumerate(species)}
+        self._n = _readonly(n)
+        self._v = _readonly(v)
+        self._w = _readonly(w)
+        self._b = _readonly(b)
+
+    @classmethod
+    def from_frame(cls, data, species):
+        r"""Build storage from a ``("M", "C", "S")`` plasma DataFrame.
+
+        Parameters
+        ----------
+        data : :py:class:`pandas.DataFrame`
+            Plasma data as stored in :py:attr:`Plasma.data`.
+        species : iterable of str
+            Species to store. Missing measurements are filled with NaN.
+
+        Returns
+        -------
+        ColumnarStorage
+        """
+        species = tuple(species)
+        columns = data.columns
+        nt = data.shape[0]
+
+        def gather(labels):
+            out = np.full((nt, len(labels)), np.nan, dtype=np.float64)
+            locs = columns.get_indexer(pd.MultiIndex.from_tuples(labels))
+            for j, loc in enumerate(locs):
+                if loc >= 0:
+                    out[:, j] = data.iloc[:, loc].to_numpy(dtype=np.float64)
+            return out
+
+        n = gather([("n", "", s) for s in species])
+        v = gather([("v", c, s) for s in species for c in VECTOR_COMPONENTS])
+        w = gather([("w", c, s) for s in species for c in TENSOR_COMPONENTS])
+        b = gather([("b", c, "") for c in VECTOR_COMPONENTS])
+
+        v = v.reshape(nt, len(species), len(VECTOR_COMPONENTS))
+        w = w.reshape(nt, len(species), len(TENSOR_COMPONENTS))
+
+        return cls(data.index, species, n, v, w, b)
+
+    @property
+    def index(self):
+        r"""Time index shared by all blocks."""
+        return self._index
+
+    @property
+    def species(self):
+        r"""Species stored, ordered by slot."""
+        return self._species
+
+    @property
+    def n(self):
+        r"""Number density block shaped ``(time, species)``."""
+        return self._n
+
+    @property
+    def v(self):
+        r"""Velocity block shaped ``(time, species, 3)``."""
+        return self._v
+
+    @property
+    def w(self):
+        r"""Thermal speed block shaped ``(time, species, 3)``."""
+        return self._w
+
+    @property
+    def b(self):
+        r"""Magnetic field block shaped ``(time, 3)``."""
+        return self._b
+
+    @property
+    def nbytes(self):
+        r"""Total number of bytes held by the blocks."""
+        return self.n.nbytes + self.v.nbytes + self.w.nbytes + self.b.nbytes
+
+    def __len__(self):
+        return len(self.index)
+
+    def slot(self, species):
+        r"""Position of `species` along the species axis."""
+        try:
+            return self._slots[species]
+        except KeyError:
+            raise KeyError(f"Species `{species}` not in storage: {self.species}")
+
+    def slots(self, *species):
+        r"""Array of slots for `species`, suitable for fancy indexing."""
+        return np.array([self.slot(s) for s in species], dtype=np.intp)
+
+    def take(self, block, *species):
+        r"""Select `species` from `block`.
+
+        A single species returns a view with the species axis retained. Multiple
+        species use fancy indexing.
+        """
+        block = getattr(self, block)
+        if len(species) == 1:
+            i = self.slot(species[0])
+            return block[:, i : i + 1]
+        return block[:, self.slots(*species)]
+
+    def set_species(self, species, n, v, w):
+        r"""Store measurements for `species`.
+
+        Existing species are overwritten in their slot of new copies of the
+        ``n``, ``v``, and ``w`` blocks, so frames already wrapping the blocks
+        keep their values. New species are appended as the last slot, which
+        also reallocates the blocks once.
+
+        Parameters
+        ----------
+        species : str
+        n : :py:class:`numpy.ndarray`
+            Number density shaped ``(time,)``.
+        v, w : :py:class:`numpy.ndarray`
+            Velocity and thermal speed shaped ``(time, 3)``.
+        """
+        nt = len(self.index)
+        n = np.asarray(n, dtype=np.float64).reshape(nt, 1)
+        v = np.asarray(v, dtype=np.float64).reshape(nt, 1, len(VECTOR_COMPONENTS))
+        w = np.asarray(w, dtype=np.float64).reshape(nt, 1, len(TENSOR_COMPONENTS))
+
+        i = self._slots.get(species)
+        if i is not None:
+            blocks = []
+            for block, new in ((self._n, n), (self._v, v), (self._w, w)):
+                block = block.copy()
+                block[:, i : i + 1] = new
+                blocks.append(block)
+        else:
+            blocks = [
+                np.concatenate([self._n, n], axis=1),
+                np.concatenate([self._v, v], axis=1),
+                np.concatenate([self._w, w], axis=1),
+            ]
+            self._slots[species] = len(self._species)
+            self._species = self._species + (species,)
+
+        self._n, self._v, self._w = (_readonly(block) for block in blocks)
+
+    def rows(self, start, stop):
+        r"""Storage of the rows ``start:stop`` sharing this storage's blocks."""
+        rows = slice(start, stop)
+        return type(self)(
+            self.index[rows],
+            self.species,
+            self._n[rows],
+            self._v[rows],
+            self._w[rows],
+            self._b[rows],
+        )
+
+    def species_frame(self, arr, species, name="S"):
+        r"""Wrap an array shaped ``(time, species)`` as a DataFrame."""
+        columns = pd.Index(species, name=name)
+        return pd.DataFrame(arr, index=self.index, columns=columns, copy=False)
+
+    def component_frame(self, arr, components):
+        r"""Wrap an array shaped ``(time, component)`` as a DataFrame."""
+        columns = pd.Index(components, name="C")
+        return pd.DataFrame(arr, index=self.index, columns=columns, copy=False)
+
+    def component_species_frame(self, arr, species, components):
+        r"""Wrap an array shaped ``(time, species, component)`` as a DataFrame.
+
+        Columns are a ``("C", "S")`` MultiIndex sorted in the same way as the
+        equivalent :py:class:`Plasma` pandas calculations.
+        """
+        nt, ns, nc = arr.shape
+        columns = pd.MultiIndex.from_product(
+            [list(components), list(species)], names=["C", "S"]
+        )
+        values = np.transpose(arr, (0, 2, 1)).reshape(nt, nc * ns)
+        out = pd.DataFrame(values, index=self.index, columns=columns, copy=False)
+        if not columns.is_monotonic_increasing:
+            out = out.sort_index(axis=1)
+        return out
+
+    def vector_frame(self, species):
+        r"""Velocity of `species` as a DataFrame with ``x``, ``y``, ``z`` columns."""
+        return self.component_frame(self.v[:, self.slot(species)], VECTOR_COMPONENTS)
+
+    def tensor_frame(self, species):
+        r"""Thermal speed of `species` with ``par``, ``per``, ``scalar`` columns."""
+        return self.component_frame(self.w[:, self.slot(species)], TENSOR_COMPONENTS)
+
+    def bfield_frame(self):
+        r"""Magnetic field as a DataFrame with ``x``, ``y``, ``z`` columns."""
+        return self.component_frame(self.b, VECTOR_COMPONENTS)
+
+    def ion_frame(self, species):
+        r"""All measurements for `species` with ``("M", "C")`` columns.
+
+        The layout matches ``Plasma.data.xs(species, axis=1, level="S")``.
+        """
+        i = self.slot(species)
+        n = self.n[:, i : i + 1]
+        values = np.concatenate([n, self.v[:, i], self.w[:, i]], axis=1)
+        columns = pd.MultiIndex.from_tuples(
+            [("n", "")]
+            + [("v", c) for c in VECTOR_COMPONENTS]
+            + [("w", c) for c in TENSOR_COMPONENTS],
+            names=["M", "C"],
+        )
+        return pd.DataFrame(values, index=self.index, columns=columns, copy=False)
+
+    def to_frame(self):
+        r"""Reassemble a ``("M", "C", "S")`` DataFrame from the blocks."""
+        species = self.species
+        pieces = {
+            ("n", ""): self.species_frame(self.n, species),
+        }
+        for block, components in (("v", VECTOR_COMPONENTS), ("w", TENSOR_COMPONENTS)):
+            arr = getattr(self, block)
+            for j, c in enumerate(components):
+                pieces[(block, c)] = self.species_frame(arr[:, :, j], species)
+
+        out = pd.concat(pieces, axis=1, names=["M", "C"], sort=False)
+        b = pd.DataFrame(
+            self.b,
+            index=self.index,
+            columns=pd.MultiIndex.from_tuples(
+                [("b", c, "") for c in VECTOR_COMPONENTS], names=["M", "C", "S"]
+            ),
+        )
+        out = pd.concat([b, out], axis=1, sort=False).sort_index(axis=1)
+        return out
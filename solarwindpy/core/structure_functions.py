@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+r"""Structure functions for :py:meth:`AlfvenicTurbulence.structure_functions`.
+
+The structure function of order :math:`p` at lag :math:`\tau` is
+:math:`S_p(\tau) = \langle |x(t + \tau) - x(t)|^p \rangle`, where
+:math:`|\cdot|` is the vector magnitude. Increments at each lag are strided
+differences of the ``(N, 3)`` arrays taken `chunksize` rows at a time, so
+memory is bounded by the chunk regardless of the number of lags or orders.
+Lags are processed in threads.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import parallel
+
+ORDERS = (2, 3, 4, 5, 6)
+
+
+def _lag_moments(data, lag, orders, chunksize):
+    r"""Sums of ``|dx|**orders`` and valid counts for one `lag`.
+
+    `data` is ``(N, F, 3)``. Increments with any NaN component are skipped.
+    """
+    n = data.shape[0] - lag
+    sums = np.zeros((data.shape[1], len(orders)))
+    counts = np.zeros(data.shape[1], dtype=np.int64)
+    for start in range(0, max(n, 0), chunksize):
+        stop = min(start + chunksize, n)
+        delta = data[start + lag : stop + lag] - data[start:stop]
+        mag = np.sqrt((delta**2).sum(axis=-1))
+        valid = np.isfinite(mag)
+        mag = np.where(valid, mag, 0.0)
+        sums += np.power(mag[..., None], orders).sum(axis=0)
+        counts += valid.sum(axis=0)
+    return sums, counts
+
+
+def structure_functions(fields, lags, orders=ORDERS, chunksize=65536, n_jobs=1):
+    r"""Structure functions of several vector fields at many lags.
+
+    Parameters
+    ----------
+    fields : dict
+        Maps names to ``(N, 3)`` arrays sampled at the same times.
+    lags : iterable of int
+        Lags in rows. The rows should be regularly spaced in time, see
+        :py:meth:`Plasma.resample`.
+    orders : iterable of number
+        Orders :math:`p` of the structure functions.
+    chunksize : int
+        Increments calculated at once for each lag.
+    n_jobs : int
+        Number of threads processing lags. -1 uses all CPUs.
+
+    Returns
+    -------
+    sf : pd.DataFrame
+        Indexed by "lag" with ``("M", "order")`` columns. For each field,
+        the orders are followed by the kurtosis (flatness)
+        :math:`S_4 / S_2^2` and the number of increments "n".
+    """
+    lags = [int(lag) for lag in lags]
+    if not lags:
+        raise ValueError("At least one lag is required.")
+    if min(lags) < 1:
+        raise ValueError(f"Lags must be positive, not {min(lags)}")
+    orders = list(orders)
+    if not orders:
+        raise ValueError("At least one order is required.")
+
+    names = list(fields)
+    data = np.stack([np.asarray(fields[k], dtype=float) for k in names], axis=1)
+    if data.ndim != 3 or data.shape[-1] != 3:
+        raise ValueError("Fields must be (N, 3) arrays of the same length.")
+
+    # The kurtosis always needs the 2nd and 4th orders.
+    powers = np.array(sorted(set(orders) | {2, 4}), dtype=float)
+    chunksize = max(int(chunksize), 1)
+
+    def work(lag):
+        return _lag_moments(data, lag, powers, chunksize)
+
+    results = parallel.map_threads(work, lags, n_jobs)
+
+    sums = np.stack([r[0] for r in results])
+    counts = np.stack([r[1] for r in results])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        moments = sums / counts[..., None]
+    moments[counts == 0] = np.nan
+
+    pick = powers.searchsorted(np.asarray(orders, dtype=float))
+    s2 = moments[..., powers.searchsorted(2)]
+    s4 = moments[..., powers.searchsorted(4)]
+    out = np.concatenate(
+        [moments[..., pick], (s4 / s2**2)[..., None], counts[..., None]],
+        axis=-1,
+    )
+
+    columns = pd.MultiIndex.from_product(
+        [names, orders + ["kurtosis", "n"]], names=["M", "order"]
+    )
+    return pd.DataFrame(
+        out.reshape(len(lags), -1),
+        index=pd.Index(lags, name="lag"),
+        columns=columns,
+    )
+
+
+def scaling_exponents(sf, orders=None):
+    r"""Scaling exponents :math:`\zeta_p` with :math:`S_p \propto \tau^{\zeta_p}`.
+
+    Departures of :math:`\zeta_p` from a linear function of :math:`p`, e.g.
+    :math:`p / 3` for Kolmogorov scaling, measure intermittency.
+
+    Parameters
+    ----------
+    sf : pd.DataFrame
+        Output of :py:func:`structure_functions`.
+    orders : iterable of number, optional
+        Orders to fit. Defaults to all of those in `sf`.
+
+    Returns
+    -------
+    zeta : pd.DataFrame
+        Least squares log-log slopes over all lags, indexed by "order" with
+        an "M" column for each field.
+    """
+    if orders is None:
+        orders = [
+            p
+            for p in sf.columns.get_level_values("order").unique()
+            if p not in ("kurtosis", "n")
+        ]
+    orders = list(orders)
+    names = sf.columns.get_level_values("M").unique()
+
+    x = np.log(sf.index.to_numpy(dtype=float))
+    y = np.log(
+        sf.loc[:, pd.MultiIndex.from_product([names, orders])].to_numpy(dtype=float)
+    )
+    slope = np.polyfit(x, y, 1)[0]
+    return pd.DataFrame(
+        slope.reshape(len(names), len(orders)).T,
+        index=pd.Index(orders, name="order"),
+        columns=names,
+    )
@@ -4,10 +4,16 @@
 The values are derived from :mod:`scipy.constants`. All quantities stored in
 the :class:`~solarwindpy.core.plasma.Plasma` object have a corresponding entry
 in :class:`Constants` and can be converted using :class:`Units`.
+
+:data:`SPECIES` holds the per-species constants, and coefficients derived from
+them, as read-only arrays indexed by species slot. Hot paths gather the values
+for any number of species with one integer take instead of pandas label
+lookups.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
+import numpy as np
 import pandas as pd
 
 from scipy import constants
@@ -137,6 +143,94 @@ class Constants:
                 raise TypeError("Constant values must be pandas Series")
 
 
+@dataclass(frozen=True)
+class SpeciesTable:
+    r"""Frozen per-species constants indexed by species slot.
+
+    Each array has one entry per species in :py:attr:`species`. Use
+    :py:meth:`slots` to translate species to slots or :py:meth:`take` to
+    gather a constant for several species at once.
+
+    Attributes
+    ----------
+    species : tuple of str
+        Species in slot order.
+    m, m_in_mp, m_amu : np.ndarray
+        Masses in kg, proton masses, and amu.
+    charges, charge_states : np.ndarray
+        Charges in C and in units of the elementary charge.
+    sqrt_m2q : np.ndarray
+        :math:`\sqrt{m/q}` in proton units, used to project velocities.
+    m_2kb : np.ndarray
+        :math:`m / 2 k_B` in K s^2 m^-2, i.e. the temperature of unit thermal
+        speed.
+    """
+
+    species: tuple
+    m: np.ndarray
+    m_in_mp: np.ndarray
+    m_amu: np.ndarray
+    charges: np.ndarray
+    charge_states: np.ndarray
+    sqrt_m2q: np.ndarray
+    m_2kb: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Freeze the arrays and index the species."""
+        for f in fields(self):
+            arr = getattr(self, f.name)
+            if isinstance(arr, np.ndarray):
+                if arr.shape != (len(self.species),):
+                    raise ValueError(f"{f.name} must have one value per species")
+                arr.flags.writeable = False
+        object.__setattr__(self, "_slots", {s: i for i, s in enumerate(self.species)})
+
+    @classmethod
+    def from_constants(cls, constants: "Constants") -> "SpeciesTable":
+        """Build the table from the species in ``constants.m``."""
+        species = tuple(constants.m.index)
+
+        def take(series):
+            return series.reindex(species).to_numpy(dtype=float)
+
+        m = take(constants.m)
+        m_in_mp = take(constants.m_in_mp)
+        charge_states = take(constants.charge_states)
+        with np.errstate(invalid="ignore"):
+            # NaN for negative charges, as before.
+            sqrt_m2q = np.sqrt(m_in_mp / charge_states)
+        return cls(
+            species=species,
+            m=m,
+            m_in_mp=m_in_mp,
+            m_amu=take(constants.m_amu),
+            charges=take(constants.charges),
+            charge_states=charge_states,
+            sqrt_m2q=sqrt_m2q,
+            m_2kb=0.5 * m / constants.kb.J,
+        )
+
+    def slot(self, species: str) -> int:
+        """Slot of a single ``species``."""
+        try:
+            return self._slots[species]
+        except KeyError:
+            raise KeyError(f"Unrecognized species: {species}") from None
+
+    def slots(self, *species: str) -> np.ndarray:
+        """Slots of ``species`` as an integer array."""
+        return np.fromiter(
+            (self.slot(s) for s in species), dtype=np.intp, count=len(species)
+        )
+
+    def take(self, name: str, *species: str) -> np.ndarray:
+        """Constant ``name`` for each of ``species``."""
+        return getattr(self, name)[self.slots(*species)]
+
+
+SPECIES = SpeciesTable.from_constants(Constants())
+
+
 @dataclass
 class Units:
     r"""Common unit conversion factors.
@@ -163,6 +257,8 @@ class Units:
         Dimensionless count units.
     qpar : float
         Parallel heat flux units :math:`[\mathrm{mW\,cm^{-2}}]`.
+    kinetic_energy_flux : float
+        Kinetic energy flux units :math:`[\mathrm{mW\,m^{-2}}]`.
     distance2sun : float
         Distance to sun units ``[m]``.
     """
@@ -184,6 +280,7 @@ class Units:
     nuc: float = 1e-7
     nc: float = 1.0
     qpar: float = 1e-7
+    kinetic_energy_flux: float = 1e-3
     distance2sun: float = 1.0
     specific_entropy: float = field(init=False)
 
@@ -3,12 +3,38 @@
 
 This module provides a Vector class and its subclass BField for handling vector
 operations and magnetic field calculations.
+
+Calculations run on the ``(N, 3)`` array of Cartesian components with fused
+NumPy kernels and are returned as pandas objects. Each :class:`Vector` caches
+its components, magnitude, and unit vector, so repeated projections onto the
+same vector, e.g. :py:attr:`Plasma.b`, only normalize it once. Vectors assume
+their data are not modified in place.
 """
 
 import numpy as np
 import pandas as pd
 
 from . import base
+from . import frames
+
+_COMPONENTS = pd.Index(["x", "y", "z"])
+
+
+def _norm(xyz: np.ndarray) -> np.ndarray:
+    """Row-wise Euclidean norm of ``(N, k)`` ``xyz``, propagating NaNs."""
+    return np.sqrt(np.einsum("ij,ij->i", xyz, xyz))
+
+
+def _dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise dot product of two ``(N, 3)`` arrays."""
+    return np.einsum("ij,ij->i", a, b)
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """Read-only view of ``arr``, leaving ``arr`` itself writeable."""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
 
 
 class Vector(base.Base):
@@ -18,17 +44,59 @@ class Vector(base.Base):
     ----------
     data : :class:`pandas.DataFrame`
         Data with ``x``, ``y`` and ``z`` components.
+    frame : str, optional
+        Coordinate frame of the components, e.g. ``"GSE"``.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, frame: str | None = None):
         """Initialize a :class:`Vector` instance.
 
         Parameters
         ----------
         data : :class:`pandas.DataFrame`
             The vector data with ``x``, ``y`` and ``z`` components.
+        frame : str, optional
+            Coordinate frame of the components. See
+            :py:data:`~solarwindpy.core.frames.FRAMES`.
         """
         super().__init__(data)
+        self._frame = None if frame is None else frames.conform_frame(frame)
+
+    @classmethod
+    def from_array(
+        cls, xyz: np.ndarray, index: pd.Index, frame: str | None = None
+    ) -> "Vector":
+        """Build a vector from an ``(N, 3)`` array of components.
+
+        Parameters
+        ----------
+        xyz : :class:`numpy.ndarray`
+            ``x``, ``y`` and ``z`` components, which aren't copied.
+        index : :class:`pandas.Index`
+            Index of the ``N`` rows.
+        frame : str, optional
+            Coordinate frame of the components.
+
+        Returns
+        -------
+        Vector
+            Instance of ``cls``.
+        """
+        xyz = np.asarray(xyz, dtype=float)
+        if xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError(f"Vector components must be (N, 3), not {xyz.shape}")
+        return cls._wrap(xyz, index, _COMPONENTS, frame)
+
+    @classmethod
+    def _wrap(cls, xyz, index, columns, frame):
+        new = cls(pd.DataFrame(xyz, index=index, columns=columns), frame=frame)
+        new._cache["xyz"] = _readonly(xyz)
+        return new
+
+    @property
+    def frame(self) -> str | None:
+        """Coordinate frame of the components, if known."""
+        return self._frame
 
     def __call__(self, component: str) -> pd.Series:
         """Return a vector component.
@@ -68,6 +136,43 @@ class Vector(base.Base):
                 f"Required columns: {required_columns}\nProvided: {new.columns}"
             )
         self._data = new
+        self._cache = {}
+
+    @property
+    def xyz(self) -> np.ndarray:
+        """Read-only ``(N, 3)`` array of the Cartesian components.
+
+        Returns
+        -------
+        numpy.ndarray
+            Columns ``x``, ``y`` and ``z``.
+        """
+        xyz = self._cache.get("xyz")
+        if xyz is None:
+            xyz = self.cartesian.to_numpy(dtype=float)
+            if not xyz.flags.c_contiguous:
+                xyz = np.ascontiguousarray(xyz)
+            xyz = self._cache["xyz"] = _readonly(xyz)
+        return xyz
+
+    def _mag(self) -> np.ndarray:
+        mag = self._cache.get("mag")
+        if mag is None:
+            mag = self._cache["mag"] = _readonly(_norm(self.xyz))
+        return mag
+
+    def _uv(self) -> np.ndarray:
+        uv = self._cache.get("uv")
+        if uv is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                uv = self.xyz / self._mag()[:, np.newaxis]
+            uv = self._cache["uv"] = _readonly(uv)
+        return uv
+
+    def _series(self, values: np.ndarray, name: str | None) -> pd.Series:
+        # Copy cached, read-only arrays so callers get a writeable Series.
+        copy = not values.flags.writeable
+        return pd.Series(values, index=self.data.index, name=name, copy=copy)
 
     @property
     def mag(self) -> pd.Series:
@@ -78,10 +183,7 @@ class Vector(base.Base):
         pd.Series
             Vector magnitude.
         """
-        mag = self.data.loc[:, ["x", "y", "z"]]
-        mag = mag.pow(2).sum(axis=1, skipna=False).pow(0.5)
-        mag.name = "mag"
-        return mag
+        return self._series(self._mag(), "mag")
 
     @property
     def magnitude(self) -> pd.Series:
@@ -103,10 +205,7 @@ class Vector(base.Base):
         pd.Series
             XY-plane magnitude.
         """
-        rho = self.data.loc[:, ["x", "y"]]
-        rho = rho.pow(2).sum(axis=1, skipna=False).pow(0.5)
-        rho.name = "rho"
-        return rho
+        return self._series(_norm(self.xyz[:, :2]), "rho")
 
     @property
     def colat(self):
@@ -128,9 +227,9 @@ class Vector(base.Base):
         pd.Series
             Colatitude in degrees.
         """
-        colat = np.rad2deg(np.arctan2(self.data.z, self.rho))
-        colat.name = "colatitude"
-        return colat
+        xyz = self.xyz
+        colat = np.rad2deg(np.arctan2(xyz[:, 2], _norm(xyz[:, :2])))
+        return self._series(colat, "colatitude")
 
     @property
     def lat(self):
@@ -152,9 +251,9 @@ class Vector(base.Base):
         pd.Series
             Latitude in degrees.
         """
-        lat = np.rad2deg(np.arctan2(self.rho, self.data.z))
-        lat.name = "latitude"
-        return lat
+        xyz = self.xyz
+        lat = np.rad2deg(np.arctan2(_norm(xyz[:, :2]), xyz[:, 2]))
+        return self._series(lat, "latitude")
 
     @property
     def longitude(self) -> pd.Series:
@@ -165,9 +264,9 @@ class Vector(base.Base):
         pd.Series
             Longitude in degrees.
         """
-        lon = np.rad2deg(np.arctan2(self.data.y, self.data.x))
-        lon.name = "longitude"
-        return lon
+        xyz = self.xyz
+        lon = np.rad2deg(np.arctan2(xyz[:, 1], xyz[:, 0]))
+        return self._series(lon, "longitude")
 
     @property
     def lon(self) -> pd.Series:
@@ -189,9 +288,7 @@ class Vector(base.Base):
         pd.Series
             Vector magnitude.
         """
-        r = self.mag
-        r.name = "r"
-        return r
+        return self._series(self._mag(), "r")
 
     @property
     def cartesian(self) -> pd.DataFrame:
@@ -213,9 +310,9 @@ class Vector(base.Base):
         Vector
             Normalised vector.
         """
-        uv = self.cartesian.divide(self.mag, axis=0)
-        uv.name = "uv"
-        return Vector(uv)
+        return Vector._wrap(
+            self._uv().copy(), self.data.index, self.cartesian.columns, self.frame
+        )
 
     @property
     def uv(self) -> "Vector":
@@ -228,6 +325,62 @@ class Vector(base.Base):
         """
         return self.unit_vector
 
+    def to_frame(
+        self,
+        name: str,
+        frame: str | None = None,
+        position=None,
+    ) -> "Vector":
+        """Rotate the vector into coordinate frame ``name``.
+
+        The rotation at each time in the index is calculated by
+        :py:func:`~solarwindpy.core.frames.transform`. Use
+        :py:meth:`Spacecraft.to_frame` to transform positions, which are also
+        translated.
+
+        Parameters
+        ----------
+        name : str
+            Target frame.
+        frame : str, optional
+            Current frame. Defaults to :py:attr:`frame`.
+        position : :class:`Spacecraft` or tuple, optional
+            Spacecraft position defining RTN, required if either frame is RTN.
+            Either a :class:`Spacecraft` or a ``(data, frame)`` pair with
+            ``(N, 3)`` data.
+
+        Returns
+        -------
+        Vector
+            Same type as ``self`` with the rotated ``x``, ``y`` and ``z``.
+
+        Raises
+        ------
+        ValueError
+            If the current frame is unknown.
+        """
+        frame = self.frame if frame is None else frame
+        if frame is None:
+            raise ValueError("Vector's frame is unknown.")
+
+        position_frame = None
+        if position is not None:
+            if hasattr(position, "position") and hasattr(position, "frame"):
+                position, position_frame = position.position.data, position.frame
+            else:
+                position, position_frame = position
+            position = np.asarray(position, dtype=float)
+
+        rotated = frames.transform(
+            self.xyz,
+            frame,
+            name,
+            self.data.index,
+            position=position,
+            position_frame=position_frame,
+        )
+        return type(self)._wrap(rotated, self.data.index, self.cartesian.columns, name)
+
     def project(self, other: "Vector | pd.DataFrame") -> pd.DataFrame:
         """Project self onto ``other``.
 
@@ -246,22 +399,27 @@ class Vector(base.Base):
         NotImplementedError
             If ``other`` is not a ``Vector`` or ``DataFrame``.
         """
-        if isinstance(other, Vector):
-            other = other.uv.data
-        else:
+        if not isinstance(other, Vector):
             raise NotImplementedError(
                 f"Project method not implemented for {type(other)}"
             )
 
-        cart = self.cartesian
-        par = cart.multiply(other, axis=1).sum(axis=1)
-        per = (
-            cart.subtract(other.multiply(par, axis=0), axis=1)
-            .pow(2)
-            .sum(axis=1)
-            .pipe(np.sqrt)
+        xyz = self.xyz
+        uv = self._aligned_uv(other)
+        par = _dot(xyz, uv)
+        per = _norm(xyz - uv * par[:, np.newaxis])
+        return pd.DataFrame(
+            {"par": par, "per": per}, index=self.data.index, columns=["par", "per"]
         )
-        return pd.concat([par, per], axis=1, keys=("par", "per"), sort=True)
+
+    def _aligned_uv(self, other: "Vector") -> np.ndarray:
+        """Unit vector of ``other`` on this vector's index."""
+        uv = other._uv()
+        index = self.data.index
+        if not other.data.index.equals(index):
+            indexer = other.data.index.get_indexer(index)
+            uv = np.where((indexer < 0)[:, np.newaxis], np.nan, uv[indexer])
+        return uv
 
     def cos_theta(self, other: "Vector | pd.DataFrame") -> pd.Series:
         """Cosine of the angle between this vector and ``other``.
@@ -281,14 +439,12 @@ class Vector(base.Base):
         NotImplementedError
             If ``other`` is not a ``Vector`` or ``DataFrame``.
         """
-        if isinstance(other, Vector):
-            other = other.uv.data
-        else:
+        if not isinstance(other, Vector):
             raise NotImplementedError(
                 f"cos_theta method not implemented for {type(other)}"
             )
 
-        return self.uv.data.multiply(other, axis=1).sum(axis=1)
+        return self._series(_dot(self._uv(), self._aligned_uv(other)), None)
 
 
 class BField(Vector):
@@ -310,11 +466,8 @@ class BField(Vector):
         .. math::
            p_B = \frac{1}{2\mu_0} B^2
         """
-        bsq = self.mag.pow(2.0)
         const = self.units.b**2.0 / (2.0 * self.constants.misc.mu0 * self.units.pth)
-        pb = bsq * const
-        pb.name = "pb"
-        return pb
+        return self._series(_dot(self.xyz, self.xyz) * const, "pb")
 
     @property
     def pb(self) -> pd.Series:
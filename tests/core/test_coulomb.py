@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Tests for :mod:`solarwindpy.core.coulomb` and ``Plasma.coulomb_pairs``."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+from solarwindpy.core import coulomb
+
+from . import test_base
+
+
+@pytest.fixture
+def data():
+    return test_base.TestData().plasma_data
+
+
+@pytest.fixture
+def sc():
+    sc = test_base.TestData().spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    return spacecraft.Spacecraft(sc, "Wind", "GSE")
+
+
+@pytest.mark.parametrize("storage", ["pandas", "columnar"])
+@pytest.mark.parametrize("both_species", [True, False])
+def test_matches_single_pairs(data, sc, storage, both_species):
+    plas = plasma.Plasma(data, "a", "p1", "p2", spacecraft=sc, storage=storage)
+    pairs = plas.coulomb_pairs(both_species=both_species)
+
+    assert pairs.lnlambda.columns.tolist() == ["a,p1", "a,p2", "p1,p2"]
+    for col in pairs.lnlambda:
+        expected = plas.lnlambda(*col.split(","))
+        pdt.assert_series_equal(pairs.lnlambda.loc[:, col], expected, rtol=1e-12)
+
+    sep = "+" if both_species else "-"
+    if both_species:
+        assert pairs.nuc.columns.tolist() == ["a+p1", "a+p2", "p1+p2"]
+    else:
+        assert len(pairs.nuc.columns) == 6
+
+    for col in pairs.nuc:
+        sa, sb = col.split(sep)
+        nuc = plas.nuc(sa, sb, both_species=both_species)
+        nc = plas.nc(sa, sb, both_species=both_species)
+        pdt.assert_series_equal(pairs.nuc.loc[:, col], nuc, rtol=1e-10)
+        pdt.assert_series_equal(pairs.nc.loc[:, col], nc, rtol=1e-10)
+
+
+@pytest.mark.parametrize("chunksize,n_jobs", [(1, 1), (1, 2), (2, -1)])
+def test_chunks(data, chunksize, n_jobs):
+    plas = plasma.Plasma(data, "a", "p1", "p2")
+    ref = plas.coulomb_pairs("a", "p1", "p2")
+    test = plas.coulomb_pairs(chunksize=chunksize, n_jobs=n_jobs)
+    pdt.assert_frame_equal(ref.lnlambda, test.lnlambda)
+    pdt.assert_frame_equal(ref.nuc, test.nuc)
+    assert ref.nc is None
+
+
+def test_invalid_species(data):
+    plas = plasma.Plasma(data, "a", "p1")
+    with pytest.raises(ValueError, match="at least two"):
+        plas.coulomb_pairs("a")
+    with pytest.raises(ValueError, match="individual"):
+        plas.coulomb_pairs("a+p1", "p1")
+    with pytest.raises(ValueError, match="positive"):
+        plas.coulomb_pairs(chunksize=0)
+
+
+def test_nuc_diagonal():
+    n = np.ones((2, 2))
+    w = np.ones((2, 2))
+    v = np.arange(12, dtype=float).reshape(2, 2, 3)
+    lnl = np.ones((2, 2, 2))
+    one = np.ones(2)
+    nu = coulomb.nuc(n, n, w, v, lnl, one, one, 1.0)
+    assert np.isnan(nu[:, [0, 1], [0, 1]]).all()
+    assert np.isfinite(nu[:, [0, 1], [1, 0]]).all()
+    np.testing.assert_allclose(nu[:, 0, 1], nu[:, 1, 0])
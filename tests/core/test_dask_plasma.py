@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Tests for :py:class:`solarwindpy.core.dask_plasma.DaskPlasma`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+
+from . import test_base
+
+dask = pytest.importorskip("dask")
+dd = pytest.importorskip("dask.dataframe")
+
+from solarwindpy.core.dask_plasma import DaskPlasma  # noqa: E402
+
+
+@pytest.fixture
+def plas():
+    r"""100 rows spanning several months with spacecraft and auxiliary data."""
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    epoch = pd.date_range("2020-01-01", periods=100, freq="19h", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    scale = np.linspace(1.0, 2.0, len(epoch))[:, None]
+    data = data.iloc[rows].set_axis(epoch, axis=0) * scale
+
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = sc.iloc[rows].set_axis(epoch, axis=0)
+    sc = spacecraft.Spacecraft(sc, "Wind", "GSE")
+
+    aux = pd.DataFrame({("flag", "", ""): np.arange(len(epoch))}, index=epoch)
+    aux.columns.names = ["M", "C", "S"]
+    return plasma.Plasma(data, "a", "p1", spacecraft=sc, auxiliary_data=aux)
+
+
+def assert_equal(lazy, expected, **kwargs):
+    expected = getattr(expected, "data", expected)
+    computed = lazy.compute()
+    if isinstance(expected, pd.Series):
+        pdt.assert_series_equal(computed, expected, **kwargs)
+    else:
+        pdt.assert_frame_equal(computed, expected, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "name,args",
+    [
+        ("beta", ("p1",)),
+        ("pth", ("a", "p1")),
+        ("velocity", ("p1+a",)),
+        ("nc", ("a", "p1")),
+        ("specific_entropy", ("p1",)),
+    ],
+)
+def test_lazy_methods(plas, name, args):
+    dplas = plas.to_dask(npartitions=4)
+    lazy = getattr(dplas, name)(*args)
+    assert dask.is_dask_collection(lazy)
+    assert_equal(lazy, getattr(plas, name)(*args))
+
+
+def test_compute(plas):
+    dplas = plas.to_dask(chunksize=30)
+    assert dplas.npartitions == 4
+    assert dplas.species == plas.species
+
+    computed = dplas.compute()
+    assert isinstance(computed, plasma.Plasma)
+    assert computed == plas
+    pdt.assert_frame_equal(computed.sc.data, plas.sc.data)
+    pdt.assert_frame_equal(computed.aux, plas.aux)
+
+    quantities = {"beta": "p1", "nc": [("a", "p1")]}
+    pdt.assert_frame_equal(dplas.compute(quantities), plas.compute(quantities))
+
+
+def test_unknown_attribute(plas):
+    dplas = plas.to_dask(npartitions=2)
+    assert "beta" in dir(dplas)
+    with pytest.raises(AttributeError):
+        dplas.set_data
+
+
+def test_from_raw_dask(plas):
+    raw = test_base.TestData().plasma_data
+    epoch = plas.data.index[: raw.shape[0]]
+    raw = raw.set_axis(epoch, axis=0)
+    dplas = DaskPlasma(dd.from_pandas(raw, npartitions=2), "a", "p1")
+    expected = plasma.Plasma(raw, "a", "p1")
+    pdt.assert_frame_equal(dplas.data.compute(), expected.data)
+    assert_equal(dplas.beta("a"), expected.beta("a"))
+
+    with pytest.raises(ValueError):
+        DaskPlasma(
+            dd.from_pandas(raw, npartitions=2),
+            "a",
+            "p1",
+            spacecraft=dd.from_pandas(plas.sc.data, npartitions=3),
+            sc_name="Wind",
+            sc_frame="GSE",
+        )
+
+
+def test_read_parquet(tmp_path, plas):
+    pytest.importorskip("pyarrow")
+    plas.save_parquet(tmp_path, partition="M")
+
+    dplas = DaskPlasma.read_parquet(tmp_path)
+    assert dplas.npartitions == plas.data.index.strftime("%Y-%m").nunique()
+    assert_equal(dplas.nc("a", "p1"), plas.nc("a", "p1"), check_freq=False)
+
+    loaded = dplas.compute()
+    pdt.assert_frame_equal(loaded.data, plas.data, check_freq=False)
+    pdt.assert_frame_equal(loaded.aux, plas.aux, check_freq=False)
+    assert loaded.sc.name == plas.sc.name
+
+    start, stop = plas.data.index[[10, 60]]
+    dplas = DaskPlasma.read_parquet(tmp_path, start=start, stop=stop)
+    assert_equal(
+        dplas.beta("p1"),
+        plas.beta("p1").loc[start:stop],
+        check_freq=False,
+    )
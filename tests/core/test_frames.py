@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""Tests for :py:mod:`solarwindpy.core.frames`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import spacecraft
+from solarwindpy import vector
+from solarwindpy.core import alfvenic_turbulence
+from solarwindpy.core import frames
+
+
+@pytest.fixture
+def epoch():
+    return pd.date_range("2004-01-01", periods=40, freq="9D", name="epoch")
+
+
+@pytest.fixture
+def xyz(epoch):
+    rng = np.random.default_rng(3)
+    return rng.normal(size=(len(epoch), 3))
+
+
+@pytest.mark.parametrize("src", ["GSE", "GSM", "HAE", "HCI", "HEEQ"])
+@pytest.mark.parametrize("dst", ["GSE", "GSM", "HAE", "HCI", "HEEQ"])
+def test_round_trip(epoch, xyz, src, dst):
+    out = frames.transform(xyz, src, dst, epoch)
+    np.testing.assert_allclose(np.linalg.norm(out, axis=1), np.linalg.norm(xyz, axis=1))
+    np.testing.assert_allclose(frames.transform(out, dst, src, epoch), xyz, atol=1e-12)
+
+
+def test_solar_b0():
+    # The Earth is furthest below and above the solar equator in early March
+    # and September.
+    epoch = pd.DatetimeIndex(["2010-03-06", "2010-09-08"])
+    earth = frames.transform_position(np.zeros((2, 3)), "GSE", "HEEQ", epoch)
+    b0 = np.rad2deg(np.arcsin(earth[:, 2] / np.linalg.norm(earth, axis=1)))
+    np.testing.assert_allclose(b0, [-7.25, 7.25], atol=0.02)
+    # HEEQ X points to the Earth.
+    assert (earth[:, 0] > 0).all()
+    np.testing.assert_allclose(earth[:, 1], 0.0, atol=1e-8)
+
+
+def test_sun_in_gse(epoch):
+    sun = frames.transform_position(np.zeros((len(epoch), 3)), "HCI", "GSE", epoch)
+    distance = np.linalg.norm(sun, axis=1)
+    np.testing.assert_allclose(sun[:, 0], distance)
+    assert ((distance > 23000) & (distance < 23900)).all()
+
+
+def test_rtn_at_earth(epoch, xyz):
+    earth = np.zeros_like(xyz)
+    out = frames.transform(
+        xyz, "GSE", "RTN", epoch, position=earth, position_frame="GSE"
+    )
+    # Within the solar inclination of the sign flip.
+    np.testing.assert_allclose(out[:, 0], -xyz[:, 0], atol=1e-3)
+    cos = (out[:, 1:] * xyz[:, 1:] * [-1, 1]).sum(axis=1)
+    cos /= np.linalg.norm(xyz[:, 1:], axis=1) ** 2
+    assert (cos > np.cos(np.deg2rad(7.3))).all()
+
+    back = frames.transform(
+        out, "RTN", "GSE", epoch, position=earth, position_frame="GSE"
+    )
+    np.testing.assert_allclose(back, xyz, atol=1e-12)
+
+    with pytest.raises(ValueError):
+        frames.transform(xyz, "GSE", "RTN", epoch)
+    with pytest.raises(ValueError):
+        frames.transform_position(xyz, "GSE", "RTN", epoch)
+    with pytest.raises(NotImplementedError):
+        frames.transform(xyz, "GSE", "FOO", epoch)
+
+
+def test_cache(epoch):
+    frames.clear_cache()
+    first = frames.rotation_matrices("GSE", "HEEQ", epoch)
+    assert frames.rotation_matrices("GSE", "HEEQ", epoch) is first
+    assert not first.flags.writeable
+    assert frames.rotation_matrices("GSE", "HEEQ", epoch[1:]) is not first
+
+
+def test_vector_to_frame(epoch, xyz):
+    v = vector.BField(pd.DataFrame(xyz, index=epoch, columns=["x", "y", "z"]), "GSE")
+    out = v.to_frame("gsm")
+    assert isinstance(out, vector.BField)
+    assert out.frame == "GSM"
+    np.testing.assert_allclose(
+        out.data.to_numpy(), frames.transform(xyz, "GSE", "GSM", epoch)
+    )
+    pdt.assert_series_equal(out.mag, v.mag)
+
+    pdt.assert_frame_equal(out.to_frame("GSE").data, v.data)
+
+    with pytest.raises(ValueError):
+        vector.Vector(v.data).to_frame("GSM")
+
+
+def test_spacecraft_to_frame(epoch, xyz):
+    data = pd.concat(
+        {
+            "pos": pd.DataFrame(200.0 * xyz, index=epoch, columns=["x", "y", "z"]),
+            "v": pd.DataFrame(xyz, index=epoch, columns=["x", "y", "z"]),
+        },
+        axis=1,
+        names=["M", "C"],
+    )
+    sc = spacecraft.Spacecraft(data, "Wind", "GSE")
+    assert sc.position.frame == "GSE"
+
+    hci = sc.to_frame("HCI")
+    assert hci.frame == "HCI"
+    assert hci.name == sc.name
+    np.testing.assert_allclose(
+        hci.position.data.to_numpy(),
+        frames.transform_position(200.0 * xyz, "GSE", "HCI", epoch),
+    )
+    np.testing.assert_allclose(
+        hci.velocity.data.to_numpy(), frames.transform(xyz, "GSE", "HCI", epoch)
+    )
+    # GSE distances assume the Earth is at 1 AU.
+    np.testing.assert_allclose(hci.distance2sun, sc.distance2sun, rtol=0.02)
+    np.testing.assert_allclose(
+        hci.to_frame("GSM").distance2sun, hci.distance2sun, rtol=1e-10
+    )
+
+    with pytest.raises(ValueError):
+        sc.to_frame("RTN")
+    with pytest.raises(NotImplementedError):
+        spacecraft.Spacecraft(data, "Wind", "RTN")
+
+
+def test_alfvenic_turbulence_rtn(epoch, xyz):
+    frame = pd.DataFrame(xyz, index=epoch, columns=pd.Index(["x", "y", "z"], name="C"))
+    pos = pd.concat({"pos": 200.0 * frame}, axis=1, names=["M"])
+    sc = spacecraft.Spacecraft(pos, "Wind", "GSE")
+    rho = pd.Series(1.0, index=epoch)
+
+    at = alfvenic_turbulence.AlfvenicTurbulence(
+        400.0 * frame,
+        frame,
+        rho,
+        "p",
+        raffaella_version=True,
+        sc_vector=sc,
+        window="20D",
+        min_periods=1,
+    )
+    gse = pd.concat({"v": 400.0 * frame, "b": frame}, axis=1, names=["M"])
+    rtn = at.measurements
+    for m in ("v", "b"):
+        expected = frames.transform(
+            gse.loc[:, m].to_numpy(), "GSE", "RTN", epoch, 200.0 * xyz, "GSE"
+        )
+        # Normal components are untouched by the Parker spiral correction.
+        scale = rtn.loc[:, (m, "z")] / expected[:, 2]
+        np.testing.assert_allclose(scale, scale.iloc[0])
+        np.testing.assert_allclose(rtn.loc[:, (m, "x")], scale * expected[:, 0])
+
+    np.testing.assert_allclose(
+        rtn.loc[:, ("b", "y")], scale * expected[:, 1], rtol=1e-12
+    )
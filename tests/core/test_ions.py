@@ -323,3 +323,77 @@ class TestIonSpecificsOptions(base.TestData):
         i0 = ions.Ion(self.data, s0)
         i1 = ions.Ion(self.data, s1)
         self.assertNotEqual(i0, i1)
+
+
+class TestIonView(base.SWEData):
+    @classmethod
+    def set_object_testing(cls):
+        from solarwindpy import plasma
+
+        cls.plasma = plasma.Plasma(cls.data, "a", "p1", "p2")
+        cls.columnar = plasma.Plasma(cls.data, "a", "p1", "p2", storage="columnar")
+
+    def test_lazy_materialization(self):
+        ion = ions.Ion.view(self.plasma.data, "a")
+        self.assertNotIn("_data", ion.__dict__)
+        pdt.assert_frame_equal(
+            ion.data, ions.Ion(self.plasma.data, "a").data, check_names=False
+        )
+        self.assertIn("_data", ion.__dict__)
+
+    def test_shared_units_constants(self):
+        for ion in self.plasma.ions:
+            self.assertIs(ion.units, self.plasma.units)
+            self.assertIs(ion.constants, self.plasma.constants)
+
+    def test_views_cached(self):
+        ion = self.plasma.ions.loc["p1"]
+        self.assertIs(ion.velocity, ion.velocity)
+        self.assertIs(ion.thermal_speed, ion.thermal_speed)
+
+    def test_columnar_views_share_memory(self):
+        store = self.columnar.storage
+        for s in self.columnar.species:
+            ion = self.columnar.ions.loc[s]
+            self.assertTrue(np.shares_memory(ion.n.values, store.n))
+            self.assertTrue(np.shares_memory(ion.v.data.values, store.v))
+            self.assertTrue(np.shares_memory(ion.w.data.values, store.w))
+            self.assertNotIn("_data", ion.__dict__)
+
+            ref = self.plasma.ions.loc[s]
+            pdt.assert_series_equal(ref.n, ion.n)
+            pdt.assert_frame_equal(ref.v.data, ion.v.data)
+            pdt.assert_frame_equal(ref.w.data, ion.w.data)
+            pdt.assert_series_equal(ref.rho, ion.rho)
+            pdt.assert_frame_equal(ref.pth, ion.pth)
+            pdt.assert_frame_equal(ref.data, ion.data)
+
+    def test_number_density_read_only(self):
+        from solarwindpy import plasma
+
+        for storage in ("pandas", "columnar"):
+            plas = plasma.Plasma(self.data, "a", "p1", "p2", storage=storage)
+            n = plas.p1.n.copy()
+            pth = plas.p1.pth.copy()
+            beta = plas.beta("p1").copy()
+            out = plas.p1.n
+            with self.assertRaisesRegex(ValueError, "read-only"):
+                out.iloc[0] = -999
+            pdt.assert_series_equal(plas.p1.n, n)
+            pdt.assert_series_equal(plas.n("p1"), n, check_names=False)
+            pdt.assert_frame_equal(plas.p1.pth, pth)
+            pdt.assert_frame_equal(plas.beta("p1"), beta)
+            self.assertTrue(plas.data.loc[:, ("n", "", "p1")].equals(n))
+
+    def test_set_data_resets_view(self):
+        ion = ions.Ion.view(self.plasma.data, "a", storage=self.columnar.storage)
+        ion.set_data(self.plasma.data)
+        self.assertIsNone(ion._storage)
+        pdt.assert_frame_equal(ion.v.data, self.plasma.ions.loc["a"].v.data)
+
+    def test_plasma_missing_required_columns(self):
+        from solarwindpy import plasma
+
+        data = self.data.drop(("w", "per", "a"), axis=1)
+        with self.assertRaisesRegex(ValueError, "Missing required columns"):
+            plasma.Plasma(data, "a", "p1")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""Tests for :py:mod:`solarwindpy.core.load_stats` and plasma load statistics."""
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy.core import load_stats
+
+from . import test_base
+
+
+@pytest.fixture
+def frame():
+    r"""Positive, negative, and NaN-containing columns."""
+    rng = np.random.default_rng(42)
+    values = rng.lognormal(size=(5000, 3)) * np.array([1.0, -1.0, 1.0])
+    values[::7, 0] = np.nan
+    values[::11, 2] = 0.0
+    columns = pd.MultiIndex.from_tuples(
+        [("n", "", "a"), ("v", "x", "a"), ("w", "par", "a")], names=["M", "C", "S"]
+    )
+    return pd.DataFrame(values, columns=columns)
+
+
+def legacy_describe(frame):
+    r"""The statistics logged before streaming load statistics."""
+    pct = list(load_stats.PERCENTILES)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log = frame.map(np.log10).replace(-np.inf, np.nan)
+    return (
+        pd.concat(
+            {
+                "lin": frame.describe(percentiles=pct),
+                "log": log.describe(percentiles=pct),
+            },
+            axis=0,
+        )
+        .unstack(level=0)
+        .sort_index(axis=0)
+        .sort_index(axis=1)
+        .T
+    )
+
+
+def test_conform_mode():
+    assert load_stats.conform_mode(True) == "approximate"
+    assert load_stats.conform_mode(False) == "off"
+    assert load_stats.conform_mode("Exact") == "exact"
+    with pytest.raises(ValueError):
+        load_stats.conform_mode("median")
+
+
+def test_exact_matches_describe(frame):
+    stats = load_stats.FrameStats.from_frame(frame, mode="exact")
+    table = stats.describe()
+    legacy = legacy_describe(frame).loc[table.index, table.columns]
+    pdt.assert_frame_equal(table, legacy, check_names=False)
+
+    assert stats.rows == len(frame)
+    assert stats.rows_with_nan == frame.isna().any(axis=1).sum()
+    pdt.assert_series_equal(
+        stats.nan_info()["count"], frame.isna().sum(axis=0), check_names=False
+    )
+
+
+@pytest.mark.parametrize("max_rows", [1_000_000, 1_000])
+def test_approximate_close_to_exact(frame, max_rows):
+    exact = load_stats.FrameStats.from_frame(frame, mode="exact").describe()
+    approx = load_stats.FrameStats.from_frame(
+        frame, mode="approximate", max_rows=max_rows
+    ).describe()
+
+    # Moments are always exact.
+    moments = ["count", "mean", "std", "min", "max"]
+    pdt.assert_frame_equal(approx.loc[:, moments], exact.loc[:, moments])
+
+    if max_rows < len(frame):
+        # Subsampling adds sampling noise, mostly in the tails.
+        pct, rtol = ["10%", "25%", "50%", "75%", "90%"], 0.1
+    else:
+        pct, rtol = ["1%", "10%", "25%", "50%", "75%", "90%", "99%"], 0.02
+    np.testing.assert_allclose(
+        approx.xs("lin", level=-1).loc[:, pct],
+        exact.xs("lin", level=-1).loc[:, pct],
+        rtol=rtol,
+    )
+
+
+@pytest.mark.parametrize("mode", ["exact", "approximate"])
+def test_merge_chunks(frame, mode):
+    whole = load_stats.FrameStats.from_frame(frame, mode=mode)
+    merged = load_stats.FrameStats.from_frame(frame.iloc[:1234], mode=mode)
+    for start in range(1234, len(frame), 1000):
+        chunk = frame.iloc[start : start + 1000]
+        merged.merge(load_stats.FrameStats.from_frame(chunk, mode=mode))
+
+    pdt.assert_frame_equal(merged.describe(), whole.describe(), rtol=1e-10)
+    assert merged.rows == whole.rows
+
+
+def test_merge_mismatch(frame):
+    exact = load_stats.FrameStats.from_frame(frame, mode="exact")
+    approx = load_stats.FrameStats.from_frame(frame, mode="approximate")
+    with pytest.raises(ValueError):
+        exact.merge(approx)
+    with pytest.raises(ValueError):
+        exact.merge(load_stats.FrameStats.from_frame(frame.iloc[:, :2], "exact"))
+
+
+def test_sketch_relative_accuracy():
+    rng = np.random.default_rng(0)
+    x = rng.lognormal(sigma=3.0, size=20_000)
+    sketch = load_stats.QuantileSketch(alpha=0.01)
+    sketch.add(x)
+    assert sketch.count == x.size
+
+    q = np.linspace(0.0, 1.0, 11)
+    np.testing.assert_allclose(
+        sketch.quantile(q), np.quantile(x, q, method="lower"), rtol=0.01
+    )
+
+
+@pytest.mark.parametrize("mode", ["exact", "approximate", True])
+def test_plasma_load_stats(mode, caplog):
+    data = test_base.TestData().plasma_data
+    with caplog.at_level(logging.DEBUG):
+        plas = plasma.Plasma(data, "a", "p1", log_plasma_stats=mode)
+
+    assert plas.log_plasma_at_init
+    assert plas.plasma_stats_mode == load_stats.conform_mode(mode)
+    stats = plas.load_stats["plasma"]
+    assert stats.rows == len(data)
+    assert "plasma stats" in caplog.text
+
+
+def test_plasma_load_stats_off():
+    data = test_base.TestData().plasma_data
+    plas = plasma.Plasma(data, "a", "p1")
+    assert not plas.log_plasma_at_init
+    assert plas.plasma_stats_mode == "off"
+    assert plas.load_stats == {}
+
+
+def test_append_merges_stats():
+    data = test_base.TestData().plasma_data
+    epoch = pd.date_range("2020-01-01", periods=30, freq="h", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    data = data.iloc[rows].set_axis(epoch, axis=0)
+
+    plas = plasma.Plasma(data.iloc[:10], "a", "p1", log_plasma_stats="exact")
+    plas.append(data.iloc[10:], retain=5)
+
+    whole = plasma.Plasma(data, "a", "p1", log_plasma_stats="exact")
+    pdt.assert_frame_equal(
+        plas.load_stats["plasma"].describe(),
+        whole.load_stats["plasma"].describe(),
+        rtol=1e-10,
+    )
+
+
+def test_iter_chunks_merges_stats(tmp_path, caplog):
+    data = test_base.TestData().plasma_data
+    epoch = pd.date_range("2020-01-01", periods=10, freq="min", name="epoch")
+    data = data.iloc[np.arange(len(epoch)) % data.shape[0]].set_axis(epoch, axis=0)
+    whole = plasma.Plasma(data, "a", "p1", log_plasma_stats="exact")
+
+    fname = tmp_path / "plasma.h5"
+    whole.save(fname, format="table")
+    with caplog.at_level(logging.DEBUG):
+        chunks = list(
+            plasma.Plasma.iter_chunks(
+                fname,
+                chunksize=3,
+                sckey=None,
+                akey=None,
+                log_plasma_stats="exact",
+            )
+        )
+
+    assert len(chunks) == 4
+    assert "plasma (all chunks) stats" in caplog.text
+
+    merged = chunks[0].load_stats["plasma"].copy()
+    for chunk in chunks[1:]:
+        merged.merge(chunk.load_stats["plasma"])
+    pdt.assert_frame_equal(
+        merged.describe(), whole.load_stats["plasma"].describe(), rtol=1e-10
+    )
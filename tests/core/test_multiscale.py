@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Tests for :py:mod:`solarwindpy.core.multiscale`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import alfvenic_turbulence
+from solarwindpy.core import multiscale
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(5)
+    # Irregular cadence with a gap.
+    seconds = np.cumsum(rng.integers(1, 90, size=400))
+    seconds[200:] += 7200
+    epoch = pd.DatetimeIndex(pd.Timestamp("2010-01-01") + pd.to_timedelta(seconds, "s"))
+    columns = pd.Index(["x", "y", "z"], name="C")
+    v = pd.DataFrame(
+        400.0 + 30.0 * rng.normal(size=(len(epoch), 3)), index=epoch, columns=columns
+    )
+    b = pd.DataFrame(
+        5.0 * rng.normal(size=(len(epoch), 3)), index=epoch, columns=columns
+    )
+    v.iloc[10:14, 1] = np.nan
+    b.iloc[50, :] = np.nan
+    rho = pd.Series(rng.uniform(2, 8, size=len(epoch)), index=epoch)
+    return v, b, rho
+
+
+@pytest.mark.parametrize("window", [12, "5min", "1h"])
+def test_means(inputs, window):
+    v, b, rho = inputs
+    prefix = multiscale.PrefixSums(v.to_numpy())
+    starts = multiscale.window_starts(v.index, window)
+    expected = v.rolling(window, min_periods=3).mean()
+    np.testing.assert_allclose(prefix.means(starts, 3), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_scales(inputs, n_jobs):
+    v, b, rho = inputs
+    windows = ["5min", "15min", "1h", 20]
+    at = alfvenic_turbulence.AlfvenicTurbulence(v, b, rho, "p", min_periods=3)
+    panel = at.scales(windows, n_jobs=n_jobs)
+
+    assert panel.columns.names == ["window", "M"]
+    assert panel.columns.get_level_values("window").unique().tolist() == windows
+    for window in windows:
+        chk = alfvenic_turbulence.AlfvenicTurbulence(
+            v, b, rho, "p", window=window, min_periods=3
+        )
+        for m in multiscale.QUANTITIES:
+            pdt.assert_series_equal(
+                panel.loc[:, (window, m)], getattr(chk, m), check_names=False
+            )
+
+
+def test_polarity(inputs):
+    v, b, rho = inputs
+    polarity = np.where(np.arange(len(v)) % 3, 1.0, -1.0)
+    args = (v.to_numpy(), b.to_numpy(), v.index, ["15min"])
+    rectified = multiscale.alfvenic_scales(*args, polarity=polarity)["15min"]
+    panel = multiscale.alfvenic_scales(*args)["15min"]
+
+    # Flipping b exchanges z+ and z-.
+    pdt.assert_series_equal(rectified.sigma_c, polarity * panel.sigma_c)
+    flipped = polarity < 0
+    pdt.assert_series_equal(rectified.rE[flipped], 1.0 / panel.rE[flipped])
+    pdt.assert_series_equal(rectified.rE[~flipped], panel.rE[~flipped])
+    pdt.assert_frame_equal(
+        rectified.loc[:, ["sigma_r", "rA"]], panel.loc[:, ["sigma_r", "rA"]]
+    )
+
+
+def test_errors(inputs):
+    v, b, rho = inputs
+    with pytest.raises(ValueError):
+        multiscale.window_starts(v.index, 0)
+    with pytest.raises(ValueError):
+        multiscale.window_starts(v.index[::-1], "1h")
+    with pytest.raises(ValueError):
+        multiscale.alfvenic_scales(v, b, v.index, [])
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""Tests for :py:mod:`solarwindpy.core.parallel`."""
+
+import os
+
+import pytest
+
+from solarwindpy.core import parallel
+
+
+def test_n_workers():
+    assert parallel.n_workers(None) == 1
+    assert parallel.n_workers(0) == 1
+    assert parallel.n_workers(3) == 3
+    assert parallel.n_workers(-1) == (os.cpu_count() or 1)
+    assert parallel.n_workers(-10_000) == 1
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, -1])
+def test_map_threads(n_jobs):
+    items = range(20)
+    assert parallel.map_threads(lambda x: x**2, items, n_jobs) == [
+        x**2 for x in items
+    ]
+    assert parallel.map_threads(abs, [], n_jobs) == []
+
+
+def test_map_processes():
+    assert parallel.map_processes(abs, [-1, 2, -3], n_jobs=2) == [1, 2, 3]
+
+
+def test_map_raises():
+    def fail(x):
+        raise KeyError(x)
+
+    with pytest.raises(KeyError):
+        parallel.map_threads(fail, [1, 2], n_jobs=2)
@@ -2206,6 +2206,38 @@ class PlasmaTestBase(ABC):
             msg = "Unexpected number of species in test case\nslist: %s"
             raise NotImplementedError(msg % (slist))
 
+    def test_build_alfvenic_turbulences(self):
+        species = self.species
+        slist = species.split("+")
+        kwargs = dict(window="365d", min_periods=1)
+        ot = self.object_testing
+
+        requests = [species, *slist]
+        if len(slist) > 1:
+            requests += [",".join([s, species]) for s in slist]
+            requests.append(",".join(slist[:2]))
+        requests = list(dict.fromkeys(requests))
+
+        built = ot.build_alfvenic_turbulences(*requests, **kwargs)
+        self.assertEqual(list(built), requests)
+        for s in requests:
+            self.assertEqual(built[s], ot.build_alfvenic_turbulence(s, **kwargs))
+
+        panel = ot.build_alfvenic_turbulences(*requests, panel=True, **kwargs)
+        self.assertEqual(panel.columns.names, ["S", "M"])
+        for s in requests:
+            for m in ("sigma_c", "sigma_r", "rE", "rA"):
+                pdt.assert_series_equal(
+                    panel.loc[:, (s, m)], getattr(built[s], m), check_names=False
+                )
+
+        with self.assertRaises(ValueError):
+            ot.build_alfvenic_turbulences()
+        with self.assertRaises(ValueError):
+            ot.build_alfvenic_turbulences("{0},{0},{0}".format(slist[0]))
+        with self.assertRaisesRegex(ValueError, "raffaella_version"):
+            ot.build_alfvenic_turbulences(species, raffaella_version=True, **kwargs)
+
     def test_drop_species(self):
         print_inline_debug_info = True  # noqa: F841
 
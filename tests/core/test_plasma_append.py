@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""Tests for :py:meth:`solarwindpy.core.plasma.Plasma.append`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+from solarwindpy.core import frame_buffer
+
+from . import test_base
+
+
+@pytest.fixture
+def frames():
+    r"""50 rows of plasma, spacecraft, and auxiliary data."""
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    epoch = pd.date_range("2020-01-01", periods=50, freq="h", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    scale = 1.0 + np.arange(len(epoch)) / 50.0
+
+    data = data.iloc[rows].set_axis(epoch, axis=0).multiply(scale, axis=0)
+
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = sc.iloc[rows].set_axis(epoch, axis=0)
+
+    aux = pd.DataFrame(
+        {
+            ("flag", "", ""): np.arange(len(epoch)),
+            ("q", "", "p1"): scale,
+        },
+        index=epoch,
+    )
+    aux.columns.names = ["M", "C", "S"]
+    return data, sc, aux
+
+
+def _build(data, sc, aux, storage="pandas"):
+    return plasma.Plasma(
+        data,
+        "a",
+        "p1",
+        spacecraft=spacecraft.Spacecraft(sc, "Wind", "GSE"),
+        auxiliary_data=aux,
+        storage=storage,
+    )
+
+
+@pytest.mark.parametrize("storage", ["pandas", "columnar"])
+@pytest.mark.parametrize("step", [1, 7])
+def test_append_matches_rebuild(frames, storage, step):
+    data, sc, aux = frames
+    full = _build(data, sc, aux, storage=storage)
+    plas = _build(data.iloc[:5], sc.iloc[:5], aux.iloc[:5], storage=storage)
+    plas.enable_cache()
+
+    for i in range(5, len(data), step):
+        rows = slice(i, i + step)
+        plas.append(
+            data.iloc[rows], spacecraft=sc.iloc[rows], auxiliary_data=aux.iloc[rows]
+        )
+        # Derived quantities see the appended rows.
+        assert len(plas.beta("p1")) == min(i + step, len(data))
+
+    pdt.assert_frame_equal(plas.data, full.data, check_freq=False)
+    pdt.assert_frame_equal(plas.sc.data, full.sc.data, check_freq=False)
+    pdt.assert_frame_equal(plas.aux, full.aux, check_freq=False)
+    pdt.assert_frame_equal(plas.b.data, full.b.data, check_freq=False)
+    pdt.assert_frame_equal(plas.beta("a", "p1"), full.beta("a", "p1"), check_freq=False)
+    pdt.assert_series_equal(plas.nc("a", "p1"), full.nc("a", "p1"), check_freq=False)
+    pdt.assert_series_equal(plas.p1.n, full.p1.n, check_freq=False)
+
+
+def test_retention(frames):
+    data, sc, aux = frames
+    plas = _build(data.iloc[:10], sc.iloc[:10], aux.iloc[:10])
+
+    plas.append(
+        data.iloc[10:20],
+        spacecraft=sc.iloc[10:20],
+        auxiliary_data=aux.iloc[10:20],
+        retain=8,
+    )
+    pdt.assert_index_equal(plas.data.index, data.index[12:20])
+    pdt.assert_index_equal(plas.sc.data.index, data.index[12:20])
+    pdt.assert_index_equal(plas.aux.index, data.index[12:20])
+
+    plas.append(
+        data.iloc[20:30],
+        spacecraft=sc.iloc[20:30],
+        auxiliary_data=aux.iloc[20:30],
+        retain="5h",
+    )
+    pdt.assert_index_equal(plas.data.index, data.index[25:30])
+    pdt.assert_frame_equal(
+        plas.data,
+        plasma.Plasma(data.iloc[25:30], "a", "p1").data,
+        check_freq=False,
+    )
+
+
+def test_append_invalid(frames):
+    data, sc, aux = frames
+    plas = _build(data.iloc[:10], sc.iloc[:10], aux.iloc[:10])
+    kwargs = {"spacecraft": sc.iloc[10:12], "auxiliary_data": aux.iloc[10:12]}
+
+    with pytest.raises(ValueError, match="start after"):
+        plas.append(
+            data.iloc[5:12], spacecraft=sc.iloc[5:12], auxiliary_data=aux.iloc[5:12]
+        )
+    with pytest.raises(ValueError, match="Spacecraft data must be appended"):
+        plas.append(data.iloc[10:12], auxiliary_data=aux.iloc[10:12])
+    with pytest.raises(ValueError, match="Auxiliary data must be appended"):
+        plas.append(data.iloc[10:12], spacecraft=sc.iloc[10:12])
+    with pytest.raises(ValueError, match="doesn't match plasma columns"):
+        plas.append(data.drop("a", axis=1, level="S").iloc[10:12], **kwargs)
+    with pytest.raises(ValueError, match="empty"):
+        plas.append(data.iloc[:0], **kwargs)
+
+    # Failed appends leave the plasma unchanged.
+    pdt.assert_index_equal(plas.data.index, data.index[:10])
+    plas.append(data.iloc[10:12], **kwargs)
+    pdt.assert_index_equal(plas.data.index, data.index[:12])
+
+
+def test_frame_buffer_growth(frames):
+    data = frames[0]
+    buf = frame_buffer.FrameBuffer(data.iloc[:1])
+    assert buf.capacity == 16
+
+    old = buf.frame()
+    for i in range(1, len(data)):
+        buf.append(data.iloc[i : i + 1])
+    assert buf.capacity < 4 * len(data)
+    pdt.assert_frame_equal(buf.frame(), data, check_freq=False)
+
+    # Frames returned before an append are unaffected by it.
+    pdt.assert_frame_equal(old, data.iloc[:1], check_freq=False)
+
+    buf.drop_before(data.index[40])
+    pdt.assert_frame_equal(buf.frame(), data.iloc[40:], check_freq=False)
+    buf.keep_last(3)
+    pdt.assert_frame_equal(buf.frame(), data.iloc[-3:], check_freq=False)
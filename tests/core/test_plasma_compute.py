@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Tests for :py:meth:`solarwindpy.core.plasma.Plasma.compute`."""
+import functools
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+from solarwindpy.core import quantity_cache
+
+from . import test_base
+
+
+@pytest.fixture
+def plas():
+    test_data = test_base.TestData()
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = spacecraft.Spacecraft(sc, "Wind", "GSE")
+    return plasma.Plasma(test_data.plasma_data, "a", "p1", spacecraft=sc)
+
+
+def test_matches_individual_calls(plas):
+    out = plas.compute(
+        {
+            "beta": ("p1", "a"),
+            "nc": [("p1", "a")],
+            "Wk": ("a+p1",),
+            "ca": ["a", "a+p1"],
+            "dv": ("a", "p1", {"project_m2q": False}),
+            "S": "a+p1",
+        }
+    )
+    assert out.columns.names == ["M", "C", "S"]
+    pdt.assert_index_equal(out.index, plas.data.index)
+
+    beta = plas.beta("p1", "a")
+    for (c, s), col in beta.items():
+        pdt.assert_series_equal(out.loc[:, ("beta", c, s)], col, check_names=False)
+
+    checks = {
+        ("nc", "", "p1,a"): plas.nc("p1", "a"),
+        ("Wk", "", "a+p1"): plas.Wk("a+p1"),
+        ("ca", "", "a"): plas.ca("a"),
+        ("ca", "", "a+p1"): plas.ca("a+p1"),
+        ("S", "", "a+p1"): plas.S("a+p1"),
+    }
+    for key, expected in checks.items():
+        pdt.assert_series_equal(out.loc[:, key], expected, check_names=False)
+
+    dv = plas.dv("a", "p1").data
+    for c in ("x", "y", "z"):
+        pdt.assert_series_equal(
+            out.loc[:, ("dv", c, "a,p1")], dv.loc[:, c], check_names=False
+        )
+
+
+def test_intermediates_computed_once(plas, monkeypatch):
+    calls = []
+    pth = plasma.Plasma.pth.__wrapped__
+
+    @functools.wraps(pth)
+    def counted(self, *species):
+        calls.append(species)
+        return pth(self, *species)
+
+    monkeypatch.setattr(plasma.Plasma, "pth", quantity_cache.cached(counted))
+    plas.compute({"beta": ["p1", "a"], "ca": "p1", "S": ["p1", "a"]})
+    assert len(calls) == len(set(calls))
+
+    # Without `compute`, the same intermediates are recalculated.
+    calls.clear()
+    plas.beta("p1")
+    plas.S("p1")
+    assert len(calls) > len(set(calls))
+
+
+def test_cache_scope(plas):
+    plas.compute({"beta": "p1"})
+    assert plas.quantity_cache is None
+
+    cache = plas.enable_cache()
+    plas.compute({"beta": "p1"})
+    assert plas.quantity_cache is cache
+    assert len(cache)
+
+
+def test_invalid_requests(plas):
+    with pytest.raises(ValueError, match="Unrecognized quantity"):
+        plas.compute({"save": "p1"})
+    with pytest.raises(TypeError):
+        plas.compute({"beta": {"p1"}})
+    with pytest.raises(TypeError):
+        plas.compute([("beta", "p1")])
+
+    # Errors don't leave the temporary cache behind.
+    with pytest.raises(ValueError):
+        plas.compute({"beta": "p3"})
+    assert plas.quantity_cache is None
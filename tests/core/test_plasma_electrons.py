@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Tests for :py:meth:`Plasma.estimate_electrons`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+
+from . import test_base
+
+
+@pytest.fixture
+def data():
+    data = test_base.TestData().plasma_data
+    data = data.drop("e", axis=1, level="S")
+    data.loc[data.index[1], ("n", "", "a")] = np.nan
+    return data
+
+
+def _rebuilt(plas, electrons):
+    r"""Plasma built from scratch with the estimated `electrons`."""
+    e = electrons.data.copy()
+    e.columns = pd.MultiIndex.from_tuples(
+        [c + ("e",) for c in e.columns], names=["M", "C", "S"]
+    )
+    data = pd.concat([plas.data, e], axis=1)
+    return plasma.Plasma(data, *plas.species, "e", storage=plas.storage_engine)
+
+
+@pytest.mark.parametrize("storage", ["pandas", "columnar"])
+def test_inplace(data, storage):
+    plas = plasma.Plasma(data, "a", "p1", "p2", storage=storage)
+    electrons = plas.estimate_electrons()
+    assert "e" not in plas.species
+
+    expected = _rebuilt(plas, electrons)
+    assert plas.estimate_electrons(inplace=True) == electrons
+    assert plas.species == ("a", "e", "p1", "p2")
+    pdt.assert_frame_equal(plas.data, expected.data)
+    pdt.assert_frame_equal(plas.ions.loc["e"].data, expected.ions.loc["e"].data)
+    if storage == "columnar":
+        np.testing.assert_array_equal(
+            plas.storage.take("w", "e"), expected.storage.take("w", "e")
+        )
+    pdt.assert_frame_equal(plas.beta("e"), expected.beta("e"))
+
+    # Quasi-neutrality ignores the times without alphas.
+    qn = plas.data.n.xs("", axis=1, level="C")
+    pdt.assert_series_equal(
+        qn.e, qn.p1 + qn.p2 + 2.0 * qn.a.fillna(0), check_names=False
+    )
+
+
+@pytest.mark.parametrize("storage", ["pandas", "columnar"])
+def test_overwrite(data, storage):
+    plas = plasma.Plasma(data, "a", "p1", storage=storage)
+    plas.estimate_electrons(inplace=True)
+    expected = plas.data.copy()
+    columns = plas.data.columns
+
+    plas.data.loc[:, ("n", "", "e")] = 0.0
+    plas.estimate_electrons(inplace=True)
+    assert plas.data.columns.equals(columns)
+    pdt.assert_frame_equal(plas.data, expected)
+    pdt.assert_series_equal(
+        plas.ions.loc["e"].n, expected.loc[:, ("n", "", "e")], check_names=False
+    )
+
+
+def test_no_ions(data):
+    data.loc[:, ("n", "", "p1")] = np.nan
+    data.loc[:, ("n", "", "a")] = np.nan
+    electrons = plasma.Plasma(data, "a", "p1").estimate_electrons()
+    assert electrons.data.isna().all().all()
@@ -1,4 +1,10 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
 from solarwindpy import plasma
+from solarwindpy import spacecraft
 from . import test_base
 
 
@@ -10,3 +16,205 @@ def test_save_and_load(tmp_path):
     loaded = plasma.Plasma.load_from_file(fname, "a", "p1", sckey=None, akey=None)
     assert loaded == plas
     assert loaded.species == plas.species
+
+
+@pytest.fixture
+def long_plasma():
+    r"""A 10 row plasma with spacecraft and auxiliary data."""
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    epoch = pd.date_range("2020-01-01", periods=10, freq="min", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+
+    data = data.iloc[rows].set_axis(epoch, axis=0)
+    data = data.multiply(1.0 + np.arange(len(epoch)) / 10.0, axis=0)
+
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = sc.iloc[rows].set_axis(epoch, axis=0)
+    sc = spacecraft.Spacecraft(sc, "Wind", "GSE")
+
+    aux = pd.DataFrame(
+        {("flag", "", ""): np.arange(len(epoch), dtype=float)}, index=epoch
+    )
+    aux.columns.names = ["M", "C", "S"]
+
+    return plasma.Plasma(data, "a", "p1", spacecraft=sc, auxiliary_data=aux)
+
+
+def test_save_table_load_range(tmp_path, long_plasma):
+    fname = tmp_path / "plasma.h5"
+    long_plasma.save(fname, format="table")
+
+    start, stop = long_plasma.epoch[2], long_plasma.epoch[6]
+    loaded = plasma.Plasma.load_from_file(
+        fname, sc_name="Wind", sc_frame="GSE", start=start, stop=stop
+    )
+    pdt.assert_frame_equal(loaded.data, long_plasma.data.loc[start:stop])
+    pdt.assert_frame_equal(loaded.sc.data, long_plasma.sc.data.loc[start:stop])
+    pdt.assert_frame_equal(loaded.aux, long_plasma.aux.loc[start:stop])
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 4, 20])
+def test_iter_chunks(tmp_path, long_plasma, chunksize):
+    fname = tmp_path / "plasma.h5"
+    long_plasma.save(fname, format="table")
+
+    chunks = list(
+        plasma.Plasma.iter_chunks(
+            fname, chunksize=chunksize, sc_name="Wind", sc_frame="GSE"
+        )
+    )
+    assert len(chunks) == int(np.ceil(10 / chunksize))
+    for chunk in chunks:
+        assert len(chunk.data) <= chunksize
+        assert chunk.species == ("a", "p1")
+        pdt.assert_index_equal(chunk.sc.data.index, chunk.data.index)
+        pdt.assert_index_equal(chunk.aux.index, chunk.data.index)
+
+    data = pd.concat([c.data for c in chunks], axis=0)
+    pdt.assert_frame_equal(data, long_plasma.data)
+
+    beta = pd.concat([c.beta("a", "p1") for c in chunks], axis=0)
+    pdt.assert_frame_equal(beta, long_plasma.beta("a", "p1"))
+
+    sc = pd.concat([c.sc.data for c in chunks], axis=0)
+    pdt.assert_frame_equal(sc, long_plasma.sc.data)
+
+
+def test_iter_chunks_time_range(tmp_path, long_plasma):
+    fname = tmp_path / "plasma.h5"
+    long_plasma.save(fname, format="table")
+
+    start, stop = long_plasma.epoch[3], long_plasma.epoch[8]
+    chunks = plasma.Plasma.iter_chunks(
+        fname, "p1", chunksize=4, sckey=None, akey=None, start=start, stop=stop
+    )
+    data = pd.concat([c.data for c in chunks], axis=0)
+    expected = plasma.Plasma(long_plasma.data.loc[start:stop], "p1").data
+    pdt.assert_frame_equal(data, expected)
+
+
+def test_iter_chunks_requires_table(tmp_path, long_plasma):
+    fname = tmp_path / "plasma.h5"
+    long_plasma.save(fname)
+
+    with pytest.raises(ValueError, match="table-format"):
+        next(plasma.Plasma.iter_chunks(fname, sckey=None, akey=None))
+
+    with pytest.raises(ValueError, match="Must specify spacecraft"):
+        next(plasma.Plasma.iter_chunks(fname))
+
+
+@pytest.mark.parametrize("partition", ["Y", "M", "D", None])
+def test_parquet_round_trip(tmp_path, long_plasma, partition):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "plasma"
+    long_plasma.save_parquet(path, partition=partition)
+
+    loaded = plasma.Plasma.load_parquet(path)
+    assert loaded.species == long_plasma.species
+    pdt.assert_frame_equal(loaded.data, long_plasma.data, check_freq=False)
+    pdt.assert_frame_equal(loaded.sc.data, long_plasma.sc.data, check_freq=False)
+    pdt.assert_frame_equal(loaded.aux, long_plasma.aux, check_freq=False)
+    assert loaded.sc.name == long_plasma.sc.name
+    assert loaded.sc.frame == long_plasma.sc.frame
+
+
+def test_parquet_partitions_and_range(tmp_path, long_plasma):
+    pytest.importorskip("pyarrow")
+    epoch = pd.date_range("2020-01-30", periods=10, freq="D", name="epoch")
+    data = long_plasma.data.set_axis(epoch, axis=0)
+    plas = plasma.Plasma(data, "a", "p1")
+
+    path = tmp_path / "plasma"
+    plas.save_parquet(path, partition="M")
+    periods = sorted(p.name for p in (path / "data").iterdir())
+    assert periods == ["period=2020-01", "period=2020-02"]
+    assert not (path / "spacecraft").exists()
+
+    start, stop = epoch[3], epoch[6]
+    loaded = plasma.Plasma.load_parquet(path, "p1", start=start, stop=stop)
+    expected = plasma.Plasma(data.loc[start:stop], "p1").data
+    pdt.assert_frame_equal(loaded.data, expected, check_freq=False)
+
+
+def test_parquet_column_pruning(tmp_path, long_plasma):
+    pytest.importorskip("pyarrow")
+    from solarwindpy.core import parquet_io
+
+    path = tmp_path / "plasma"
+    long_plasma.save_parquet(path)
+
+    n = parquet_io.read_frame(path / "data", species=["p1"], measurements=["n"])
+    pdt.assert_frame_equal(
+        n,
+        long_plasma.data.loc[:, [("n", "", "p1")]],
+        check_column_type=False,
+        check_freq=False,
+    )
+
+    loaded = plasma.Plasma.load_parquet(path, "a", auxiliary_data=False)
+    assert loaded.species == ("a",)
+    assert loaded.aux is None
+    pdt.assert_frame_equal(
+        loaded.data, plasma.Plasma(long_plasma.data, "a").data, check_freq=False
+    )
+
+
+def _save_daily(tmp_path, plas, splits):
+    r"""Save consecutive row ranges of `plas` to separate files."""
+    fnames = []
+    for i, (start, stop) in enumerate(zip(splits[:-1], splits[1:])):
+        fname = tmp_path / f"day{i}.h5"
+        rows = slice(start, stop)
+        plas.data.iloc[rows].to_hdf(fname, key="FC")
+        plas.sc.data.iloc[rows].to_hdf(fname, key="SC")
+        plas.aux.iloc[rows].to_hdf(fname, key="FC_AUX")
+        fnames.append(fname)
+    return fnames
+
+
+@pytest.mark.parametrize(
+    "n_jobs,backend", [(1, "processes"), (2, "threads"), (2, "processes")]
+)
+def test_load_many(tmp_path, long_plasma, n_jobs, backend):
+    fnames = _save_daily(tmp_path, long_plasma, [0, 3, 4, 8, 10])
+
+    # Files needn't be passed in time order.
+    loaded = plasma.Plasma.load_many(
+        fnames[::-1],
+        "a",
+        "p1",
+        n_jobs=n_jobs,
+        backend=backend,
+        sc_name="Wind",
+        sc_frame="GSE",
+    )
+    assert loaded.species == ("a", "p1")
+    pdt.assert_frame_equal(loaded.data, long_plasma.data, check_freq=False)
+    pdt.assert_frame_equal(loaded.sc.data, long_plasma.sc.data, check_freq=False)
+    pdt.assert_frame_equal(loaded.aux, long_plasma.aux, check_freq=False)
+
+    timing = loaded.load_timing
+    assert timing.index.tolist() == [str(f) for f in fnames[::-1]]
+    assert timing.rows.tolist() == [2, 4, 1, 3]
+    assert (timing.seconds > 0).all()
+    assert long_plasma.load_timing is None
+
+
+def test_load_many_range(tmp_path, long_plasma):
+    fnames = _save_daily(tmp_path, long_plasma, [0, 5, 10])
+    start, stop = long_plasma.epoch[2], long_plasma.epoch[4]
+    loaded = plasma.Plasma.load_many(
+        fnames, sckey=None, akey=None, start=start, stop=stop
+    )
+    pdt.assert_frame_equal(
+        loaded.data, long_plasma.data.loc[start:stop], check_freq=False
+    )
+    assert loaded.load_timing.rows.tolist() == [3, 0]
+
+    with pytest.raises(ValueError, match="Must specify spacecraft"):
+        plasma.Plasma.load_many(fnames)
+    with pytest.raises(ValueError, match="No files"):
+        plasma.Plasma.load_many([], sckey=None, akey=None)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Tests for :py:meth:`solarwindpy.core.plasma.Plasma.resample`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+from solarwindpy.core import resampling
+
+from . import test_base
+
+
+@pytest.fixture
+def plas():
+    r"""200 rows at 17 minute cadence with spacecraft, aux data, and a NaN."""
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    epoch = pd.date_range("2020-01-01 00:30", periods=200, freq="17min", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    scale = np.random.default_rng(7).uniform(0.5, 1.5, size=(len(epoch), 1))
+
+    data = data.iloc[rows].set_axis(epoch, axis=0) * scale
+    data.loc[epoch[3], ("v", "x", "p1")] = np.nan
+
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = sc.iloc[rows].set_axis(epoch, axis=0)
+    sc = spacecraft.Spacecraft(sc, "Wind", "GSE")
+
+    aux = pd.DataFrame(
+        {
+            ("flag", "", ""): np.arange(len(epoch)) % 4,
+            ("q", "", "p1"): scale[:, 0],
+        },
+        index=epoch,
+    )
+    aux.columns.names = ["M", "C", "S"]
+    return plasma.Plasma(data, "a", "p1", spacecraft=sc, auxiliary_data=aux)
+
+
+def grouped(frame, rule):
+    return frame.groupby(frame.index.floor(rule))
+
+
+def test_bins_match_pandas(plas):
+    for rule in ("1h", "1D", "MS"):
+        bins = resampling.bins(plas.data.index, rule)
+        labels = plas.data.n.resample(rule).count().index
+        pdt.assert_index_equal(bins.labels, labels, check_exact=True)
+
+    with pytest.raises(ValueError):
+        resampling.bins(plas.data.index[::-1], "1h")
+
+
+def test_physical(plas):
+    out = plas.resample("1h")
+    data = plas.data
+    assert out.species == plas.species
+    assert out.data.index.equals(resampling.bins(data.index, "1h").labels)
+
+    pdt.assert_frame_equal(out.data.n, grouped(data.n, "h").mean(), check_names=False)
+
+    for s in plas.species:
+        n = data.loc[:, ("n", "", s)]
+        v = data.xs(s, axis=1, level="S").v
+        valid = v.notna()
+        expected = (
+            grouped(v.multiply(n, axis=0), "h").sum()
+            / grouped(valid.multiply(n, axis=0), "h").sum()
+        )
+        pdt.assert_frame_equal(
+            out.data.v.xs(s, axis=1, level="S"), expected, check_names=False
+        )
+
+        w = data.xs(s, axis=1, level="S").w.loc[:, ["par", "per"]]
+        pth = grouped(w.pow(2).multiply(n, axis=0), "h").sum()
+        expected = pth.divide(grouped(n, "h").sum(), axis=0).pow(0.5)
+        pdt.assert_frame_equal(
+            out.data.w.xs(s, axis=1, level="S").loc[:, ["par", "per"]],
+            expected,
+            check_names=False,
+        )
+
+    b = data.b.xs("", axis=1, level="S")
+    bout = out.data.b.xs("", axis=1, level="S")
+    bmag = grouped(b.pow(2).sum(axis=1).pow(0.5), "h").mean()
+    pdt.assert_series_equal(bout.pow(2).sum(axis=1).pow(0.5), bmag, check_names=False)
+    bavg = grouped(b, "h").mean()
+    cos = (bout * bavg).sum(axis=1) / bmag / bavg.pow(2).sum(axis=1).pow(0.5)
+    np.testing.assert_allclose(cos, 1.0)
+
+
+def test_mean(plas):
+    out = plas.resample("1D", how="mean")
+    data = plas.data.drop("scalar", axis=1, level="C")
+    pdt.assert_frame_equal(
+        out.data.drop("scalar", axis=1, level="C"),
+        grouped(data, "D").mean(),
+        check_names=False,
+    )
+
+
+def test_spacecraft_and_aux(plas):
+    out = plas.resample("1h")
+    pdt.assert_frame_equal(
+        out.sc.data, grouped(plas.sc.data, "h").mean(), check_names=False
+    )
+    assert out.sc.name == plas.sc.name
+    assert out.sc.frame == plas.sc.frame
+
+    aux = grouped(plas.aux, "h")
+    assert (
+        out.aux.loc[:, ("flag", "", "")].dtype
+        == plas.aux.loc[:, ("flag", "", "")].dtype
+    )
+    pdt.assert_series_equal(
+        out.aux.loc[:, ("flag", "", "")],
+        aux.max().loc[:, ("flag", "", "")],
+        check_names=False,
+    )
+    pdt.assert_series_equal(
+        out.aux.loc[:, ("q", "", "p1")],
+        aux.mean().loc[:, ("q", "", "p1")],
+        check_names=False,
+    )
+
+
+def test_bad_how(plas):
+    with pytest.raises(ValueError):
+        plas.resample("1h", how="median")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Tests for the vectorized :py:meth:`Plasma.set_data` construction path."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+
+from . import test_base
+
+
+@pytest.fixture
+def data():
+    return test_base.TestData().plasma_data
+
+
+def _expected(data, *species):
+    r"""Conform `data` with label-based pandas operations."""
+    keep = (
+        data.columns.get_level_values("M").isin(["b", "n", "v", "w"])
+        & data.columns.get_level_values("C").isin(["", "x", "y", "z", "per", "par"])
+        & data.columns.get_level_values("S").isin(list(species) + [""])
+    )
+    data = data.loc[:, keep]
+    w = data.xs("w", axis=1, level="M")
+    scalar = {
+        ("w", "scalar", s): np.sqrt(
+            (w.loc[:, ("par", s)] ** 2 / 3.0).fillna(0)
+            + (2.0 * w.loc[:, ("per", s)] ** 2 / 3.0).fillna(0)
+        )
+        for s in species
+    }
+    data = pd.concat([data, pd.DataFrame(scalar)], axis=1)
+    data.columns.names = ["M", "C", "S"]
+    return data.sort_index(axis=1)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_unsorted_columns(data, seed):
+    rng = np.random.default_rng(seed)
+    data = data.iloc[:, rng.permutation(data.shape[1])].copy()
+    data.iloc[0, 0] = np.nan
+    data.loc[:, ("w", "par", "p1")] = [np.nan, 10.0, np.nan]
+
+    plas = plasma.Plasma(data, "a", "p1")
+    pdt.assert_frame_equal(plas.data, _expected(data, "a", "p1"))
+    assert plas.data.columns.is_monotonic_increasing
+
+    for block in plas.data._mgr.blocks:
+        assert block.values.flags.c_contiguous
+
+
+def test_extra_and_duplicate_columns(data):
+    extra = data.xs("n", axis=1, level="M", drop_level=False).rename(
+        columns={"n": "chisq"}, level="M"
+    )
+    dup = data.loc[:, [("v", "x", "a")]].multiply(0.0)
+    new = pd.concat([data, extra, dup], axis=1)
+
+    plas = plasma.Plasma(new, "a", "p1", "p2")
+    assert "chisq" not in plas.data.columns.get_level_values("M")
+    assert not plas.data.columns.duplicated().any()
+    pdt.assert_series_equal(
+        plas.data.loc[:, ("v", "x", "a")], data.loc[:, ("v", "x", "a")]
+    )
+
+
+def test_reordered_levels(data):
+    swapped = data.reorder_levels(["S", "M", "C"], axis=1)
+    pdt.assert_frame_equal(
+        plasma.Plasma(swapped, "a", "p1").data, plasma.Plasma(data, "a", "p1").data
+    )
+
+
+def test_missing_species(data):
+    with pytest.raises(KeyError):
+        plasma.Plasma(data.drop("a", axis=1, level="S"), "a", "p1")
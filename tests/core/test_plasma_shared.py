@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Tests for :mod:`solarwindpy.core.shared`."""
+
+import mmap
+import pickle
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+
+from . import test_base
+
+
+@pytest.fixture
+def plas():
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = spacecraft.Spacecraft(sc, "Wind", "GSE")
+
+    aux = pd.DataFrame(
+        {
+            ("flag", "", ""): np.arange(data.shape[0]),
+            ("q", "", "p1"): np.linspace(0, 1, data.shape[0]),
+            ("valid", "", ""): np.ones(data.shape[0], dtype=bool),
+        },
+        index=data.index,
+    )
+    aux.columns.names = ["M", "C", "S"]
+    return plasma.Plasma(data, "a", "p1", spacecraft=sc, auxiliary_data=aux)
+
+
+def _is_mapped(arr):
+    while arr is not None:
+        if isinstance(arr, (np.memmap, mmap.mmap)):
+            return True
+        arr = getattr(arr, "base", None)
+    return False
+
+
+@pytest.mark.parametrize("mmap_mode", ["c", "r"])
+def test_round_trip(tmp_path, plas, mmap_mode):
+    handle = plas.to_shared(tmp_path / "shared")
+    handle = pickle.loads(pickle.dumps(handle))
+
+    new = plasma.Plasma.from_shared(handle, mmap_mode=mmap_mode)
+    assert new.species == plas.species
+    pdt.assert_frame_equal(new.data, plas.data)
+    pdt.assert_frame_equal(new.sc.data, plas.sc.data)
+    pdt.assert_frame_equal(new.aux, plas.aux)
+    assert new.sc.name == plas.sc.name
+    assert new.sc.frame == plas.sc.frame
+
+    pdt.assert_frame_equal(new.beta("a", "p1"), plas.beta("a", "p1"))
+    pdt.assert_series_equal(new.nc("a", "p1"), plas.nc("a", "p1"))
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us"])
+def test_round_trip_index_unit(tmp_path, unit):
+    data = test_base.TestData().plasma_data
+    data.index = data.index.as_unit(unit)
+    plas = plasma.Plasma(data, "a", "p1")
+
+    new = plasma.Plasma.from_shared(plas.to_shared(tmp_path / "shared"))
+    assert new.data.index.unit == unit
+    pdt.assert_frame_equal(new.data, plas.data)
+
+
+def test_attach_is_zero_copy(tmp_path, plas):
+    handle = plas.to_shared(tmp_path / "shared")
+    new = plasma.Plasma.from_shared(handle, mmap_mode="r")
+
+    for frame in (new.data, new.sc.data, new.aux):
+        for block in frame._mgr.blocks:
+            assert _is_mapped(block.values)
+
+    assert not new.data.values.flags.writeable
+
+
+def test_copy_on_write(tmp_path, plas):
+    handle = plas.to_shared(tmp_path / "shared")
+    p0 = plasma.Plasma.from_shared(handle)
+    p0.data.iloc[0, 0] = -1.0
+
+    p1 = plasma.Plasma.from_shared(handle)
+    assert p1.data.iloc[0, 0] == plas.data.iloc[0, 0]
+
+
+def test_storage_engine(tmp_path, plas):
+    handle = plas.to_shared(tmp_path / "shared")
+    new = plasma.Plasma.from_shared(handle, storage="columnar")
+    assert new.storage is not None
+    pdt.assert_frame_equal(new.beta("a", "p1"), plas.beta("a", "p1"))
+
+
+def test_release_and_default_path(plas):
+    handle = plas.to_shared()
+    assert plasma.Plasma.from_shared(handle.path) == plas
+    handle.release()
+    with pytest.raises(FileNotFoundError):
+        plasma.Plasma.from_shared(handle)
+
+
+def test_non_empty_path(tmp_path, plas):
+    plas.to_shared(tmp_path)
+    with pytest.raises(FileExistsError):
+        plas.to_shared(tmp_path)
+
+    with pytest.raises(ValueError, match="mmap_mode"):
+        plasma.Plasma.from_shared(tmp_path, mmap_mode="w+")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""Tests for :py:meth:`Plasma.slice` and ``Plasma.loc``."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+
+from . import test_base
+
+
+@pytest.fixture(params=["pandas", "columnar"])
+def plas(request):
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    epoch = pd.date_range("2020-01-01", periods=30, freq="1min", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    data = data.iloc[rows].set_axis(epoch, axis=0)
+
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = spacecraft.Spacecraft(sc.iloc[rows].set_axis(epoch, axis=0), "Wind", "GSE")
+
+    aux = pd.DataFrame(
+        {("counts", "", ""): np.arange(len(epoch), dtype=float)}, index=epoch
+    )
+    aux.columns.names = ["M", "C", "S"]
+    return plasma.Plasma(
+        data,
+        "a",
+        "p1",
+        spacecraft=sc,
+        auxiliary_data=aux,
+        storage=request.param,
+    )
+
+
+def test_slice(plas):
+    start, stop = "2020-01-01 00:05", "2020-01-01 00:12:30"
+    new = plas.slice(start, stop)
+    pdt.assert_frame_equal(new.data, plas.data.loc[start:stop])
+    pdt.assert_frame_equal(new.sc.data, plas.sc.data.loc[start:stop])
+    pdt.assert_frame_equal(new.aux, plas.aux.loc[start:stop])
+    pdt.assert_frame_equal(new.beta("p1"), plas.beta("p1").loc[start:stop])
+    assert new.data.shape[0] == 8
+    assert new.species == plas.species
+
+    # Views, not copies.
+    assert np.shares_memory(new.data.to_numpy(), plas.data.to_numpy())
+    assert np.shares_memory(new.sc.data.to_numpy(), plas.sc.data.to_numpy())
+    if plas.storage is not None:
+        assert np.shares_memory(new.storage.w, plas.storage.w)
+        pdt.assert_index_equal(new.storage.index, new.data.index)
+
+    pdt.assert_frame_equal(plas.loc[start:stop].data, new.data)
+    pdt.assert_frame_equal(plas.loc[:stop].data, plas.data.loc[:stop])
+    pdt.assert_frame_equal(plas.loc[start:].data, plas.data.loc[start:])
+
+
+@pytest.mark.parametrize("storage", ["pandas", "columnar"])
+def test_slice_partial_dates(storage):
+    data = test_base.TestData().plasma_data
+    epoch = pd.date_range("2020-01-30", periods=96, freq="1h", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    aux = pd.DataFrame(
+        {("counts", "", ""): np.arange(len(epoch), dtype=float)}, index=epoch
+    )
+    aux.columns.names = ["M", "C", "S"]
+    plas = plasma.Plasma(
+        data.iloc[rows].set_axis(epoch, axis=0),
+        "a",
+        "p1",
+        auxiliary_data=aux,
+        storage=storage,
+    )
+
+    # Partial dates cover the whole day or month, as with `DataFrame.loc`.
+    for start, stop, n in (
+        ("2020-01-31", "2020-01-31", 24),
+        ("2020-01-30", "2020-01-31", 48),
+        ("2020-01", "2020-01", 48),
+        ("2020-02", None, 48),
+        (None, "2020-01-30", 24),
+    ):
+        new = plas.loc[start:stop]
+        assert new.data.shape[0] == n
+        pdt.assert_frame_equal(new.data, plas.data.loc[start:stop])
+        pdt.assert_frame_equal(new.aux, plas.aux.loc[start:stop])
+
+
+def test_slice_cache(plas):
+    plas.slice("2020-01-01 00:05", None)
+    key = ("2020-01-01 00:05", None)
+    index, rows = plas._slices[key]
+    assert index is plas.data.index
+    assert rows == slice(5, 30)
+    assert plas._aligned["sc"] is plas.sc.data.index
+    assert plas._aligned["aux"] is plas.aux.index
+
+
+def test_slice_flags(plas):
+    plas.set_flags(odd=lambda aux: aux.loc[:, ("counts", "", "")] % 2 == 1)
+    plas.flags
+    new = plas.loc["2020-01-01 00:03":"2020-01-01 00:06"]
+    np.testing.assert_array_equal(new.flags.mask("odd"), [True, False, True, False])
+    pdt.assert_frame_equal(
+        new.where_flags("odd").data, plas.where_flags("odd").data.iloc[1:3]
+    )
+
+
+def test_slice_errors(plas):
+    with pytest.raises(TypeError):
+        plas.loc["2020-01-01"]
+    with pytest.raises(TypeError):
+        plas.loc[::2]
+    with pytest.raises(ValueError):
+        plas.slice("2021", "2022")
+
+    unsorted = plasma.Plasma(plas.data.iloc[::-1], *plas.species)
+    with pytest.raises(ValueError):
+        unsorted.slice("2020-01-01 00:05", "2020-01-01 00:12")
+
+
+def test_slice_estimate_electrons_copies(plas):
+    # Store electrons in the parent that differ from the estimate.
+    e = plas.estimate_electrons().data
+    plas._set_electrons(
+        2.0 * e.loc[:, ("n", "")].to_numpy(),
+        e.loc[:, "v"].to_numpy(),
+        e.loc[:, ("w", "par")].to_numpy(),
+    )
+    plas.enable_cache()
+    data = plas.data.copy()
+    beta = plas.beta("e")
+
+    start, stop = "2020-01-01 00:05", "2020-01-01 00:12:30"
+    new = plas.slice(start, stop)
+    new.estimate_electrons(inplace=True)
+
+    pdt.assert_frame_equal(plas.data, data)
+    pdt.assert_frame_equal(plas.beta("e"), beta)
+    plas.clear_cache()
+    pdt.assert_frame_equal(plas.beta("e"), beta)
+
+    assert not np.shares_memory(new.data.to_numpy(), plas.data.to_numpy())
+    pdt.assert_series_equal(
+        new.data.loc[:, ("n", "", "e")],
+        e.loc[start:stop, ("n", "")],
+        check_names=False,
+    )
+    if plas.storage is not None:
+        np.testing.assert_array_equal(
+            new.storage.take("n", "e")[:, 0], e.loc[start:stop, ("n", "")]
+        )
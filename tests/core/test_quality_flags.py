@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""Tests for quality flags and :py:meth:`Plasma.where_flags`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy import spacecraft
+from solarwindpy.core import quality_flags
+
+from . import test_base
+
+
+@pytest.fixture
+def plas():
+    test_data = test_base.TestData()
+    data = test_data.plasma_data
+    epoch = pd.date_range("2020-01-01", periods=64, freq="1min", name="epoch")
+    rows = np.arange(len(epoch)) % data.shape[0]
+    data = data.iloc[rows].set_axis(epoch, axis=0)
+
+    sc = test_data.spacecraft_data.xs("gse", axis=1, level="M")
+    sc = pd.concat({"pos": sc}, axis=1, names=["M"], sort=True)
+    sc = spacecraft.Spacecraft(sc.iloc[rows].set_axis(epoch, axis=0), "Wind", "GSE")
+
+    i = np.arange(len(epoch))
+    aux = pd.DataFrame(
+        {
+            ("fit", "", "p1"): (i % 2).astype(float),
+            ("counts", "", ""): i * 10,
+        },
+        index=epoch,
+    )
+    aux.iloc[3, 0] = np.nan
+    aux.columns.names = ["M", "C", "S"]
+    return plasma.Plasma(data, "a", "p1", spacecraft=sc, auxiliary_data=aux)
+
+
+def test_flag_index():
+    index = quality_flags.FlagIndex.from_definitions(
+        {"a": [True, False, True, False], "b": np.array([1, 1, 0, np.nan])},
+        None,
+        4,
+    )
+    assert index.names == ("a", "b")
+    np.testing.assert_array_equal(index.bits, [3, 2, 1, 0])
+    np.testing.assert_array_equal(index.mask("a"), [True, False, True, False])
+    np.testing.assert_array_equal(
+        index.mask(include="b", exclude="a"), [False, True, False, False]
+    )
+    np.testing.assert_array_equal(index.mask(), np.ones(4, dtype=bool))
+    assert index.mask("a") is index.mask(["a"])
+    assert not index.mask("a").flags.writeable
+
+    frame = index.to_frame()
+    assert frame.dtypes.eq(bool).all()
+    np.testing.assert_array_equal(frame.b, [True, True, False, False])
+
+    with pytest.raises(KeyError):
+        index.mask("c")
+    with pytest.raises(ValueError):
+        quality_flags.FlagIndex.from_definitions({"a": [True]}, None, 4)
+    with pytest.raises(ValueError):
+        quality_flags.FlagIndex(np.zeros(2), ["a", "a"])
+
+
+def test_where_flags(plas):
+    assert plas.flags is None
+    with pytest.raises(ValueError):
+        plas.where_flags(include="fit")
+
+    plas.set_flags(
+        fit=("fit", "", "p1"),
+        dense=lambda aux: aux.loc[:, ("counts", "", "")] >= 300,
+    )
+    aux = plas.aux
+    fit = aux.loc[:, ("fit", "", "p1")].fillna(0) != 0
+    dense = aux.loc[:, ("counts", "", "")] >= 300
+    expected = fit & ~dense
+
+    new = plas.where_flags(include="fit", exclude=["dense"])
+    pdt.assert_frame_equal(new.data, plas.data.loc[expected])
+    pdt.assert_frame_equal(new.aux, aux.loc[expected])
+    pdt.assert_frame_equal(new.sc.data, plas.sc.data.loc[expected])
+    pdt.assert_frame_equal(new.beta("p1"), plas.beta("p1").loc[expected])
+
+    # Flags are carried by the new plasma.
+    np.testing.assert_array_equal(new.flags.mask("fit"), np.ones(expected.sum()))
+    assert not new.flags.mask("dense").any()
+
+    # Re-evaluated when the auxiliary data change.
+    index = plas.flags
+    plas.set_auxiliary_data(aux.copy())
+    assert plas.flags is not index
+
+
+def test_flags_follow_rows(plas):
+    plas = plasma.Plasma(plas.data, "a", "p1")
+
+    def dense(aux):
+        n = plas.data.loc[:, ("n", "", "p1")]
+        return n > n.median()
+
+    plas.set_flags(dense=dense)
+    assert len(plas.flags) == 64
+
+    plas.set_data(plas.data.iloc[:10])
+    assert len(plas.flags) == 10
+    np.testing.assert_array_equal(plas.flags.mask("dense"), dense(None))
+
+    last = plas.data.iloc[-1:]
+    plas.append(last.set_axis(last.index + pd.Timedelta("1min"), axis=0))
+    assert len(plas.flags) == 11
+    np.testing.assert_array_equal(plas.flags.mask("dense"), dense(None))
+
+
+def test_too_many_flags(plas):
+    flags = {str(i): ("counts", "", "") for i in range(quality_flags.MAX_FLAGS + 1)}
+    with pytest.raises(ValueError):
+        plas.set_flags(flags)
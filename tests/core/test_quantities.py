@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 """Tests for Vector and Tensor objects."""
+
 import numpy as np
 import pytest
 import pandas as pd
@@ -268,6 +269,33 @@ class VectorTestBase(QuantityTestBase):
         with self.assertRaisesRegex(NotImplementedError, msg):
             self.object_testing.project(b.data)
 
+    def test_xyz(self):
+        ot = self.object_testing
+        np.testing.assert_array_equal(ot.xyz, self.data.loc[:, ["x", "y", "z"]])
+        self.assertFalse(ot.xyz.flags.writeable)
+        self.assertIs(ot.xyz, ot.xyz)
+
+        # Cached magnitudes are copied into each Series.
+        mag = ot.mag
+        mag.iloc[0] = -1.0
+        self.assertGreater(ot.mag.iloc[0], 0.0)
+
+        new = ot.__class__.from_array(ot.xyz, ot.data.index)
+        self.assertIsInstance(new, ot.__class__)
+        pdt.assert_series_equal(new.mag, ot.mag)
+        with self.assertRaises(ValueError):
+            ot.__class__.from_array(ot.xyz[:, :2], ot.data.index)
+
+    def test_project_misaligned(self):
+        ot = self.object_testing
+        other = vector.Vector(self.data.loc[:, ["x", "y", "z"]].iloc[::-1].iloc[1:])
+        projected = ot.project(other)
+        pdt.assert_index_equal(projected.index, ot.data.index)
+        self.assertTrue(projected.iloc[-1].isna().all())
+        pdt.assert_series_equal(
+            projected.par.iloc[:-1], ot.mag.iloc[:-1], check_names=False
+        )
+
 
 # class TestGSE(VectorTestBase, base.SWEData):
 #     @classmethod
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""Tests for :mod:`solarwindpy.core.quantity_cache`."""
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy.core import quantity_cache
+
+from . import test_base
+
+
+@pytest.fixture
+def data():
+    return test_base.TestData().plasma_data
+
+
+def test_lru_eviction():
+    value = pd.Series(np.arange(10, dtype=float))
+    cache = quantity_cache.QuantityCache(max_bytes=2 * value.nbytes)
+
+    cache.put("a", value)
+    cache.put("b", value)
+    assert cache.get("a")[0]
+
+    # "b" is least recently used.
+    cache.put("c", value)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+
+    info = cache.info
+    assert info.evictions == 1
+    assert info.entries == 2
+    assert info.nbytes == 2 * value.nbytes
+    assert info.max_bytes == 2 * value.nbytes
+
+
+def test_oversized_value_not_cached():
+    cache = quantity_cache.QuantityCache(max_bytes=8)
+    cache.put("a", pd.Series(np.arange(10, dtype=float)))
+    assert len(cache) == 0
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError, match="must be positive"):
+        quantity_cache.QuantityCache(max_bytes=0)
+
+
+def test_get_returns_copy():
+    cache = quantity_cache.QuantityCache()
+    value = pd.Series([1.0, 2.0])
+    cache.put("a", value)
+    value.iloc[0] = -1
+
+    hit, out = cache.get("a")
+    assert hit
+    assert out.iloc[0] == 1.0
+    out.iloc[1] = -1
+    assert cache.get("a")[1].iloc[1] == 2.0
+
+
+def test_plasma_cache_hits(data):
+    plas = plasma.Plasma(data, "a", "p1")
+    assert plas.quantity_cache is None
+
+    plas.enable_cache()
+    beta0 = plas.beta("a", "p1")
+    misses = plas.quantity_cache.info.misses
+    beta1 = plas.beta("a", "p1")
+    assert plas.quantity_cache.info.hits == 1
+    assert plas.quantity_cache.info.misses == misses
+    pdt.assert_frame_equal(beta0, beta1)
+
+    # Different kwargs are cached separately.
+    plas.n("a", "p1", skipna=True)
+    plas.n("a", "p1", skipna=False)
+    assert plas.quantity_cache.info.misses == misses + 2
+
+    plas.disable_cache()
+    assert plas.quantity_cache is None
+
+
+def test_cached_results_match(data):
+    ref = plasma.Plasma(data, "a", "p1")
+    test = plasma.Plasma(data, "a", "p1")
+    test.enable_cache()
+
+    for _ in range(2):
+        pdt.assert_frame_equal(ref.beta("a", "p1"), test.beta("a", "p1"))
+        pdt.assert_series_equal(ref.ca("a+p1"), test.ca("a+p1"))
+        pdt.assert_series_equal(ref.nuc("a", "p1"), test.nuc("a", "p1"))
+        pdt.assert_series_equal(
+            ref.specific_entropy("a+p1"), test.specific_entropy("a+p1")
+        )
+        pdt.assert_frame_equal(ref.velocity("a+p1").data, test.velocity("a+p1").data)
+
+
+def test_invalidation(data):
+    plas = plasma.Plasma(data, "a", "p1")
+    plas.enable_cache()
+
+    plas.beta("p1")
+    assert len(plas.quantity_cache)
+    plas.set_data(data)
+    assert not len(plas.quantity_cache)
+
+    plas.beta("p1")
+    plas.estimate_electrons(inplace=True)
+    assert not len(plas.quantity_cache)
+    assert "e" in plas.species
+
+    plas.beta("p1")
+    plas.set_spacecraft(None)
+    assert not len(plas.quantity_cache)
+
+
+def test_drop_species_fresh_cache(data):
+    plas = plasma.Plasma(data, "a", "p1")
+    plas.enable_cache(max_bytes=2**20)
+    plas.beta("p1")
+
+    new = plas.drop_species("a")
+    assert new.quantity_cache is not plas.quantity_cache
+    assert new.quantity_cache.max_bytes == 2**20
+    assert not len(new.quantity_cache)
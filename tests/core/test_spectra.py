@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""Tests for :py:mod:`solarwindpy.core.spectra`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from scipy import signal
+
+from solarwindpy import alfvenic_turbulence
+from solarwindpy.core import spectra
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(23)
+    epoch = pd.date_range("2015-03-01", periods=4096, freq="3s")
+    v = rng.normal(size=(len(epoch), 3)).cumsum(axis=0)
+    b = 0.5 * v + rng.normal(size=(len(epoch), 3))
+    return v, b, epoch
+
+
+def test_fill_gaps():
+    x = np.array(
+        [
+            [np.nan, 1.0, np.nan, 3.0, 4.0, np.nan],
+            [0.0, np.nan, np.nan, np.nan, 4.0, 5.0],
+        ]
+    )
+    filled, good = spectra.fill_gaps(x, 2)
+    np.testing.assert_array_equal(filled[0], [1.0, 1.0, 2.0, 3.0, 4.0, 4.0])
+    np.testing.assert_array_equal(filled[1], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_array_equal(good, [True, False])
+
+
+def test_welch_matches_scipy(inputs):
+    v, b, epoch = inputs
+    out = spectra.elsasser_spectra(v, b, epoch, 256, chunksize=5)
+    assert out.columns.tolist() == list(spectra.QUANTITIES)
+    assert out.attrs["segments"] == 31
+
+    fs = 1.0 / 3.0
+    f, pv = signal.welch(v, fs=fs, nperseg=256, axis=0)
+    _, pp = signal.welch(v + b, fs=fs, nperseg=256, axis=0)
+    _, pm = signal.welch(v - b, fs=fs, nperseg=256, axis=0)
+    np.testing.assert_allclose(out.index, f)
+    np.testing.assert_allclose(out.kinetic_energy, 0.5 * pv.sum(axis=1))
+    np.testing.assert_allclose(out.e_plus, 0.5 * pp.sum(axis=1))
+    np.testing.assert_allclose(out.e_minus, 0.5 * pm.sum(axis=1))
+
+    sigma_c = (pp - pm).sum(axis=1) / (pp + pm).sum(axis=1)
+    np.testing.assert_allclose(out.sigma_c, sigma_c)
+
+
+def test_gaps(inputs):
+    v, b, epoch = inputs
+    v = v.copy()
+    v[100:103] = np.nan
+    keep = np.ones(len(epoch), dtype=bool)
+    keep[2000:2010] = False
+    # Short gaps are filled, the 10 missing samples drop the segments with them.
+    out = spectra.elsasser_spectra(
+        v[keep], b[keep], epoch[keep], 256, max_gap=5, cadence="3s"
+    )
+    assert out.attrs["segments"] == 29
+    assert np.isfinite(out.iloc[1:].to_numpy()).all()
+
+    with pytest.raises(ValueError):
+        spectra.elsasser_spectra(v[:100], b[:100], epoch[:100], 256)
+
+    # Every segment has a missing sample and none are filled.
+    v[::100] = np.nan
+    with pytest.raises(ValueError):
+        spectra.elsasser_spectra(v, b, epoch, 256, max_gap=0)
+
+
+def test_alfvenic(inputs):
+    v, _, epoch = inputs
+    out = spectra.elsasser_spectra(v, v, epoch, 256)
+    np.testing.assert_allclose(out.sigma_c.iloc[1:], 1.0)
+    np.testing.assert_allclose(out.sigma_r.iloc[1:], 0.0, atol=1e-12)
+
+    out = spectra.elsasser_spectra(v, v, epoch, 256, polarity=-np.ones(len(epoch)))
+    np.testing.assert_allclose(out.sigma_c.iloc[1:], -1.0)
+
+
+def test_wavelet_white_noise():
+    rng = np.random.default_rng(3)
+    epoch = pd.date_range("2015-03-01", periods=8192, freq="1s")
+    v = rng.normal(size=(len(epoch), 3))
+    b = rng.normal(size=(len(epoch), 3))
+    f = np.geomspace(0.05, 0.25, 8)
+    out = spectra.elsasser_spectra(v, b, epoch, 1024, method="wavelet", frequencies=f)
+    assert out.attrs["segments"] == 8
+    np.testing.assert_allclose(out.index, f)
+    # Unit variance per component has one-sided density 2 dt, traced over 3.
+    np.testing.assert_allclose(out.kinetic_energy, 3.0, rtol=0.2)
+    np.testing.assert_allclose(out.magnetic_energy, 3.0, rtol=0.2)
+    assert np.abs(out.sigma_c).max() < 0.1
+
+
+def test_default_chunksize():
+    assert spectra._default_chunksize("welch", 256, 129) == 256
+    # 32 frequencies of 2**17 padded samples are 400 MB per segment.
+    assert spectra._default_chunksize("wavelet", 2**16, 32) == 1
+    n = spectra._default_chunksize("wavelet", 1024, 32)
+    assert n * 6 * 32 * 2048 * 16 <= spectra.CHUNK_BYTES
+    assert (n + 1) * 6 * 32 * 2048 * 16 > spectra.CHUNK_BYTES
+
+
+@pytest.mark.parametrize("method", ["welch", "wavelet"])
+def test_n_jobs(inputs, method):
+    v, b, epoch = inputs
+    one = spectra.elsasser_spectra(v, b, epoch, 256, method=method, chunksize=3)
+    two = spectra.elsasser_spectra(
+        v, b, epoch, 256, method=method, chunksize=3, n_jobs=2
+    )
+    pdt.assert_frame_equal(one, two)
+
+
+def test_turbulence_spectra(inputs):
+    v, b, epoch = inputs
+    columns = pd.Index(["x", "y", "z"], name="C")
+    v = pd.DataFrame(v, index=epoch, columns=columns)
+    b = pd.DataFrame(b, index=epoch, columns=columns)
+    rho = pd.Series(4.0, index=epoch)
+    at = alfvenic_turbulence.AlfvenicTurbulence(v, b, rho, "p1")
+
+    out = at.spectra(256)
+    chk = spectra.elsasser_spectra(
+        at.measurements.loc[:, "v"].to_numpy(),
+        at.measurements.loc[:, "b"].to_numpy(),
+        epoch,
+        256,
+    )
+    pdt.assert_frame_equal(out, chk)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Tests for :class:`ColumnarStorage` and the columnar :class:`Plasma` engine."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import plasma
+from solarwindpy.core import storage
+
+from . import test_base
+
+
+@pytest.fixture(scope="module")
+def data():
+    return test_base.TestData().plasma_data
+
+
+@pytest.fixture(scope="module")
+def store(data):
+    return storage.ColumnarStorage.from_frame(data, ("a", "p1", "p2"))
+
+
+def assert_equal(left, right):
+    if isinstance(left, pd.DataFrame):
+        pdt.assert_frame_equal(left, right, rtol=1e-12)
+    else:
+        pdt.assert_series_equal(left, right, rtol=1e-12)
+
+
+def test_block_shapes(store):
+    nt = len(store.index)
+    assert store.n.shape == (nt, 3)
+    assert store.v.shape == (nt, 3, 3)
+    assert store.w.shape == (nt, 3, 3)
+    assert store.b.shape == (nt, 3)
+    assert store.nbytes == sum(x.nbytes for x in (store.n, store.v, store.w, store.b))
+
+
+def test_blocks_match_frame(data, store):
+    for s in store.species:
+        i = store.slot(s)
+        np.testing.assert_array_equal(store.n[:, i], data.loc[:, ("n", "", s)])
+        for j, c in enumerate(storage.VECTOR_COMPONENTS):
+            np.testing.assert_array_equal(store.v[:, i, j], data.loc[:, ("v", c, s)])
+        for j, c in enumerate(("par", "per")):
+            np.testing.assert_array_equal(store.w[:, i, j], data.loc[:, ("w", c, s)])
+    # Scalar thermal speed isn't in the raw test data.
+    assert np.isnan(store.w[:, :, 2]).all()
+
+
+def test_slots(store):
+    assert store.slot("a") == 0
+    np.testing.assert_array_equal(store.slots("p2", "a"), [2, 0])
+    with pytest.raises(KeyError, match="not in storage"):
+        store.slot("e")
+
+
+def test_take_single_species_is_view(store):
+    n = store.take("n", "p1")
+    assert n.shape == (len(store), 1)
+    assert np.shares_memory(n, store.n)
+
+
+def test_blocks_read_only(data):
+    plas = plasma.Plasma(data, "a", "p1", storage="columnar")
+    store = plas.storage
+    for block in (store.n, store.v, store.w, store.b):
+        assert not block.flags.writeable
+
+    # Zero-copy ion frames can't write into the blocks.
+    v = plas.velocity("p1").data.copy()
+    with pytest.raises(ValueError, match="read-only"):
+        plas.p1.v.data.iloc[0, 0] = -1e6
+    with pytest.raises(ValueError, match="read-only"):
+        plas.p1.w.data.iloc[0, 0] = 1e6
+    assert_equal(plas.velocity("p1").data, v)
+    np.testing.assert_array_equal(store.v[:, 1, 0], data.loc[:, ("v", "x", "p1")])
+
+    # Overwriting a species leaves frames of the old blocks unchanged.
+    before = store.vector_frame("p1").copy()
+    frame = store.vector_frame("p1")
+    store.set_species("p1", store.n[:, 1], store.v[:, 1] + 1.0, store.w[:, 1])
+    pdt.assert_frame_equal(frame, before)
+    np.testing.assert_array_equal(store.v[:, 1], before.to_numpy() + 1.0)
+    assert not store.v.flags.writeable
+
+
+def test_shape_validation(store):
+    with pytest.raises(ValueError, match="`n` must have shape"):
+        storage.ColumnarStorage(
+            store.index, store.species, store.n[:, :2], store.v, store.w, store.b
+        )
+
+
+def test_to_frame_round_trip():
+    plas = plasma.Plasma(test_base.TestData().plasma_data, "a", "p1", "p2")
+    store = storage.ColumnarStorage.from_frame(plas.data, plas.species)
+    pdt.assert_frame_equal(store.to_frame(), plas.data)
+
+
+def test_ion_frame(data):
+    plas = plasma.Plasma(data, "a", "p1", "p2")
+    store = storage.ColumnarStorage.from_frame(plas.data, plas.species)
+    for s in plas.species:
+        pdt.assert_frame_equal(
+            store.ion_frame(s), plas.data.xs(s, axis=1, level="S"), check_names=False
+        )
+
+
+def test_plasma_storage_engine(data):
+    plas = plasma.Plasma(data, "a", "p1")
+    assert plas.storage_engine == "pandas"
+    assert plas.storage is None
+
+    plas.set_storage_engine("columnar")
+    assert plas.storage_engine == "columnar"
+    assert isinstance(plas.storage, storage.ColumnarStorage)
+    assert plas.storage.species == ("a", "p1")
+
+    with pytest.raises(ValueError, match="Unrecognized storage engine"):
+        plas.set_storage_engine("arrow")
+
+
+@pytest.mark.parametrize("species", [("a",), ("p1",), ("a", "p1"), ("a", "p1", "p2")])
+def test_columnar_matches_pandas(data, species):
+    ref = plasma.Plasma(data, *species)
+    test = plasma.Plasma(data, *species, storage="columnar")
+
+    methods = (
+        "number_density",
+        "mass_density",
+        "pth",
+        "temperature",
+        "beta",
+        "ca",
+        "anisotropy",
+        "specific_entropy",
+    )
+    combos = itertools.chain(
+        *[itertools.combinations(species, n) for n in range(1, len(species) + 1)]
+    )
+    for combo in combos:
+        for args in (combo, ("+".join(combo),)):
+            for method in methods:
+                assert_equal(getattr(ref, method)(*args), getattr(test, method)(*args))
+            if "+" not in args[0]:
+                assert_equal(ref.thermal_speed(*args), test.thermal_speed(*args))
+            if len(args) == 1:
+                assert_equal(ref.velocity(*args).data, test.velocity(*args).data)
+
+    for s in species:
+        pdt.assert_frame_equal(ref.ions.loc[s].data, test.ions.loc[s].data)
+
+
+def test_drop_species_keeps_engine(data):
+    plas = plasma.Plasma(data, "a", "p1", storage="columnar")
+    new = plas.drop_species("a")
+    assert new.storage_engine == "columnar"
+    assert new.storage.species == ("p1",)
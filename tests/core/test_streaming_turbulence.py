@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Tests for :py:class:`StreamingAlfvenicTurbulence`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from solarwindpy import alfvenic_turbulence as turb
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(11)
+    seconds = np.cumsum(rng.integers(0, 60, size=500))
+    seconds[300:] += 3600
+    epoch = pd.DatetimeIndex(pd.Timestamp("2012-06-01") + pd.to_timedelta(seconds, "s"))
+    columns = pd.Index(["x", "y", "z"], name="C")
+    v = pd.DataFrame(
+        [-400.0, 20.0, 0.0] + 25.0 * rng.normal(size=(len(epoch), 3)),
+        index=epoch,
+        columns=columns,
+    )
+    b = pd.DataFrame(
+        4.0 * rng.normal(size=(len(epoch), 3)), index=epoch, columns=columns
+    )
+    v.iloc[20:23, 0] = np.nan
+    b.iloc[100, :] = np.nan
+    rho = pd.Series(rng.uniform(3, 6, size=len(epoch)), index=epoch)
+    return v, b, rho
+
+
+@pytest.mark.parametrize("window", ["10min", "1h", 25])
+def test_matches_batch(inputs, window):
+    v, b, rho = inputs
+    batch = turb.AlfvenicTurbulence(v, b, rho, "p1", window=window, min_periods=4)
+    stream = turb.StreamingAlfvenicTurbulence("p1", window=window, min_periods=4)
+    states = [
+        stream.update(vi, bi, ri, t)
+        for vi, bi, ri, t in zip(v.to_numpy(), b.to_numpy(), rho.to_numpy(), v.index)
+    ]
+    states = pd.DataFrame(states, columns=turb.AlfvenicTurbState._fields)
+
+    assert stream.state is not None
+    assert states.time.tolist() == v.index.tolist()
+    for name, chk in (
+        ("e_plus", batch.e_plus),
+        ("e_minus", batch.e_minus),
+        ("kinetic_energy", batch.kinetic_energy),
+        ("magnetic_energy", batch.magnetic_energy),
+        ("sigma_c", batch.sigma_c),
+        ("sigma_r", batch.sigma_r),
+        ("rE", batch.rE),
+        ("rA", batch.rA),
+    ):
+        np.testing.assert_allclose(
+            states.loc[:, name], chk, rtol=1e-9, atol=1e-12, err_msg=name
+        )
+
+
+def test_window(inputs):
+    v, b, rho = inputs
+    stream = turb.StreamingAlfvenicTurbulence("p1", window="10min", min_periods=1)
+    for vi, bi, ri, t in zip(v.to_numpy(), b.to_numpy(), rho.to_numpy(), v.index):
+        stream.update(vi, bi, ri, t)
+    t = v.index[-1]
+    assert len(stream) == ((v.index > t - pd.Timedelta("10min"))).sum()
+
+    with pytest.raises(ValueError):
+        stream.update(v.iloc[0], b.iloc[0], rho.iloc[0], v.index[0])
+
+    stream.reset()
+    assert len(stream) == 0
+    assert stream.state is None
+    state = stream.update(v.iloc[0], b.iloc[0], rho.iloc[0], v.index[0])
+    # A single measurement has no fluctuations.
+    assert state.e_plus == 0
+    assert np.isnan(state.sigma_c)
+
+    with pytest.raises(ValueError):
+        turb.StreamingAlfvenicTurbulence("p1", window=0)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Tests for :py:mod:`solarwindpy.core.structure_functions`."""
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from solarwindpy import alfvenic_turbulence
+from solarwindpy.core import structure_functions as sf
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(17)
+    v = rng.normal(size=(2000, 3)).cumsum(axis=0)
+    b = rng.normal(size=(2000, 3)).cumsum(axis=0)
+    v[40:45, 2] = np.nan
+    return v, b
+
+
+def test_matches_shift(inputs):
+    v, b = inputs
+    lags = [1, 3, 10, 50]
+    out = sf.structure_functions({"v": v, "b": b}, lags, chunksize=7)
+
+    assert out.index.tolist() == lags
+    assert out.columns.names == ["M", "order"]
+    assert out.columns.get_level_values("order").unique().tolist() == [
+        2,
+        3,
+        4,
+        5,
+        6,
+        "kurtosis",
+        "n",
+    ]
+
+    for name, x in (("v", v), ("b", b)):
+        x = pd.DataFrame(x)
+        for lag in lags:
+            mag = x.shift(-lag).subtract(x).pow(2).sum(axis=1, min_count=3)
+            mag = mag.pipe(np.sqrt).dropna()
+            for p in sf.ORDERS:
+                np.testing.assert_allclose(
+                    out.loc[lag, (name, p)], mag.pow(p).mean(), rtol=1e-10
+                )
+            assert out.loc[lag, (name, "n")] == len(mag)
+            np.testing.assert_allclose(
+                out.loc[lag, (name, "kurtosis")],
+                mag.pow(4).mean() / mag.pow(2).mean() ** 2,
+                rtol=1e-10,
+            )
+
+
+def test_gaussian_increments():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=(200000, 3)).cumsum(axis=0)
+    lags = [1, 2, 4, 8, 16]
+    out = sf.structure_functions({"x": x}, lags, orders=[1, 2, 4])
+
+    # Gaussian 3D increments have flatness 15 / 9.
+    np.testing.assert_allclose(out.loc[:, ("x", "kurtosis")], 5.0 / 3.0, rtol=0.05)
+    zeta = sf.scaling_exponents(out)
+    assert zeta.index.tolist() == [1, 2, 4]
+    np.testing.assert_allclose(zeta.loc[:, "x"], [0.5, 1.0, 2.0], rtol=0.05)
+
+
+def test_n_jobs(inputs):
+    v, b = inputs
+    lags = range(1, 40, 3)
+    one = sf.structure_functions({"v": v, "b": b}, lags)
+    two = sf.structure_functions({"v": v, "b": b}, lags, chunksize=64, n_jobs=2)
+    pdt.assert_frame_equal(one, two, rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        sf.structure_functions({"v": v}, [0, 1])
+    with pytest.raises(ValueError):
+        sf.structure_functions({"v": v}, [])
+
+
+def test_turbulence_structure_functions(inputs):
+    v, b = inputs
+    epoch = pd.date_range("2011-01-01", periods=len(v), freq="92s")
+    columns = pd.Index(["x", "y", "z"], name="C")
+    v = pd.DataFrame(v, index=epoch, columns=columns)
+    b = pd.DataFrame(b, index=epoch, columns=columns)
+    rho = pd.Series(2.0, index=epoch)
+    at = alfvenic_turbulence.AlfvenicTurbulence(v, b, rho, "p1")
+
+    out = at.structure_functions([1, 5], orders=[2, 4])
+    assert out.columns.get_level_values("M").unique().tolist() == [
+        "zp",
+        "zm",
+        "v",
+        "b",
+    ]
+    vm = at.measurements.loc[:, "v"].to_numpy()
+    bm = at.measurements.loc[:, "b"].to_numpy()
+    chk = sf.structure_functions({"zp": vm + bm}, [1, 5], orders=[2, 4])
+    pdt.assert_frame_equal(out.loc[:, ["zp"]], chk)
@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 """Tests for units and constants containers."""
 
+import dataclasses
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from solarwindpy.core import units_constants as uc
 
@@ -20,3 +24,24 @@ def test_constants_attributes():
     assert isinstance(c.kb, pd.Series)
     assert hasattr(c, "misc")
     assert isinstance(c.misc, pd.Series)
+
+
+def test_species_table():
+    c = uc.Constants()
+    table = uc.SPECIES
+    species = ("p1", "a", "e")
+    for name in ("m", "m_in_mp", "m_amu", "charges", "charge_states"):
+        expected = getattr(c, name).loc[list(species)].to_numpy()
+        np.testing.assert_array_equal(table.take(name, *species), expected)
+        assert not getattr(table, name).flags.writeable
+
+    np.testing.assert_allclose(
+        table.take("m_2kb", "p1"), 0.5 * c.m.loc["p1"] / c.kb.J, rtol=1e-15
+    )
+    np.testing.assert_allclose(table.take("sqrt_m2q", "a"), np.sqrt(c.m_in_mp.a / 2))
+    assert table.species[table.slot("a")] == "a"
+
+    with pytest.raises(KeyError):
+        table.slot("x")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        table.m = np.zeros(3)